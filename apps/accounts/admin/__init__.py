@@ -0,0 +1,3 @@
+from .account_admin import AccountAdmin
+
+__all__ = ["AccountAdmin"]
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from django.contrib import admin
+from django.urls import reverse
+from django.utils.html import format_html
+
+from apps.accounts.models.account import Account
+
+
+def _changelist_link(model: str, account_id: int, label: str) -> str:
+    url = reverse(f"admin:{model}_changelist") + f"?account__id__exact={account_id}"
+    return format_html('<a href="{}">{}</a>', url, label)
+
+
+@admin.register(Account)
+class AccountAdmin(admin.ModelAdmin):
+    """
+    Accounts are few; the links jump to the tenant's rows in the large tables
+    (filtered on an indexed account_id, newest first).
+    """
+    list_display = ("id", "name", "shopify_domain", "sender_email", "created_at", "leads", "contacts", "messages")
+    search_fields = ("^name", "=api_key", "=shopify_domain")
+    ordering = ("-id",)
+
+    @admin.display(description="Leads")
+    def leads(self, obj: Account) -> str:
+        return _changelist_link("leads_lead", obj.pk, "leads")
+
+    @admin.display(description="Contacts")
+    def contacts(self, obj: Account) -> str:
+        return _changelist_link("contacts_contact", obj.pk, "contacts")
+
+    @admin.display(description="Messages")
+    def messages(self, obj: Account) -> str:
+        return _changelist_link("messaging_message", obj.pk, "messages")
+
+
+__all__ = ["AccountAdmin"]
@@ -0,0 +1,4 @@
+from .account import Account
+from .sender_profile import SenderProfile
+
+__all__ = ["Account", "SenderProfile"]
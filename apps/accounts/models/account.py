@@ -10,6 +10,9 @@ class Account(models.Model):
     name = models.CharField(max_length=255)
     sender_email = models.EmailField(max_length=254)
 
+    # Shopify store that sends webhooks for this account (X-Shopify-Shop-Domain)
+    shopify_domain = models.CharField(max_length=255, unique=True, null=True, blank=True)
+
     # Bookkeeping
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -0,0 +1,118 @@
+"""
+Sender identity resolution with an in-process cache.
+
+All SenderProfiles of an account are loaded once (one query + the Account row)
+into an immutable SenderBook. Books are cached per process and invalidated by a
+per-account version that is bumped on SenderProfile/Account save or delete
+(see apps.accounts.signals). The version lives in Redis so every worker notices;
+it is checked at most every SENDER_CACHE_CHECK_SECONDS, so steady-state sends
+cost zero queries.
+
+Resolution order for a label:
+  label match → account default profile → Account.sender_email (named Account.name)
+"""
+
+from __future__ import annotations
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from apps.core.cache.versioned import VersionedCache
+
+
+class Sender(NamedTuple):
+    email: str
+    name: str
+    reply_to: Optional[str]
+    label: Optional[str]  # None when falling back to Account.sender_email
+
+
+class SenderBook(NamedTuple):
+    account_id: int
+    default: Sender
+    by_label: Mapping[str, Sender]  # read-only; keys are casefolded labels
+
+    def resolve(self, label: Optional[str] = None) -> Sender:
+        if label:
+            hit = self.by_label.get(label.casefold())
+            if hit is not None:
+                return hit
+        return self.default
+
+
+def _load_books(account_ids: Iterable[int]) -> Dict[int, SenderBook]:
+    from apps.accounts.models.account import Account
+    from apps.accounts.models.sender_profile import SenderProfile
+
+    ids = list(set(account_ids))
+    accounts = {pk: (email, name) for pk, email, name in
+                Account.objects.filter(pk__in=ids).values_list("pk", "sender_email", "name")}
+    rows = (
+        SenderProfile.objects.filter(account_id__in=ids)
+        .order_by("account_id", "pk")
+        .values_list("account_id", "label", "sender_email", "sender_name", "reply_to", "is_default")
+    )
+
+    labels: Dict[int, Dict[str, Sender]] = {i: {} for i in ids}
+    defaults: Dict[int, Sender] = {}
+    for account_id, label, email, name, reply_to, is_default in rows:
+        s = Sender(email, name, reply_to or None, label)
+        labels[account_id].setdefault(label.casefold(), s)
+        if is_default:
+            defaults[account_id] = s
+
+    books = {}
+    for i in ids:
+        if i not in accounts:
+            continue
+        fallback = defaults.get(i) or Sender(accounts[i][0], accounts[i][1], None, None)
+        books[i] = SenderBook(i, fallback, MappingProxyType(labels[i]))
+    return books
+
+
+_books: VersionedCache[int, SenderBook] = VersionedCache(
+    "senders", _load_books, "SENDER_CACHE_CHECK_SECONDS"
+)
+
+
+def bump_version(account_id: int) -> None:
+    """
+    Invalidate cached books for `account_id` in this process and (via Redis) in all others.
+    """
+    _books.bump(account_id)
+
+
+def get_books(account_ids: Iterable[int]) -> Dict[int, SenderBook]:
+    """
+    Books for several accounts; misses and stale entries are loaded in one batch.
+    Unknown accounts are omitted.
+    """
+    return _books.get_many(account_ids)
+
+
+def get_book(account_id: int) -> Optional[SenderBook]:
+    return get_books([account_id]).get(account_id)
+
+
+def resolve(account_id: int, label: Optional[str] = None) -> Optional[Sender]:
+    book = get_book(account_id)
+    return book.resolve(label) if book else None
+
+
+def resolve_many(requests: Iterable[Tuple[int, Optional[str]]]) -> List[Optional[Sender]]:
+    """
+    Resolve senders for a batch of (account_id, label) pairs, in order.
+    All accounts in the batch are served with at most one load query pair.
+    """
+    reqs = list(requests)
+    books = get_books(a for a, _ in reqs)
+    return [books[a].resolve(label) if a in books else None for a, label in reqs]
+
+
+def clear_cache() -> None:
+    _books.clear()
+
+
+__all__ = [
+    "Sender", "SenderBook", "bump_version", "get_books", "get_book",
+    "resolve", "resolve_many", "clear_cache",
+]
@@ -0,0 +1,23 @@
+from __future__ import annotations
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.accounts.models.account import Account
+from apps.accounts.models.sender_profile import SenderProfile
+from apps.accounts.repositories.senders_repo import bump_version
+
+
+@receiver([post_save, post_delete], sender=SenderProfile, dispatch_uid="senders_invalidate_profile")
+def _invalidate_on_profile_change(sender, instance: SenderProfile, **kwargs) -> None:
+    # After commit: a worker refilling its cache before then would re-read the old row
+    # under the new version and keep serving it.
+    transaction.on_commit(partial(bump_version, instance.account_id))
+
+
+@receiver([post_save, post_delete], sender=Account, dispatch_uid="senders_invalidate_account")
+def _invalidate_on_account_change(sender, instance: Account, **kwargs) -> None:
+    # Account.sender_email is the last-resort fallback
+    transaction.on_commit(partial(bump_version, instance.pk))
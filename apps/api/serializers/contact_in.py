@@ -2,18 +2,49 @@ from __future__ import annotations
 
 from rest_framework import serializers
 
+from apps.contacts.services.address_quality import check_email, check_phone
+
 
 class ContactIn(serializers.Serializer):
     """
     Minimal contact input:
       {
         "email": "user@example.com",   # required, valid email
-        "name": "User Name"            # optional, max 200 chars
+        "name": "User Name",           # optional, max 200 chars
+        "phone": "+1 415 555 2671"     # optional, normalized to '+<digits>'
       }
+    Addresses pass the offline quality gate (apps.contacts.services.address_quality):
+    disposable domains, role mailboxes and implausible phone numbers are rejected
+    before anything is written or sent. The email is stored as submitted; a known
+    typo domain only adds "email_suggestion" to the validated data. Validated data
+    has already passed the gate, so callers may pass checked=True to upsert_contact.
     """
     email = serializers.EmailField(required=True, allow_blank=False)
     name = serializers.CharField(required=False, allow_blank=True, max_length=200)
+    phone = serializers.CharField(required=False, allow_blank=True, max_length=32)
+
+    def validate_email(self, value: str) -> str:
+        verdict = check_email(value)
+        if not verdict.ok:
+            raise serializers.ValidationError(verdict.reason)
+        # Kept for validate(): the suggestion comes from this verdict, not a second check.
+        self._email_suggestion = verdict.suggestion
+        return verdict.email
+
+    def validate(self, attrs):
+        suggestion = getattr(self, "_email_suggestion", None)
+        if suggestion:
+            attrs["email_suggestion"] = suggestion
+        return attrs
 
     def validate_name(self, value: str) -> str:
         # Normalize whitespace; keep empty allowed
         return value.strip() if isinstance(value, str) else value
+
+    def validate_phone(self, value: str) -> str:
+        if not value or not value.strip():
+            return ""
+        verdict = check_phone(value)
+        if not verdict.ok:
+            raise serializers.ValidationError(verdict.reason)
+        return verdict.phone
@@ -1,6 +1,6 @@
 from typing import Any, Dict
 from rest_framework import serializers
-from .contact_in import ContactInSerializer
+from .contact_in import ContactIn as ContactInSerializer
 
 
 class LeadInSerializer(serializers.Serializer):
@@ -0,0 +1,81 @@
+from __future__ import annotations
+import asyncio
+import json
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from apps.api.views import activity_feed
+from apps.core.activity import stream
+from apps.core.activity.broadcaster import broadcaster
+
+ACCOUNT = 42
+
+
+@override_settings(ACTIVITY_STREAM_MAXLEN=5000, ACTIVITY_QUEUE_SIZE=50, ACTIVITY_HEARTBEAT_SECONDS=5)
+class ReplayThenLiveTests(SimpleTestCase):
+    def setUp(self):
+        for target, value in (
+            ("apps.core.activity.stream.get_redis", None),
+            ("apps.core.activity.broadcaster.redis_url", ""),
+        ):
+            patcher = mock.patch(target, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        stream._local.clear()
+        self.addCleanup(stream._local.clear)
+        broadcaster.loop = None
+
+    async def _next(self, gen):
+        frame = await asyncio.wait_for(gen.__anext__(), timeout=2)
+        if frame.startswith("id: "):
+            return json.loads(frame.split("data: ", 1)[1])
+        return frame
+
+    async def test_replays_more_than_one_page_before_going_live(self):
+        for i in range(1201):
+            stream.publish(ACCOUNT, stream.LEAD_CREATED, {"n": i})
+        first = stream._local[ACCOUNT][0].id
+        gen = activity_feed._events(ACCOUNT, first)
+        try:
+            self.assertTrue((await self._next(gen)).startswith("retry:"))
+            replayed = [(await self._next(gen))["n"] for _ in range(1200)]
+            self.assertEqual(replayed, list(range(1, 1201)))
+            stream.publish(ACCOUNT, stream.LEAD_CREATED, {"n": "live"})
+            self.assertEqual((await self._next(gen))["n"], "live")
+        finally:
+            await gen.aclose()
+
+    async def test_event_in_both_backlog_and_live_queue_is_sent_once(self):
+        stream.publish(ACCOUNT, stream.LEAD_CREATED, {"n": 0})
+        real_since = stream.since
+
+        def since_after_a_racing_publish(account_id, last_id, limit=500):
+            if since_after_a_racing_publish.first:
+                since_after_a_racing_publish.first = False
+                stream.publish(ACCOUNT, stream.LEAD_CREATED, {"n": "raced"})  # lands in the live queue too
+            return real_since(account_id, last_id, limit)
+
+        since_after_a_racing_publish.first = True
+        gen = activity_feed._events(ACCOUNT, stream._local[ACCOUNT][0].id)
+        try:
+            with mock.patch.object(stream, "since", side_effect=since_after_a_racing_publish):
+                await self._next(gen)  # retry
+                self.assertEqual((await self._next(gen))["n"], "raced")
+            await asyncio.sleep(0)  # let the threadsafe delivery reach the queue
+            stream.publish(ACCOUNT, stream.LEAD_CREATED, {"n": "next"})
+            self.assertEqual((await self._next(gen))["n"], "next")
+        finally:
+            await gen.aclose()
+
+    async def test_no_last_event_id_is_live_only(self):
+        stream.publish(ACCOUNT, stream.LEAD_CREATED, {"n": "old"})
+        gen = activity_feed._events(ACCOUNT, None)
+        try:
+            await self._next(gen)  # retry
+            pending = asyncio.ensure_future(self._next(gen))
+            await asyncio.sleep(0.05)  # subscribed, nothing replayed
+            stream.publish(ACCOUNT, stream.LEAD_CREATED, {"n": "new"})
+            self.assertEqual((await pending)["n"], "new")
+        finally:
+            await gen.aclose()
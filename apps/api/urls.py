@@ -1,17 +1,19 @@
 from django.urls import path
 
-# Always-available health view (DB-free)
-from apps.api.views.health import health
+from apps.core.http.lazy import lazy_view
 
+# Views are imported on first use (apps.core.http.lazy), so probes and
+# process boot don't pay for DRF, serializers or the activity broadcaster.
 urlpatterns = [
-    path("health/", health, name="health"),
+    # Always-available health view (DB-free)
+    path("health/", lazy_view("apps.api.views.health.health"), name="health"),
+    # Always-available readiness view (reads a cached, background-refreshed snapshot)
+    path("ready/", lazy_view("apps.api.views.ready.ready"), name="ready"),
+    # One-click unsubscribe (signed token; no auth header)
+    path("u/<str:token>/", lazy_view("apps.api.views.unsubscribe.unsubscribe"), name="unsubscribe"),
+    # Auth-first lead ingestion
+    path("ingest/", lazy_view("apps.api.views.ingest_lead.ingest"), name="ingest"),
+    # Live activity feed (SSE; ASGI)
+    path("activity/token/", lazy_view("apps.api.views.activity_feed.activity_token"), name="activity-token"),
+    path("activity/stream/", lazy_view("apps.api.views.activity_feed.activity_stream", is_async=True), name="activity-stream"),
 ]
-
-# Optional: ingest endpoint (auth-first). Added only if import succeeds.
-try:
-    from apps.api.views.ingest_lead import ingest  # type: ignore
-except Exception:
-    ingest = None
-
-if ingest:
-    urlpatterns.append(path("ingest/", ingest, name="ingest"))
@@ -0,0 +1,131 @@
+"""
+Live activity feed over server-sent events (ASGI).
+
+GET activity/token/   (X-Account-Key)  → short-lived signed token, since EventSource can't send headers
+GET activity/stream/  (X-Account-Key or ?token=)
+  - resumes after `Last-Event-ID` (sent automatically by EventSource on reconnect,
+    or `?last_event_id=` for the first connection) from the account's stream log,
+  - then relays live events from the per-process broadcaster.
+An open dashboard holds one idle connection (a comment heartbeat every
+ACTIVITY_HEARTBEAT_SECONDS) instead of polling. The stream only works under ASGI
+(scripts/run_asgi.sh): WSGI drains an async iterator to completion before sending
+a byte, so the endless stream would never reach the client and would pin the
+worker. Under WSGI the stream endpoint answers 501 instead.
+"""
+
+from __future__ import annotations
+import asyncio
+import json
+import re
+from typing import AsyncIterator, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import signing
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+
+from apps.accounts.services.api_key_auth import authenticate
+from apps.core.activity import stream
+from apps.core.activity.broadcaster import CLOSED, broadcaster
+from apps.core.http.responses import not_implemented, ok, service_unavailable, unauthorized
+
+_SALT = "reclaimr.activity"
+_EVENT_ID = re.compile(r"^\d+-\d+$")
+_REPLAY_PAGE = 500
+
+
+def _token_max_age() -> int:
+    return int(getattr(settings, "ACTIVITY_TOKEN_MAX_AGE", 3600))
+
+
+def make_token(account_id: int) -> str:
+    return signing.dumps({"a": account_id}, salt=_SALT)
+
+
+def read_token(token: str) -> Optional[int]:
+    try:
+        return int(signing.loads(token, salt=_SALT, max_age=_token_max_age())["a"])
+    except (signing.BadSignature, KeyError, TypeError, ValueError):
+        return None
+
+
+@require_GET
+def activity_token(request):
+    """
+    Issue a stream token for the authenticated account.
+    """
+    auth = authenticate(request)
+    if not auth.ok:
+        if auth.status == 503:
+            return service_unavailable("db_unavailable")
+        return unauthorized(auth.reason)
+    return ok({"token": make_token(auth.account.pk), "expires_in": _token_max_age()})
+
+
+def _frame(event: stream.Event) -> str:
+    data = json.dumps({"id": event.id, "kind": event.kind, **event.data}, separators=(",", ":"))
+    return f"id: {event.id}\nevent: {event.kind}\ndata: {data}\n\n"
+
+
+async def _events(account_id: int, last_id: Optional[str]) -> AsyncIterator[str]:
+    heartbeat = float(getattr(settings, "ACTIVITY_HEARTBEAT_SECONDS", 15))
+    yield f"retry: {int(getattr(settings, 'ACTIVITY_RETRY_MS', 3000))}\n\n"
+    # Subscribe before reading the backlog so nothing published in between is lost;
+    # live events already covered by the backlog are skipped by id.
+    async with broadcaster.subscribe(account_id) as queue:
+        cursor = stream.id_tuple(last_id) if last_id else (0, 0)
+        # Page through the whole backlog; a short page means we've reached the end of the log.
+        after = last_id
+        while after:
+            page = await sync_to_async(stream.since, thread_sensitive=False)(account_id, after, _REPLAY_PAGE)
+            for event in page:
+                cursor = stream.id_tuple(event.id)
+                yield _frame(event)
+            after = page[-1].id if len(page) >= _REPLAY_PAGE else None
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if item is CLOSED:
+                return  # fell behind; the client reconnects with Last-Event-ID
+            if stream.id_tuple(item.id) <= cursor:
+                continue
+            cursor = stream.id_tuple(item.id)
+            yield _frame(item)
+
+
+@require_GET
+async def activity_stream(request):
+    """
+    Per-account activity as text/event-stream.
+    """
+    if not isinstance(request, ASGIRequest):
+        return not_implemented("activity_stream_requires_asgi")
+    token = request.GET.get("token")
+    if token:
+        account_id = read_token(token)
+        if account_id is None:
+            return unauthorized("invalid_token")
+    else:
+        auth = await sync_to_async(authenticate)(request)
+        if not auth.ok:
+            if auth.status == 503:
+                return service_unavailable("db_unavailable")
+            return unauthorized(auth.reason)
+        account_id = auth.account.pk
+
+    last_id = (request.headers.get("Last-Event-ID") or request.GET.get("last_event_id") or "").strip()
+    if last_id and not _EVENT_ID.match(last_id):
+        last_id = ""
+
+    resp = StreamingHttpResponse(_events(account_id, last_id or None), content_type="text/event-stream")
+    resp["Cache-Control"] = "no-cache"
+    resp["X-Accel-Buffering"] = "no"  # nginx: don't buffer the stream
+    return resp
+
+
+__all__ = ["activity_token", "activity_stream", "make_token", "read_token"]
@@ -6,6 +6,9 @@ from rest_framework import status
 
 from apps.accounts.services.api_key_auth import authenticate
 from apps.api.serializers.lead_in import LeadInSerializer
+from apps.core.constants.headers import IDEMPOTENCY_KEY, IDEMPOTENT_REPLAYED
+from apps.core.idempotency import store as idempotency
+from apps.core.idempotency.webhooks import meta_key
 
 
 @api_view(["POST"])
@@ -15,8 +18,11 @@ def ingest(request):
 
     Flow:
       1) Authenticate via X-Account-Key (missing/invalid => 401; DB unavailable => 503).
-      2) Validate payload via LeadInSerializer (400 on invalid).
-      3) If DB available: upsert Contact, create Lead => 201.
+      2) Optional Idempotency-Key (scoped per account): a stored 2xx is replayed
+         without touching Contact/Lead; a concurrent duplicate gets 409; the same
+         key with a different body gets 422.
+      3) Validate payload via LeadInSerializer (400 on invalid).
+      4) If DB available: upsert Contact, create Lead => 201.
          If DB unavailable: return 202 Accepted (validated, but not persisted).
     """
     # 1) Auth-first
@@ -31,7 +37,43 @@ def ingest(request):
 
     account = auth.account
 
-    # 2) Validate inbound payload
+    # 2) Idempotency (replays never reach the serializer or the DB writes)
+    idem_key = (request.META.get(meta_key(IDEMPOTENCY_KEY)) or "").strip()
+    if len(idem_key) > idempotency.MAX_KEY_LENGTH:
+        return Response({"detail": "idempotency_key_too_long"}, status=status.HTTP_400_BAD_REQUEST)
+    if not idem_key:
+        return _ingest(request, account)
+
+    scope = f"ingest:{account.pk}"
+    fp = idempotency.fingerprint(request.body)
+    claim = idempotency.claim(scope, idem_key, fp)
+    if claim.state == idempotency.MISMATCH:
+        return Response({"detail": "idempotency_key_reused"}, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+    if claim.state == idempotency.DONE:
+        return Response(claim.body, status=claim.status_code, headers={IDEMPOTENT_REPLAYED: "true"})
+    if claim.state == idempotency.IN_PROGRESS:
+        return Response({"detail": "idempotency_key_in_use"}, status=status.HTTP_409_CONFLICT)
+    if claim.state == idempotency.UNAVAILABLE:
+        return _ingest(request, account)
+
+    try:
+        resp = _ingest(request, account)
+    except Exception:
+        idempotency.release(scope, idem_key)
+        raise
+    # 202 (not persisted) is released so the retry can actually persist.
+    if resp.status_code == status.HTTP_201_CREATED:
+        idempotency.complete(scope, idem_key, resp.status_code, resp.data, fp)
+    else:
+        idempotency.release(scope, idem_key)
+    return resp
+
+
+def _ingest(request, account) -> Response:
+    """
+    Validate and persist one lead for an authenticated account (steps 3–4 above).
+    """
+    # 3) Validate inbound payload
     serializer = LeadInSerializer(data=request.data)
     if not serializer.is_valid():
         # NOTE: Even if body is invalid, auth-first must have already passed above.
@@ -42,32 +84,23 @@ def ingest(request):
     contact_in = data["contact"]
     metadata = data.get("metadata") or {}
 
-    # 3) Persist when DB is available; otherwise degrade gracefully
+    # 4) Persist when DB is available; otherwise degrade gracefully
     try:
-        from apps.contacts.models.contact import Contact
-        from apps.leads.models.lead import Lead
+        from apps.contacts.services.upsert_contact import upsert_contact
+        from apps.leads.services.create_lead import create_lead
 
-        # Upsert contact (natural key on email)
-        defaults = {
-            "name": contact_in.get("name", ""),
-            "phone": contact_in.get("phone", ""),
-            "account": account,
-        }
-        contact, _ = Contact.objects.update_or_create(
-            email=contact_in["email"], defaults=defaults
+        # Upsert contact (natural key on email; blank name/phone keep stored values).
+        # ContactIn already ran the address gate, so don't run it again.
+        contact = upsert_contact(
+            account, contact_in["email"], name=contact_in.get("name"), phone=contact_in.get("phone"),
+            checked=True,
         )
 
-        lead = Lead.objects.create(
-            account=account,
-            contact=contact,
-            source=source,
-            status="new",
-            metadata=metadata,
-        )
-        return Response(
-            {"id": lead.pk, "status": "created", "source": source},
-            status=status.HTTP_201_CREATED,
-        )
+        lead = create_lead(account, contact, source, metadata)
+        body = {"id": lead.pk, "status": "created", "source": source}
+        if contact_in.get("email_suggestion"):
+            body["suggestions"] = {"email": contact_in["email_suggestion"]}
+        return Response(body, status=status.HTTP_201_CREATED)
 
     except (OperationalError, ProgrammingError, ImproperlyConfigured):
         # Database not migrated/ready locally; accept the payload but signal deferred persistence.
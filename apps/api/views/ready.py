@@ -0,0 +1,26 @@
+from __future__ import annotations
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from apps.core.load_shed import backlog
+from apps.core.load_shed.limiter import get_limiter
+from apps.core.readiness.refresher import snapshot
+
+
+@require_GET
+def ready(request):
+    """
+    Readiness endpoint for the load balancer.
+    Reads only the cached result of the background refresher (DB, Redis broker,
+    migrations) — probe traffic never reaches Postgres or Redis.
+    200 when every dependency is healthy, 503 otherwise (including warm-up/stale).
+    "load" reports this process's shedding state; it never affects readiness.
+    """
+    state = snapshot()
+    state["load"] = {**get_limiter().stats(), "backlog": backlog.last_depth()}
+    status = 200 if state["ready"] else 503
+    resp = JsonResponse(state, status=status)
+    resp["Cache-Control"] = "no-store"
+    return resp
+
+__all__ = ["ready"]
@@ -0,0 +1,33 @@
+from __future__ import annotations
+from django.core.exceptions import ImproperlyConfigured
+from django.db import OperationalError, ProgrammingError
+from django.http import HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+
+from apps.contacts.services.unsubscribe_contact import read_token, unsubscribe_token
+
+_CONFIRM = """<!doctype html><meta charset="utf-8"><title>Unsubscribe</title>
+<form method="post"><p>Stop receiving these messages?</p><button type="submit">Unsubscribe</button></form>"""
+_DONE = """<!doctype html><meta charset="utf-8"><title>Unsubscribed</title><p>You have been unsubscribed.</p>"""
+
+
+@csrf_exempt
+@require_http_methods(["GET", "POST"])
+def unsubscribe(request, token: str):
+    """
+    One-click unsubscribe (RFC 8058).
+    - POST applies it (mail clients send 'List-Unsubscribe=One-Click').
+    - GET only shows a confirmation form, so link scanners can't unsubscribe people.
+    """
+    if read_token(token) is None:
+        return HttpResponse("invalid link", status=404, content_type="text/plain")
+    if request.method == "GET":
+        return HttpResponse(_CONFIRM)
+    try:
+        unsubscribe_token(token)
+    except (OperationalError, ProgrammingError, ImproperlyConfigured):
+        return HttpResponse("temporarily unavailable", status=503, content_type="text/plain")
+    return HttpResponse(_DONE)
+
+__all__ = ["unsubscribe"]
@@ -0,0 +1,3 @@
+from .contact_admin import ContactAdmin
+
+__all__ = ["ContactAdmin"]
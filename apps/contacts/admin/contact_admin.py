@@ -0,0 +1,34 @@
+from __future__ import annotations
+from typing import Optional
+
+from django.contrib import admin
+from django.db.models import Q
+
+from apps.contacts.models.contact import Contact
+from apps.contacts.tasks.bulk_suppress import bulk_suppress
+from apps.core.admin.actions import run_in_background
+from apps.core.admin.base import LargeTableAdmin
+from apps.core.admin.search import is_id, is_phone_like, phone_prefix, prefix_q
+
+
+@admin.register(Contact)
+class ContactAdmin(LargeTableAdmin):
+    list_display = ("id", "email", "name", "phone", "account", "created_at")
+    list_select_related = ("account",)
+    raw_id_fields = ("account",)
+    search_help_text = "Contact id, email prefix or phone prefix."
+    actions = ["suppress_contacts"]
+
+    def search_q(self, term: str) -> Optional[Q]:
+        if is_id(term):
+            return Q(pk=int(term)) | Q(phone__startswith=term)
+        if is_phone_like(term):
+            return Q(phone__startswith=phone_prefix(term))
+        return prefix_q("email", term)
+
+    @admin.action(description="Suppress email/SMS for selected contacts (background)")
+    def suppress_contacts(self, request, queryset):
+        run_in_background(self, request, queryset, "contacts.bulk_suppress", bulk_suppress, "admin", label="contacts")
+
+
+__all__ = ["ContactAdmin"]
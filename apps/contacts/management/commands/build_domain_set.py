@@ -0,0 +1,23 @@
+from __future__ import annotations
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.contacts.services import address_quality
+from apps.core.hashset import mapped_set
+
+
+class Command(BaseCommand):
+    help = "Compile the disposable-domain list into the memory-mapped set used by the ingest quality gate."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--source", help="Domain list, one per line (default: CONTACT_DISPOSABLE_DOMAINS_FILE).")
+        parser.add_argument("--output", help="Compiled file (default: the list's path with a .bin suffix).")
+
+    def handle(self, *args, source=None, output=None, **opts):
+        source = source or address_quality.domains_file()
+        output = output or address_quality.index_file(source)
+        if not os.path.exists(source):
+            raise CommandError(f"no such file: {source}")
+        count = mapped_set.write(output, address_quality.read_domains(source))
+        self.stdout.write(f"{count} domains -> {output} ({os.path.getsize(output)} bytes)")
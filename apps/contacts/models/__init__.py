@@ -0,0 +1,4 @@
+from .contact import Contact
+from .suppression import Suppression
+
+__all__ = ["Contact", "Suppression"]
@@ -28,6 +28,11 @@ class Contact(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["email"]),
+            # Admin: a tenant's contacts, newest first
+            models.Index(fields=["account", "-id"], name="contact_account_recent_idx"),
+            # Admin prefix search (LIKE 'x%'); opclasses apply on Postgres only
+            models.Index(fields=["email"], name="contact_email_prefix_idx", opclasses=["varchar_pattern_ops"]),
+            models.Index(fields=["phone"], name="contact_phone_prefix_idx", opclasses=["varchar_pattern_ops"]),
         ]
 
     def __str__(self) -> str:
@@ -0,0 +1,38 @@
+from __future__ import annotations
+from django.db import models
+from apps.core.constants.channels import EMAIL, SMS
+
+CHANNEL_CHOICES = [
+    (EMAIL, "Email"),
+    (SMS, "SMS"),
+]
+
+
+class Suppression(models.Model):
+    """
+    A per-account do-not-contact entry for one address on one channel.
+    `address` is normalized (lowercased email, or '+' and digits for phones)
+    so lookups are exact matches on the unique index.
+    """
+    account = models.ForeignKey("accounts.Account", on_delete=models.CASCADE, related_name="suppressions")
+    channel = models.CharField(max_length=8, choices=CHANNEL_CHOICES)
+    address = models.CharField(max_length=254)
+
+    reason = models.CharField(max_length=32, default="unsubscribe")  # "unsubscribe" | "bounce" | "complaint" | "manual"
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = "contacts"
+        constraints = [
+            models.UniqueConstraint(fields=["account", "channel", "address"], name="unique_suppression_per_account"),
+        ]
+        indexes = [
+            # Incremental Bloom rebuilds scan by id per (account, channel)
+            models.Index(fields=["account", "channel", "id"]),
+        ]
+        verbose_name = "Suppression"
+        verbose_name_plural = "Suppressions"
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"[{self.channel}] {self.address} ({self.reason})"
@@ -0,0 +1,62 @@
+"""
+DB access for Suppression rows (source of truth behind the Redis/Bloom layers).
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from typing import Iterable, List, Set, Tuple
+
+from apps.contacts.models.suppression import Suppression
+
+
+def insert_many(account_id: int, channel: str, addresses: Iterable[str], reason: str) -> None:
+    rows = [Suppression(account_id=account_id, channel=channel, address=a, reason=reason) for a in set(addresses)]
+    Suppression.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+def delete_many(account_id: int, channel: str, addresses: Iterable[str]) -> int:
+    deleted, _ = Suppression.objects.filter(account_id=account_id, channel=channel, address__in=list(addresses)).delete()
+    return deleted
+
+
+def suppressed_among(account_id: int, channel: str, addresses: Iterable[str]) -> Set[str]:
+    """
+    Which of `addresses` are suppressed (one indexed IN query).
+    """
+    return set(
+        Suppression.objects.filter(account_id=account_id, channel=channel, address__in=list(addresses))
+        .values_list("address", flat=True)
+    )
+
+
+def since(account_id: int, channel: str, after_id: int, limit: int = 50_000) -> List[Tuple[int, str]]:
+    """
+    Rows added after `after_id`, oldest first — feeds incremental Bloom rebuilds.
+    """
+    qs = (
+        Suppression.objects.filter(account_id=account_id, channel=channel, id__gt=after_id)
+        .order_by("id")
+        .values_list("id", "address")
+    )
+    return list(qs[:limit])
+
+
+def last_id_before(account_id: int, channel: str, before: datetime) -> int:
+    """
+    Highest id among rows created before `before` (0 if none). Walks the (account, channel, id)
+    index backwards, so it only touches the recent rows.
+    """
+    row = (
+        Suppression.objects.filter(account_id=account_id, channel=channel, created_at__lt=before)
+        .order_by("-id")
+        .values_list("id", flat=True)
+        .first()
+    )
+    return row or 0
+
+
+def count(account_id: int, channel: str) -> int:
+    return Suppression.objects.filter(account_id=account_id, channel=channel).count()
+
+
+__all__ = ["insert_many", "delete_many", "suppressed_among", "since", "last_id_before", "count"]
@@ -0,0 +1,219 @@
+"""
+Offline quality gate for inbound contact addresses (no DNS, no network).
+
+Email:
+  1) known typo domains ("gmial.com", "gmail.co" …, an explicit list) produce a
+     suggested address; the address itself is kept as submitted, because fuzzy
+     matching also "fixes" real domains (pocketmail.com, qmail.com, email.com);
+  2) disposable domains (and their subdomains) are rejected, looked up in a
+     memory-mapped hash set compiled from CONTACT_DISPOSABLE_DOMAINS_FILE
+     (`manage.py build_domain_set`; built in memory when the compiled file is
+     missing or older than the list);
+  3) role mailboxes (info@, support@, noreply@ …) are rejected when
+     CONTACT_REJECT_ROLE_ADDRESSES is on.
+Phone: normalized to '+<digits>' (the suppression store's canonical form) and
+checked against calling codes, per-country national lengths and NANP numbering rules.
+
+Each check is a handful of dict/bisect lookups — microseconds per contact.
+"""
+
+from __future__ import annotations
+import logging
+import os
+import re
+import threading
+from typing import Dict, FrozenSet, Iterable, NamedTuple, Optional, Set
+
+from django.conf import settings
+
+from apps.core.hashset.mapped_set import MappedHashSet
+
+log = logging.getLogger(__name__)
+
+DISPOSABLE = "disposable_domain"
+ROLE = "role_address"
+INVALID_EMAIL = "invalid_email"
+INVALID_PHONE = "invalid_phone"
+UNKNOWN_COUNTRY = "unknown_country_code"
+IMPLAUSIBLE_PHONE = "implausible_phone"
+
+ROLE_LOCAL_PARTS: FrozenSet[str] = frozenset({
+    "abuse", "admin", "administrator", "billing", "contact", "donotreply", "do-not-reply", "help",
+    "hostmaster", "info", "mailer-daemon", "marketing", "no-reply", "noreply", "office", "postmaster",
+    "privacy", "root", "sales", "security", "support", "team", "webmaster",
+})
+
+# Misspellings of high-volume mailbox domains that are not themselves mailbox providers.
+KNOWN_TYPOS: Dict[str, str] = {
+    "gmial.com": "gmail.com", "gmai.com": "gmail.com", "gmal.com": "gmail.com", "gamil.com": "gmail.com",
+    "gmaill.com": "gmail.com", "gnail.com": "gmail.com", "gmaik.com": "gmail.com", "gmsil.com": "gmail.com",
+    "gmail.co": "gmail.com", "gmail.con": "gmail.com", "gmail.cm": "gmail.com", "gmail.om": "gmail.com",
+    "gmail.comm": "gmail.com", "googlmail.com": "googlemail.com",
+    "yaho.com": "yahoo.com", "yahooo.com": "yahoo.com", "yhoo.com": "yahoo.com", "yaoo.com": "yahoo.com",
+    "yahoo.con": "yahoo.com", "yahoo.cm": "yahoo.com",
+    "hotmial.com": "hotmail.com", "hotmal.com": "hotmail.com", "hotmai.com": "hotmail.com",
+    "hotamil.com": "hotmail.com", "hotmil.com": "hotmail.com", "hotmaill.com": "hotmail.com",
+    "hotmail.con": "hotmail.com",
+    "outlok.com": "outlook.com", "outloo.com": "outlook.com", "outllok.com": "outlook.com",
+    "otlook.com": "outlook.com", "outlook.con": "outlook.com",
+    "iclod.com": "icloud.com", "icoud.com": "icloud.com", "icluod.com": "icloud.com", "icloud.con": "icloud.com",
+    "aol.con": "aol.com",
+}
+
+_NON_DIGITS = re.compile(r"\D+")
+
+
+class EmailVerdict(NamedTuple):
+    email: str                 # as submitted (trimmed, domain lowercased)
+    ok: bool
+    reason: str                # "" when ok
+    suggestion: Optional[str]  # "did you mean" address when the domain is a known typo
+
+
+class PhoneVerdict(NamedTuple):
+    phone: str  # '+<digits>' when ok
+    ok: bool
+    reason: str
+
+
+# --- disposable domain set ---
+_lock = threading.Lock()
+_disposable: Optional[MappedHashSet] = None
+
+
+def domains_file() -> str:
+    return str(getattr(settings, "CONTACT_DISPOSABLE_DOMAINS_FILE", "")
+               or os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "disposable_domains.txt"))
+
+
+def index_file(source: Optional[str] = None) -> str:
+    return os.path.splitext(source or domains_file())[0] + ".bin"
+
+
+def read_domains(path: str) -> Iterable[str]:
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip().lower()
+            if line and not line.startswith("#"):
+                yield line.rstrip(".")
+
+
+def disposable_domains() -> MappedHashSet:
+    """
+    The process-wide disposable set: the compiled file when it's current, else built from the list.
+    """
+    global _disposable
+    if _disposable is not None:
+        return _disposable
+    with _lock:
+        if _disposable is None:
+            source, index = domains_file(), index_file()
+            loaded = None
+            try:
+                if os.path.getmtime(index) >= os.path.getmtime(source):
+                    loaded = MappedHashSet.open(index)
+            except (OSError, ValueError):
+                pass
+            if loaded is None:
+                try:
+                    loaded = MappedHashSet.from_items(read_domains(source))
+                except OSError as exc:
+                    log.warning("disposable domain list unavailable (%s); gate skips that check", exc)
+                    loaded = MappedHashSet.from_items(())
+            _disposable = loaded
+    return _disposable
+
+
+def is_disposable(domain: str) -> bool:
+    domains = disposable_domains()
+    labels = domain.split(".")
+    return any(".".join(labels[i:]) in domains for i in range(len(labels) - 1))
+
+
+# --- email ---
+def check_email(email: str) -> EmailVerdict:
+    email = (email or "").strip()
+    local, at, domain = email.rpartition("@")
+    if not at or not local or not domain:
+        return EmailVerdict(email, False, INVALID_EMAIL, None)
+    domain = domain.lower().rstrip(".")
+    email = f"{local}@{domain}"
+    suggestion = None
+    if getattr(settings, "CONTACT_SUGGEST_EMAIL_TYPOS", True) and domain in KNOWN_TYPOS:
+        suggestion = f"{local}@{KNOWN_TYPOS[domain]}"
+    if is_disposable(domain):
+        return EmailVerdict(email, False, DISPOSABLE, None)
+    if getattr(settings, "CONTACT_REJECT_ROLE_ADDRESSES", True) and local.lower().split("+", 1)[0] in ROLE_LOCAL_PARTS:
+        return EmailVerdict(email, False, ROLE, None)
+    return EmailVerdict(email, True, "", suggestion)
+
+
+# --- phone ---
+def _codes(spec: str) -> FrozenSet[str]:
+    out: Set[str] = set()
+    for part in spec.split():
+        lo, _, hi = part.partition("-")
+        out.update(str(n) for n in range(int(lo), int(hi or lo) + 1))
+    return frozenset(out)
+
+
+# ITU-T E.164 country calling codes (assigned, as ranges)
+CALLING_CODES = _codes(
+    "1 7 20 27 30-34 36 39-41 43-49 51-58 60-66 81 82 84 86 90-95 98 "
+    "211-213 216 218 220-258 260-269 290 291 297-299 350-359 370-378 380-383 385-387 389 "
+    "420 421 423 500-509 590-599 670 672-683 685-692 800 808 850 852 853 855 856 870 878 "
+    "880-883 886 888 960-968 970-977 979 992-996 998"
+)
+
+# National significant number lengths for common markets; others get (4, 14).
+NATIONAL_LENGTHS: Dict[str, tuple] = {
+    "1": (10, 10), "7": (10, 10), "27": (9, 9), "31": (9, 9), "33": (9, 9), "34": (9, 9),
+    "39": (6, 11), "44": (9, 10), "49": (6, 13), "52": (10, 10), "55": (10, 11), "61": (9, 9),
+    "64": (8, 10), "65": (8, 8), "81": (9, 10), "86": (10, 11), "91": (10, 10), "353": (7, 9),
+}
+
+
+def _nanp_ok(national: str) -> bool:
+    area, exchange, line = national[:3], national[3:6], national[6:]
+    if area[0] in "01" or area[1:] == "11" or exchange[0] in "01" or exchange[1:] == "11":
+        return False
+    return not (exchange == "555" and line.startswith("01"))  # 555-01XX is reserved for fiction
+
+
+def check_phone(raw: str, default_country_code: Optional[str] = None) -> PhoneVerdict:
+    raw = (raw or "").strip()
+    digits = _NON_DIGITS.sub("", raw)
+    if not digits:
+        return PhoneVerdict("", False, INVALID_PHONE)
+    if raw.startswith("+"):
+        pass
+    elif digits.startswith("00"):
+        digits = digits[2:]
+    else:
+        cc = str(default_country_code or getattr(settings, "CONTACT_DEFAULT_COUNTRY_CODE", "1"))
+        if cc == "1" and len(digits) == 11 and digits[0] == "1":
+            pass
+        else:
+            digits = cc + (digits[1:] if cc != "1" and digits.startswith("0") else digits)
+
+    if not 8 <= len(digits) <= 15:
+        return PhoneVerdict("", False, INVALID_PHONE)
+    cc = next((digits[:n] for n in (1, 2, 3) if digits[:n] in CALLING_CODES), None)
+    if cc is None:
+        return PhoneVerdict("", False, UNKNOWN_COUNTRY)
+    national = digits[len(cc):]
+    lo, hi = NATIONAL_LENGTHS.get(cc, (4, 14))
+    if not lo <= len(national) <= hi or len(set(national)) == 1:
+        return PhoneVerdict("", False, IMPLAUSIBLE_PHONE)
+    if cc == "1" and not _nanp_ok(national):
+        return PhoneVerdict("", False, IMPLAUSIBLE_PHONE)
+    return PhoneVerdict(f"+{digits}", True, "")
+
+
+__all__ = [
+    "DISPOSABLE", "ROLE", "INVALID_EMAIL", "INVALID_PHONE", "UNKNOWN_COUNTRY", "IMPLAUSIBLE_PHONE",
+    "ROLE_LOCAL_PARTS", "KNOWN_TYPOS", "CALLING_CODES",
+    "EmailVerdict", "PhoneVerdict",
+    "domains_file", "index_file", "read_domains", "disposable_domains", "is_disposable",
+    "check_email", "check_phone",
+]
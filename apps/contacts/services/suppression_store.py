@@ -0,0 +1,248 @@
+"""
+Suppression store: "may we message this address/number?" for whole batches.
+
+Layers (cheapest first):
+  1) In-worker Bloom filter per (account, channel). A miss means "definitely not
+     suppressed" and costs no I/O — the common case for every send.
+  2) Per-account Redis set (SMISMEMBER) confirms Bloom hits in one round trip.
+  3) The indexed Suppression table is the source of truth and the fallback.
+
+Freshness: suppress() bumps a per-account version in Redis once its rows commit.
+Workers compare it at most every SUPPRESSION_SYNC_SECONDS and pull rows above the
+id watermark they had SUPPRESSION_SYNC_OVERLAP_SECONDS ago into their Bloom filter.
+Ids are allocated at INSERT but become visible at COMMIT, so a slow concurrent
+transaction can land below the current watermark; re-scanning that trailing window
+catches it (re-adding known rows to a Bloom filter is harmless). The hourly rebuild
+covers anything slower. Removals (resubscribe) are exact immediately because Bloom
+hits are always confirmed.
+"""
+
+from __future__ import annotations
+import re
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import OperationalError, ProgrammingError, transaction
+from django.utils import timezone
+
+from apps.contacts.repositories import suppressions_repo
+from apps.core.bloom.bloom_filter import BloomFilter
+from apps.core.cache.redis_client import get_redis
+from apps.core.constants.channels import SMS
+
+_PREFIX = "reclaimr:supp:"
+_NON_DIGITS = re.compile(r"\D+")
+
+# Process-local Bloom state: (account_id, channel) -> _Entry
+_lock = threading.Lock()
+_entries: Dict[Tuple[int, str], "_Entry"] = {}
+
+
+class _Entry:
+    __slots__ = ("bloom", "watermark", "marks", "version", "synced_at", "built_at")
+
+    def __init__(self, bloom: BloomFilter):
+        self.bloom = bloom
+        self.watermark = 0
+        self.marks: deque = deque()  # (monotonic time, watermark) after each delta
+        self.version: Optional[bytes] = None
+        self.synced_at = 0.0
+        self.built_at = time.monotonic()
+
+
+def normalize(channel: str, address: str) -> str:
+    """
+    Canonical form used everywhere: emails lowercased/trimmed; phones as '+<digits>'.
+    """
+    address = (address or "").strip()
+    if channel == SMS:
+        digits = _NON_DIGITS.sub("", address)
+        return f"+{digits}" if digits else ""
+    return address.lower()
+
+
+def _set_key(account_id: int, channel: str) -> str:
+    return f"{_PREFIX}{account_id}:{channel}"
+
+
+def _ver_key(account_id: int) -> str:
+    return f"{_PREFIX}ver:{account_id}"
+
+
+def _sync_seconds() -> float:
+    return float(getattr(settings, "SUPPRESSION_SYNC_SECONDS", 2.0))
+
+
+def _overlap_seconds() -> float:
+    return float(getattr(settings, "SUPPRESSION_SYNC_OVERLAP_SECONDS", 60.0))
+
+
+# --- writes ---
+def suppress(account_id: int, channel: str, addresses: Iterable[str], reason: str = "unsubscribe") -> List[str]:
+    """
+    Suppress addresses for an account/channel (idempotent). Returns normalized addresses.
+    """
+    norm = sorted({a for a in (normalize(channel, x) for x in addresses) if a})
+    if not norm:
+        return []
+    suppressions_repo.insert_many(account_id, channel, norm, reason)
+
+    def _publish() -> None:
+        client = get_redis()
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.sadd(_set_key(account_id, channel), *norm)
+            pipe.incr(_ver_key(account_id))
+            pipe.execute()
+        except Exception:
+            pass  # DB row exists; workers still converge on their next delta sync
+
+    # Bump only once the rows are visible, or workers could sync, miss them, and
+    # then see no further version change.
+    transaction.on_commit(_publish)
+
+    # This process sees it immediately.
+    entry = _entries.get((account_id, channel))
+    if entry is not None:
+        entry.bloom.update(norm)
+    return norm
+
+
+def unsuppress(account_id: int, channel: str, addresses: Iterable[str]) -> int:
+    norm = [a for a in (normalize(channel, x) for x in addresses) if a]
+    if not norm:
+        return 0
+    deleted = suppressions_repo.delete_many(account_id, channel, norm)
+    client = get_redis()
+    if client is not None:
+        try:
+            client.srem(_set_key(account_id, channel), *norm)
+        except Exception:
+            pass
+    return deleted
+
+
+# --- in-worker Bloom maintenance ---
+def _build(account_id: int, channel: str) -> _Entry:
+    n = suppressions_repo.count(account_id, channel)
+    fp = float(getattr(settings, "SUPPRESSION_BLOOM_FP", 0.001))
+    entry = _Entry(BloomFilter(capacity=max(1_000, n * 2), fp_rate=fp))
+    # No marks yet: treat rows created in the last window as possibly incomplete.
+    overlap = _overlap_seconds()
+    floor = suppressions_repo.last_id_before(account_id, channel, timezone.now() - timedelta(seconds=overlap))
+    entry.marks.append((time.monotonic() - overlap, floor))
+    _apply_delta(entry, account_id, channel)
+    return entry
+
+
+def _apply_delta(entry: _Entry, account_id: int, channel: str) -> None:
+    now = time.monotonic()
+    overlap = _overlap_seconds()
+    # Keep the newest mark that is at least `overlap` old; everything after it is re-scanned.
+    while len(entry.marks) > 1 and now - entry.marks[1][0] >= overlap:
+        entry.marks.popleft()
+    after = entry.marks[0][1] if entry.marks else entry.watermark
+    while True:
+        rows = suppressions_repo.since(account_id, channel, after)
+        if not rows:
+            break
+        entry.bloom.update(addr for _, addr in rows)
+        after = rows[-1][0]
+        entry.watermark = max(entry.watermark, after)
+    entry.marks.append((now, entry.watermark))
+
+
+def _entry(account_id: int, channel: str) -> _Entry:
+    key = (account_id, channel)
+    entry = _entries.get(key)
+    now = time.monotonic()
+    rebuild_after = float(getattr(settings, "SUPPRESSION_BLOOM_REBUILD_SECONDS", 3600))
+
+    if entry is None or entry.bloom.saturated or now - entry.built_at > rebuild_after:
+        fresh = _build(account_id, channel)
+        fresh.synced_at = now
+        with _lock:
+            _entries[key] = fresh
+        return fresh
+
+    if now - entry.synced_at >= _sync_seconds():
+        entry.synced_at = now
+        version = None
+        client = get_redis()
+        if client is not None:
+            try:
+                version = client.get(_ver_key(account_id))
+            except Exception:
+                version = None
+        # Without Redis we can't tell, so always pull the (usually empty) delta.
+        if version is None or version != entry.version:
+            _apply_delta(entry, account_id, channel)
+            entry.version = version
+    return entry
+
+
+# --- reads ---
+def _confirm(account_id: int, channel: str, candidates: List[str]) -> set:
+    client = get_redis()
+    if client is not None:
+        try:
+            flags = client.smismember(_set_key(account_id, channel), candidates)
+            hits = {a for a, f in zip(candidates, flags) if f}
+            if len(hits) == len(candidates):
+                return hits
+            # Redis may be cold (evicted/flushed); let the DB decide the rest.
+            rest = [a for a in candidates if a not in hits]
+            return hits | suppressions_repo.suppressed_among(account_id, channel, rest)
+        except Exception:
+            pass
+    return suppressions_repo.suppressed_among(account_id, channel, candidates)
+
+
+def allowed_many(account_id: int, channel: str, addresses: Iterable[str]) -> Dict[str, bool]:
+    """
+    Batch check. Returns {original_address: may_send}. Empty/invalid addresses are not allowed.
+    On DB trouble fails closed (nothing allowed) rather than messaging unsubscribed people.
+    """
+    originals = list(addresses)
+    norm = {a: normalize(channel, a) for a in originals}
+    try:
+        entry = _entry(account_id, channel)
+        candidates = sorted({n for n in norm.values() if n and n in entry.bloom})
+        blocked = _confirm(account_id, channel, candidates) if candidates else set()
+    except (OperationalError, ProgrammingError, ImproperlyConfigured):
+        return {a: False for a in originals}
+    return {a: bool(n) and n not in blocked for a, n in norm.items()}
+
+
+def is_allowed(account_id: int, channel: str, address: str) -> bool:
+    return allowed_many(account_id, channel, [address])[address]
+
+
+def warm_redis(account_id: int, channel: str, batch: int = 5_000) -> int:
+    """
+    Repopulate the Redis set from the DB (e.g. after a Redis flush). Returns rows loaded.
+    """
+    client = get_redis()
+    if client is None:
+        return 0
+    after, loaded = 0, 0
+    while True:
+        rows = suppressions_repo.since(account_id, channel, after, limit=batch)
+        if not rows:
+            return loaded
+        client.sadd(_set_key(account_id, channel), *[a for _, a in rows])
+        after = rows[-1][0]
+        loaded += len(rows)
+
+
+__all__ = [
+    "normalize", "suppress", "unsuppress",
+    "allowed_many", "is_allowed", "warm_redis",
+]
@@ -0,0 +1,65 @@
+"""
+One-click unsubscribe for a Contact.
+Tokens are signed (django.core.signing), so links need no DB lookup to validate
+and can't be forged to unsubscribe someone else.
+"""
+
+from __future__ import annotations
+from typing import Iterable, List, Optional, Tuple
+
+from django.core import signing
+
+from apps.core.activity import stream as activity
+from apps.core.constants.channels import EMAIL, SMS
+from . import suppression_store
+
+_SALT = "reclaimr.unsubscribe"
+
+
+def make_token(account_id: int, channel: str, address: str) -> str:
+    """
+    Token for List-Unsubscribe links / SMS footers. Does not expire (CAN-SPAM/TCPA).
+    """
+    return signing.dumps({"a": account_id, "c": channel, "t": address}, salt=_SALT, compress=True)
+
+
+def read_token(token: str) -> Optional[Tuple[int, str, str]]:
+    try:
+        data = signing.loads(token, salt=_SALT)
+    except signing.BadSignature:
+        return None
+    return int(data["a"]), str(data["c"]), str(data["t"])
+
+
+def unsubscribe_contact(contact, channels: Iterable[str] = (EMAIL, SMS), reason: str = "unsubscribe") -> List[str]:
+    """
+    Suppress the contact's email and/or phone for its account. Returns the channels suppressed.
+    Takes effect on all workers within SUPPRESSION_SYNC_SECONDS.
+    """
+    account_id = contact.account_id
+    if account_id is None:
+        return []
+    done = []
+    for channel in channels:
+        address = contact.email if channel == EMAIL else contact.phone
+        if address and suppression_store.suppress(account_id, channel, [address], reason=reason):
+            done.append(channel)
+    if done:
+        activity.publish(account_id, activity.UNSUBSCRIBED, {"contact_id": contact.pk, "channels": done, "reason": reason})
+    return done
+
+
+def unsubscribe_token(token: str) -> bool:
+    """
+    Apply a one-click unsubscribe token. Returns False for invalid tokens.
+    """
+    parsed = read_token(token)
+    if parsed is None:
+        return False
+    account_id, channel, address = parsed
+    if suppression_store.suppress(account_id, channel, [address], reason="unsubscribe"):
+        activity.publish(account_id, activity.UNSUBSCRIBED, {"address": address, "channels": [channel], "reason": "unsubscribe"})
+    return True
+
+
+__all__ = ["make_token", "read_token", "unsubscribe_contact", "unsubscribe_token"]
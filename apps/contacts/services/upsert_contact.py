@@ -0,0 +1,48 @@
+from __future__ import annotations
+from typing import Optional
+
+from apps.contacts.services.address_quality import check_email, check_phone
+
+
+class ContactRejected(ValueError):
+    """The address failed the quality gate (reason is an address_quality constant)."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def upsert_contact(
+    account, email: str, name: Optional[str] = None, phone: Optional[str] = None, checked: bool = False,
+):
+    """
+    Create or update the Contact for `email` (natural key). Empty name/phone never
+    overwrite existing values. Returns the Contact.
+
+    Every caller (API ingest, Shopify webhooks) goes through the address quality gate
+    here: a disposable, role or malformed email raises ContactRejected; an implausible
+    phone is dropped rather than failing the whole contact. checked=True means the
+    email and phone are already gate-normalized (ContactIn validated data) and skips
+    the re-check.
+    """
+    from apps.contacts.models.contact import Contact
+
+    if not checked:
+        verdict = check_email(email)
+        if not verdict.ok:
+            raise ContactRejected(verdict.reason)
+        email = verdict.email
+    defaults = {"account": account}
+    if name:
+        defaults["name"] = name
+    if phone and phone.strip():
+        if checked:
+            defaults["phone"] = phone
+        else:
+            phone_verdict = check_phone(phone)
+            if phone_verdict.ok:
+                defaults["phone"] = phone_verdict.phone
+    contact, _ = Contact.objects.update_or_create(email=email, defaults=defaults)
+    return contact
+
+__all__ = ["ContactRejected", "upsert_contact"]
@@ -0,0 +1,33 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple
+
+try:
+    from celery import shared_task  # type: ignore
+except Exception:  # pragma: no cover (import guard)
+    shared_task = None  # type: ignore
+
+from apps.contacts.services.suppression_store import suppress
+from apps.core.constants.channels import EMAIL, SMS
+
+
+def bulk_suppress(contact_ids: List[int], reason: str = "admin") -> int:
+    """
+    Suppress the email and phone of a chunk of contacts, per owning account.
+    Used by admin bulk actions. Returns addresses suppressed.
+    """
+    from apps.contacts.models.contact import Contact
+
+    grouped: Dict[Tuple[int, str], List[str]] = {}
+    rows = Contact.objects.filter(pk__in=contact_ids, account_id__isnull=False).values_list("account_id", "email", "phone")
+    for account_id, email, phone in rows:
+        if email:
+            grouped.setdefault((account_id, EMAIL), []).append(email)
+        if phone:
+            grouped.setdefault((account_id, SMS), []).append(phone)
+    return sum(len(suppress(account_id, channel, addrs, reason)) for (account_id, channel), addrs in grouped.items())
+
+
+if shared_task is not None:
+    bulk_suppress_task = shared_task(name="contacts.bulk_suppress")(bulk_suppress)
+
+__all__ = ["bulk_suppress"]
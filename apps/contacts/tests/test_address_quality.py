@@ -0,0 +1,107 @@
+from __future__ import annotations
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.accounts.models.account import Account
+from apps.api.serializers import contact_in
+from apps.contacts.models.contact import Contact
+from apps.contacts.services import address_quality as aq
+from apps.contacts.services.upsert_contact import ContactRejected, upsert_contact
+
+
+class CheckEmailTests(SimpleTestCase):
+    def test_known_typo_is_suggested_not_rewritten(self):
+        verdict = aq.check_email("Jane@Gmial.com")
+        self.assertTrue(verdict.ok)
+        self.assertEqual(verdict.email, "Jane@gmial.com")
+        self.assertEqual(verdict.suggestion, "Jane@gmail.com")
+        self.assertEqual(aq.check_email("a@gmail.co").suggestion, "a@gmail.com")
+
+    def test_real_domains_near_popular_ones_are_left_alone(self):
+        for email in ("a@email.com", "a@pocketmail.com", "a@qmail.com", "a@gmail.com"):
+            verdict = aq.check_email(email)
+            self.assertEqual((verdict.email, verdict.ok, verdict.suggestion), (email, True, None), email)
+
+    @override_settings(CONTACT_SUGGEST_EMAIL_TYPOS=False)
+    def test_suggestions_can_be_turned_off(self):
+        self.assertIsNone(aq.check_email("a@gmial.com").suggestion)
+
+    def test_disposable_domains_and_subdomains_are_rejected(self):
+        for email in ("a@mailinator.com", "a@x.mailinator.com", "a@GuerrillaMail.com."):
+            self.assertEqual(aq.check_email(email).reason, aq.DISPOSABLE, email)
+
+    def test_role_addresses(self):
+        self.assertEqual(aq.check_email("Support+eu@shop.example").reason, aq.ROLE)
+        with override_settings(CONTACT_REJECT_ROLE_ADDRESSES=False):
+            self.assertTrue(aq.check_email("support@shop.example").ok)
+
+    def test_malformed(self):
+        for email in ("", "   ", "no-at-sign", "@example.com", "user@"):
+            self.assertEqual(aq.check_email(email).reason, aq.INVALID_EMAIL, email)
+
+
+@override_settings(CONTACT_DEFAULT_COUNTRY_CODE="1")
+class CheckPhoneTests(SimpleTestCase):
+    def test_normalizes_international_forms(self):
+        for raw in ("+1 (415) 555-2671", "415.555.2671", "1-415-555-2671", "0014155552671"):
+            self.assertEqual(aq.check_phone(raw), aq.PhoneVerdict("+14155552671", True, ""), raw)
+
+    def test_default_country_drops_trunk_zero(self):
+        self.assertEqual(aq.check_phone("020 7946 0018", default_country_code="44").phone, "+442079460018")
+        with override_settings(CONTACT_DEFAULT_COUNTRY_CODE="44"):
+            self.assertEqual(aq.check_phone("07700 900123").phone, "+447700900123")
+
+    def test_rejections(self):
+        cases = {
+            "": aq.INVALID_PHONE,
+            "call me": aq.INVALID_PHONE,
+            "+1 415 555": aq.INVALID_PHONE,            # too short overall
+            "+999 1234 5678": aq.UNKNOWN_COUNTRY,
+            "+44 12345": aq.INVALID_PHONE,
+            "+44 123 456 78": aq.IMPLAUSIBLE_PHONE,    # national number too short for GB
+            "+1 111 111 1111": aq.IMPLAUSIBLE_PHONE,   # one repeated digit
+            "+1 115 555 2671": aq.IMPLAUSIBLE_PHONE,   # NANP area codes don't start with 0/1
+            "+1 415 155 2671": aq.IMPLAUSIBLE_PHONE,   # nor do exchanges
+            "+1 415 555 0123": aq.IMPLAUSIBLE_PHONE,   # 555-01XX is fictional
+        }
+        for raw, reason in cases.items():
+            verdict = aq.check_phone(raw)
+            self.assertEqual((verdict.ok, verdict.reason), (False, reason), raw)
+
+
+class UpsertContactGateTests(TestCase):
+    def setUp(self):
+        self.account = Account.objects.create(api_key="k", name="Shop", sender_email="shop@example.com")
+
+    def test_rejected_email_writes_nothing(self):
+        for email in ("a@mailinator.com", "info@shop.example", "nope"):
+            with self.assertRaises(ContactRejected):
+                upsert_contact(self.account, email)
+        self.assertFalse(Contact.objects.exists())
+
+    def test_keeps_submitted_email_and_normalizes_phone(self):
+        contact = upsert_contact(self.account, " a@Gmial.com ", phone="(415) 555-2671")
+        self.assertEqual((contact.email, contact.phone), ("a@gmial.com", "+14155552671"))
+
+    def test_checked_input_skips_the_gate(self):
+        with mock.patch("apps.contacts.services.upsert_contact.check_email") as check:
+            contact = upsert_contact(self.account, "a@gmial.com", phone="+14155552671", checked=True)
+        check.assert_not_called()
+        self.assertEqual((contact.email, contact.phone), ("a@gmial.com", "+14155552671"))
+
+    def test_implausible_phone_is_dropped_not_fatal(self):
+        upsert_contact(self.account, "a@example.com", phone="+14155552671")
+        contact = upsert_contact(self.account, "a@example.com", phone="+1 111 111 1111")
+        self.assertEqual(contact.phone, "+14155552671")
+
+
+class ContactInTests(SimpleTestCase):
+    def test_suggestion_comes_from_the_single_email_check(self):
+        serializer = contact_in.ContactIn(data={"email": "a@Gmial.com", "phone": "(415) 555-2671"})
+        with mock.patch.object(contact_in, "check_email", wraps=aq.check_email) as check:
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(check.call_count, 1)
+        self.assertEqual(serializer.validated_data["email"], "a@gmial.com")
+        self.assertEqual(serializer.validated_data["email_suggestion"], "a@gmail.com")
+        self.assertEqual(serializer.validated_data["phone"], "+14155552671")
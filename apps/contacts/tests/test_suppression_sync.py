@@ -0,0 +1,76 @@
+from __future__ import annotations
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.accounts.models.account import Account
+from apps.contacts.models.suppression import Suppression
+from apps.contacts.repositories import suppressions_repo
+from apps.contacts.services import suppression_store
+from apps.core.constants.channels import EMAIL
+
+
+@override_settings(SUPPRESSION_SYNC_SECONDS=0, SUPPRESSION_SYNC_OVERLAP_SECONDS=60)
+class BloomDeltaSyncTests(TestCase):
+    def setUp(self):
+        self.account = Account.objects.create(api_key="k", name="Shop", sender_email="shop@example.com")
+        patcher = mock.patch("apps.contacts.services.suppression_store.get_redis", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        suppression_store._entries.clear()
+        self.addCleanup(suppression_store._entries.clear)
+
+    def _row(self, id, address, age_s=0):
+        row = Suppression.objects.create(id=id, account=self.account, channel=EMAIL, address=address)
+        if age_s:
+            Suppression.objects.filter(id=id).update(created_at=timezone.now() - timedelta(seconds=age_s))
+        return row
+
+    def _allowed(self, address):
+        return suppression_store.is_allowed(self.account.id, EMAIL, address)
+
+    def test_new_rows_reach_an_existing_filter(self):
+        self.assertTrue(self._allowed("a@example.com"))
+        self._row(1, "a@example.com")
+        self.assertFalse(self._allowed("a@example.com"))
+
+    def test_row_committed_below_the_watermark_is_picked_up(self):
+        self._row(10, "b@example.com")
+        self.assertFalse(self._allowed("b@example.com"))
+        entry = suppression_store._entries[(self.account.id, EMAIL)]
+        self.assertEqual(entry.watermark, 10)
+        # id 5 was allocated before id 10 but its transaction committed later
+        self._row(5, "late@example.com")
+        self.assertFalse(self._allowed("late@example.com"))
+
+    def test_rescan_floor_advances_once_the_window_has_passed(self):
+        self._row(3, "old@example.com", age_s=3600)
+        self._row(10, "b@example.com")
+        clock = [1000.0]
+        with mock.patch("apps.contacts.services.suppression_store.time.monotonic", side_effect=lambda: clock[0]), \
+                mock.patch.object(suppressions_repo, "since", wraps=suppressions_repo.since) as since:
+            self._allowed("x@example.com")  # build: rows older than the window are settled
+            self.assertEqual(since.call_args_list[0].args[2], 3)
+            clock[0] += 5
+            self._allowed("x@example.com")
+            self.assertEqual(since.call_args_list[-2].args[2], 3)  # still inside the window
+            clock[0] += 61
+            self._allowed("x@example.com")
+            clock[0] += 1
+            since.reset_mock()
+            self._allowed("x@example.com")
+            self.assertEqual(since.call_args_list[0].args[2], 10)
+
+    def test_version_bump_waits_for_commit(self):
+        client = mock.MagicMock()
+        with mock.patch("apps.contacts.services.suppression_store.get_redis", return_value=client):
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                suppression_store.suppress(self.account.id, EMAIL, ["A@Example.com "])
+            client.pipeline.assert_not_called()
+            for cb in callbacks:
+                cb()
+        pipe = client.pipeline.return_value
+        pipe.sadd.assert_called_once_with(suppression_store._set_key(self.account.id, EMAIL), "a@example.com")
+        pipe.incr.assert_called_once_with(suppression_store._ver_key(self.account.id))
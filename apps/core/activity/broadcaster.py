@@ -0,0 +1,107 @@
+"""
+In-process fan-out of activity events to open SSE connections (ASGI event loop).
+- One Redis pattern subscription (activity:live:*) per process, however many
+  dashboards are open; events are dispatched to per-connection asyncio queues.
+- Without Redis, stream._local_append() hands events over via deliver_threadsafe().
+- A subscriber whose queue overflows is dropped (its stream ends); the browser's
+  EventSource reconnects with Last-Event-ID and catches up from the log.
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Set
+
+from django.conf import settings
+
+from apps.core.cache.redis_client import redis_url
+from .stream import LIVE_PATTERN, Event
+
+log = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as aioredis  # type: ignore
+except Exception:  # pragma: no cover (import guard)
+    aioredis = None  # type: ignore
+
+CLOSED = object()  # sentinel put on a dropped subscriber's queue
+
+
+class Broadcaster:
+    def __init__(self) -> None:
+        self.subscribers: Dict[int, Set[asyncio.Queue]] = {}
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listener: Optional[asyncio.Task] = None
+
+    def _ensure_listener(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        url = redis_url()
+        if aioredis is None or not url or (self._listener is not None and not self._listener.done()):
+            return
+        self._listener = self.loop.create_task(self._listen(url))
+
+    async def _listen(self, url: str) -> None:
+        while True:
+            try:
+                client = aioredis.from_url(url)
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                await pubsub.psubscribe(LIVE_PATTERN)
+                async for msg in pubsub.listen():
+                    if msg.get("type") == "pmessage":
+                        self.deliver(Event.from_json(msg["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                log.warning("activity listener reconnecting: %s", exc)
+                await asyncio.sleep(1.0)
+
+    def deliver(self, event: Event) -> None:
+        for queue in list(self.subscribers.get(event.account_id, ())):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._drop(event.account_id, queue)
+
+    def _drop(self, account_id: int, queue: asyncio.Queue) -> None:
+        self.subscribers.get(account_id, set()).discard(queue)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(CLOSED)
+
+    @asynccontextmanager
+    async def subscribe(self, account_id: int) -> AsyncIterator[asyncio.Queue]:
+        self._ensure_listener()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=int(getattr(settings, "ACTIVITY_QUEUE_SIZE", 256)))
+        self.subscribers.setdefault(account_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            subs = self.subscribers.get(account_id)
+            if subs is not None:
+                subs.discard(queue)
+                if not subs:
+                    self.subscribers.pop(account_id, None)
+
+
+broadcaster = Broadcaster()
+
+
+def deliver_threadsafe(event: Event) -> None:
+    """
+    Hand a locally published event to the event loop serving SSE (no-op if none is running).
+    """
+    loop = broadcaster.loop
+    if loop is None or loop.is_closed():
+        return
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        broadcaster.deliver(event)
+    else:
+        loop.call_soon_threadsafe(broadcaster.deliver, event)
+
+
+__all__ = ["CLOSED", "Broadcaster", "broadcaster", "deliver_threadsafe"]
@@ -0,0 +1,158 @@
+"""
+Append-only per-account activity stream (lead created, message sent/failed, reply, unsubscribe).
+
+Redis layout (when configured):
+  activity:<account_id>          Redis Stream, XADD MAXLEN ~ ACTIVITY_STREAM_MAXLEN (the log;
+                                 stream ids are the SSE event ids used for Last-Event-ID resume)
+  activity:live:<account_id>     pub/sub channel carrying each event once it is in the log
+Without Redis, a bounded in-process ring buffer per account plays both roles (single process / dev).
+
+Publishing is best-effort: activity must never fail or slow the operation it reports,
+so errors are swallowed. Call publish() after commit (see transaction.on_commit).
+"""
+
+from __future__ import annotations
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+
+from apps.core.cache.redis_client import get_redis
+
+LEAD_CREATED = "lead.created"
+MESSAGE_SENT = "message.sent"
+MESSAGE_DELIVERED = "message.delivered"
+MESSAGE_FAILED = "message.failed"
+REPLY_RECEIVED = "reply.received"
+UNSUBSCRIBED = "contact.unsubscribed"
+
+LIVE_PATTERN = "activity:live:*"
+
+
+class Event(NamedTuple):
+    id: str          # "<ms>-<seq>", ordered per account
+    account_id: int
+    kind: str
+    data: Dict[str, Any]
+
+    def to_json(self) -> str:
+        return json.dumps({"id": self.id, "a": self.account_id, "k": self.kind, "d": self.data}, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "Event":
+        obj = json.loads(raw)
+        return cls(obj["id"], int(obj["a"]), obj["k"], obj.get("d") or {})
+
+
+def log_key(account_id: int) -> str:
+    return f"activity:{account_id}"
+
+
+def live_channel(account_id: int) -> str:
+    return f"activity:live:{account_id}"
+
+
+def _maxlen() -> int:
+    return int(getattr(settings, "ACTIVITY_STREAM_MAXLEN", 1000))
+
+
+def id_tuple(event_id: str) -> Tuple[int, int]:
+    ms, _, seq = (event_id or "0-0").partition("-")
+    try:
+        return int(ms), int(seq or 0)
+    except ValueError:
+        return 0, 0
+
+
+# --- in-process fallback ---
+_local_lock = threading.Lock()
+_local: Dict[int, Deque[Event]] = {}
+_local_last: Tuple[int, int] = (0, 0)
+
+
+def _local_append(account_id: int, kind: str, data: Dict[str, Any]) -> Event:
+    global _local_last
+    with _local_lock:
+        ms = int(time.time() * 1000)
+        seq = _local_last[1] + 1 if ms <= _local_last[0] else 0
+        ms = max(ms, _local_last[0])
+        _local_last = (ms, seq)
+        event = Event(f"{ms}-{seq}", account_id, kind, data)
+        _local.setdefault(account_id, deque(maxlen=_maxlen())).append(event)
+    from .broadcaster import deliver_threadsafe
+
+    deliver_threadsafe(event)
+    return event
+
+
+# --- publish ---
+def publish_many(items: Iterable[Tuple[int, str, Dict[str, Any]]]) -> int:
+    """
+    Append (account_id, kind, data) events and notify live subscribers. Returns events published.
+    """
+    items = [(int(a), k, d) for a, k, d in items if a]
+    if not items:
+        return 0
+    client = get_redis()
+    if client is None:
+        for account_id, kind, data in items:
+            _local_append(account_id, kind, data)
+        return len(items)
+    try:
+        maxlen = _maxlen()
+        pipe = client.pipeline(transaction=False)
+        for account_id, kind, data in items:
+            pipe.xadd(log_key(account_id), {"k": kind, "d": json.dumps(data, separators=(",", ":"))},
+                      maxlen=maxlen, approximate=True)
+        ids = pipe.execute()
+        pipe = client.pipeline(transaction=False)
+        for (account_id, kind, data), raw_id in zip(items, ids):
+            event_id = raw_id.decode() if isinstance(raw_id, bytes) else str(raw_id)
+            pipe.publish(live_channel(account_id), Event(event_id, account_id, kind, data).to_json())
+        pipe.execute()
+        return len(items)
+    except Exception:
+        return 0
+
+
+def publish(account_id: Any, kind: str, data: Optional[Dict[str, Any]] = None) -> int:
+    return publish_many([(account_id, kind, data or {})])
+
+
+# --- read (resume) ---
+def since(account_id: int, last_id: Optional[str], limit: int = 500) -> List[Event]:
+    """
+    Events after `last_id` (exclusive), oldest first. With no `last_id`, nothing (live only).
+    """
+    if not last_id:
+        return []
+    client = get_redis()
+    if client is None:
+        after = id_tuple(last_id)
+        with _local_lock:
+            buf = list(_local.get(account_id, ()))
+        return [e for e in buf if id_tuple(e.id) > after][:limit]
+    try:
+        rows = client.xrange(log_key(account_id), min=f"({last_id}", max="+", count=limit)
+    except Exception:
+        return []
+    out = []
+    for raw_id, fields in rows:
+        event_id = raw_id.decode() if isinstance(raw_id, bytes) else raw_id
+        kind = fields.get(b"k", fields.get("k", b""))
+        data = fields.get(b"d", fields.get("d", b"{}"))
+        out.append(Event(
+            event_id, account_id,
+            kind.decode() if isinstance(kind, bytes) else kind,
+            json.loads(data),
+        ))
+    return out
+
+
+__all__ = [
+    "LEAD_CREATED", "MESSAGE_SENT", "MESSAGE_DELIVERED", "MESSAGE_FAILED", "REPLY_RECEIVED", "UNSUBSCRIBED",
+    "LIVE_PATTERN", "Event", "log_key", "live_channel", "id_tuple", "publish", "publish_many", "since",
+]
@@ -0,0 +1,27 @@
+"""
+Shared ModelAdmin for the large tenant tables (contacts, leads, messages):
+indexed-only search, estimated page counts, newest-first by primary key, and no
+"delete selected" (a synchronous cascade over the whole selection; bulk changes
+run as background actions and message retention is partition drops).
+"""
+
+from __future__ import annotations
+
+from django.contrib import admin
+
+from .paginator import EstimatedCountPaginator
+from .search import IndexedSearchMixin
+
+
+class LargeTableAdmin(IndexedSearchMixin, admin.ModelAdmin):
+    ordering = ("-id",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_actions(self, request):
+        actions = super().get_actions(request)
+        actions.pop("delete_selected", None)
+        return actions
+
+
+__all__ = ["LargeTableAdmin"]
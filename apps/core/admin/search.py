@@ -0,0 +1,65 @@
+"""
+Admin search restricted to indexed lookups.
+The stock admin search ORs `icontains` over every search field, which is a
+sequential scan (LIKE '%term%') on large tables. Admins using IndexedSearchMixin
+implement search_q(term) and return only exact / prefix lookups that an index
+can serve (prefix LIKE uses the varchar_pattern_ops indexes on Postgres).
+The default search_q matches an exact id only.
+"""
+
+from __future__ import annotations
+import re
+from typing import Optional
+
+from django.db.models import Q
+
+_PHONE = re.compile(r"^\+?[\d\s().-]{4,}$")
+
+
+def is_id(term: str) -> bool:
+    return term.isdigit() and len(term) < 19
+
+
+def is_email_like(term: str) -> bool:
+    return "@" in term
+
+
+def is_phone_like(term: str) -> bool:
+    return bool(_PHONE.match(term)) and not is_id(term)
+
+
+def phone_prefix(term: str) -> str:
+    digits = re.sub(r"[^\d]", "", term)
+    return ("+" + digits) if term.strip().startswith("+") else digits
+
+
+def prefix_q(field: str, term: str) -> Q:
+    """
+    Case-sensitive prefix match (index-friendly), trying the term as typed and lowercased.
+    """
+    q = Q(**{f"{field}__startswith": term})
+    if term.lower() != term:
+        q |= Q(**{f"{field}__startswith": term.lower()})
+    return q
+
+
+class IndexedSearchMixin:
+    search_fields = ("=pk",)  # what the default search_q does; also turns the search box on
+
+    def search_q(self, term: str) -> Optional[Q]:
+        """
+        Filter for `term`, or None when no indexed lookup applies (empty result).
+        """
+        return Q(pk=int(term)) if is_id(term) else None
+
+    def get_search_results(self, request, queryset, search_term):
+        term = (search_term or "").strip()
+        if not term:
+            return queryset, False
+        q = self.search_q(term)
+        if q is None:
+            return queryset.none(), False
+        return queryset.filter(q), False
+
+
+__all__ = ["is_id", "is_email_like", "is_phone_like", "phone_prefix", "prefix_q", "IndexedSearchMixin"]
@@ -0,0 +1,53 @@
+"""
+Minimal Bloom filter (no dependencies).
+- k probe positions from one blake2b digest via double hashing.
+- add() is incremental; there is no remove — rebuild to drop members.
+"""
+
+from __future__ import annotations
+import math
+from hashlib import blake2b
+from typing import Iterable
+
+
+class BloomFilter:
+    __slots__ = ("m", "k", "count", "capacity", "_bits")
+
+    def __init__(self, capacity: int = 10_000, fp_rate: float = 0.001):
+        capacity = max(int(capacity), 1)
+        m = int(math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2)))
+        self.m = max(m, 64)
+        self.k = max(1, int(round(self.m / capacity * math.log(2))))
+        self.capacity = capacity
+        self.count = 0
+        self._bits = bytearray((self.m + 7) // 8)
+
+    def _positions(self, item: str):
+        d = blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(d[:8], "little")
+        h2 = int.from_bytes(d[8:], "little") | 1
+        m = self.m
+        for i in range(self.k):
+            yield (h1 + i * h2) % m
+
+    def add(self, item: str) -> None:
+        bits = self._bits
+        for p in self._positions(item):
+            bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+    def update(self, items: Iterable[str]) -> None:
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+    @property
+    def saturated(self) -> bool:
+        """True once more items were added than the filter was sized for."""
+        return self.count > self.capacity
+
+
+__all__ = ["BloomFilter"]
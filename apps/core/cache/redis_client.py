@@ -0,0 +1,54 @@
+"""
+Shared Redis connection helper.
+- One client per URL per process (redis-py clients are thread-safe and pool internally).
+- Returns None when redis-py is missing or no URL is configured, so callers can degrade.
+- redis-py is imported on the first get_redis() that has a URL (it pulls in its
+  asyncio and cache layers), so processes that never touch Redis don't load it.
+"""
+
+from __future__ import annotations
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Optional
+
+from django.conf import settings
+
+if TYPE_CHECKING:  # pragma: no cover
+    import redis  # type: ignore
+
+_CLIENTS: Dict[str, "redis.Redis"] = {}
+_LOCK = Lock()
+
+
+def redis_url() -> str:
+    """
+    Resolve the Redis URL: settings.REDIS_URL → settings.CELERY_BROKER_URL → "".
+    """
+    return getattr(settings, "REDIS_URL", "") or getattr(settings, "CELERY_BROKER_URL", "") or ""
+
+
+def get_redis(url: Optional[str] = None) -> Optional["redis.Redis"]:
+    """
+    Return a cached client for `url` (default: redis_url()), or None if unavailable.
+    No network I/O happens here; the first command opens the connection.
+    """
+    url = url or redis_url()
+    if not url or not url.startswith(("redis://", "rediss://", "unix://")):
+        return None
+
+    client = _CLIENTS.get(url)
+    if client is not None:
+        return client
+    try:
+        import redis  # type: ignore  # lazy: see module docstring
+    except Exception:  # pragma: no cover (import guard)
+        return None
+    with _LOCK:
+        client = _CLIENTS.get(url)
+        if client is None:
+            timeout = float(getattr(settings, "REDIS_SOCKET_TIMEOUT", 2.0))
+            client = redis.Redis.from_url(url, socket_timeout=timeout, socket_connect_timeout=timeout)
+            _CLIENTS[url] = client
+    return client
+
+
+__all__ = ["redis_url", "get_redis"]
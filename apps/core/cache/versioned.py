@@ -0,0 +1,99 @@
+"""
+Per-process cache of derived, immutable values keyed by an id (usually account_id),
+invalidated by a version counter.
+
+- bump(key) increments the version in Redis (all processes) and drops the local entry.
+- Each process re-checks a key's version at most every `check_seconds`; between
+  checks hits cost nothing. Without Redis, versions are process-local only.
+- Keys the loader doesn't return are negatively cached (get_many omits them).
+"""
+
+from __future__ import annotations
+import threading
+import time
+from typing import Callable, Dict, Generic, Hashable, Iterable, Optional, Tuple, TypeVar
+
+from django.conf import settings
+
+from .redis_client import get_redis
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class VersionedCache(Generic[K, V]):
+    def __init__(
+        self,
+        namespace: str,
+        load_many: Callable[[Iterable[K]], Dict[K, V]],
+        check_setting: str,
+        default_check_seconds: float = 5.0,
+    ):
+        self._ver_prefix = f"reclaimr:{namespace}:ver:"
+        self._load_many = load_many
+        self._check_setting = check_setting
+        self._default_check = default_check_seconds
+        self._entries: Dict[K, Tuple[Optional[bytes], float, object]] = {}
+        self._local_versions: Dict[K, int] = {}
+        self._lock = threading.Lock()
+
+    def _version(self, key: K) -> bytes:
+        client = get_redis()
+        if client is not None:
+            try:
+                v = client.get(self._ver_prefix + str(key))
+                return v if v is not None else b"0"
+            except Exception:
+                pass
+        return str(self._local_versions.get(key, 0)).encode()
+
+    def bump(self, key: K) -> None:
+        with self._lock:
+            self._local_versions[key] = self._local_versions.get(key, 0) + 1
+            self._entries.pop(key, None)
+        client = get_redis()
+        if client is not None:
+            try:
+                client.incr(self._ver_prefix + str(key))
+            except Exception:
+                pass
+
+    def get_many(self, keys: Iterable[K]) -> Dict[K, V]:
+        check_every = float(getattr(settings, self._check_setting, self._default_check))
+        now = time.monotonic()
+        out: Dict[K, V] = {}
+        stale: Dict[K, bytes] = {}
+
+        for key in set(keys):
+            cached = self._entries.get(key)
+            if cached is not None and now - cached[1] < check_every:
+                value = cached[2]
+            else:
+                v = self._version(key)
+                if cached is None or cached[0] != v:
+                    stale[key] = v
+                    continue
+                self._entries[key] = (v, now, cached[2])
+                value = cached[2]
+            if value is not _MISSING:
+                out[key] = value  # type: ignore[assignment]
+
+        if stale:
+            loaded = self._load_many(list(stale))
+            with self._lock:
+                for key, v in stale.items():
+                    self._entries[key] = (v, now, loaded.get(key, _MISSING))
+            out.update(loaded)
+        return out
+
+    def get(self, key: K) -> Optional[V]:
+        return self.get_many([key]).get(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+__all__ = ["VersionedCache"]
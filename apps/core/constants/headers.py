@@ -9,9 +9,15 @@ ACCOUNT_KEY = "X-Account-Key"          # per-account API key header
 # Webhooks — Shopify
 SHOPIFY_HMAC = "X-Shopify-Hmac-SHA256" # HMAC signature header
 SHOPIFY_SHOP_DOMAIN = "X-Shopify-Shop-Domain"
+SHOPIFY_WEBHOOK_ID = "X-Shopify-Webhook-Id"   # unique per delivery; stable across retries
 
 # Webhooks — Twilio
 TWILIO_SIGNATURE = "X-Twilio-Signature"
+TWILIO_IDEMPOTENCY_TOKEN = "I-Twilio-Idempotency-Token"
+
+# Idempotency
+IDEMPOTENCY_KEY = "Idempotency-Key"        # client-supplied retry key (ingest)
+IDEMPOTENT_REPLAYED = "Idempotent-Replayed" # set on responses served from the store
 
 # Observability
 REQUEST_ID = "X-Request-ID"            # for correlation across services
@@ -23,7 +29,11 @@ __all__ = [
     "ACCOUNT_KEY",
     "SHOPIFY_HMAC",
     "SHOPIFY_SHOP_DOMAIN",
+    "SHOPIFY_WEBHOOK_ID",
     "TWILIO_SIGNATURE",
+    "TWILIO_IDEMPOTENCY_TOKEN",
+    "IDEMPOTENCY_KEY",
+    "IDEMPOTENT_REPLAYED",
     "REQUEST_ID",
     "CONTENT_TYPE",
 ]
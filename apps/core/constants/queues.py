@@ -0,0 +1,22 @@
+"""
+Canonical Celery queue names.
+Split by channel and priority so bulk enrollments never sit in front of
+time-sensitive sends (abandoned cart, replies) or webhook processing.
+"""
+
+WEBHOOKS   = "webhooks"     # inbound webhook processing (Shopify, Twilio, SendGrid)
+EMAIL_HIGH = "email.high"   # time-sensitive email (abandoned cart, first touch)
+EMAIL_BULK = "email.bulk"   # campaign / re-engagement email
+SMS_HIGH   = "sms.high"
+SMS_BULK   = "sms.bulk"
+MAINTENANCE = "maintenance" # partitions, archival, fair-queue dispatch
+
+ALL = [WEBHOOKS, EMAIL_HIGH, EMAIL_BULK, SMS_HIGH, SMS_BULK, MAINTENANCE]
+
+# Queues fed through the per-tenant fairness layer (apps.core.fairness)
+FAIR = [EMAIL_HIGH, EMAIL_BULK, SMS_HIGH, SMS_BULK]
+
+__all__ = [
+    "WEBHOOKS", "EMAIL_HIGH", "EMAIL_BULK", "SMS_HIGH", "SMS_BULK", "MAINTENANCE",
+    "ALL", "FAIR",
+]
@@ -9,15 +9,35 @@ LEAD_REPLY  = "reply"    # customer replied; pause/stop sequence
 LEAD_WON    = "won"      # converted (e.g., order placed)
 LEAD_LOST   = "lost"     # closed without conversion
 LEAD_PAUSED = "paused"   # temporarily halted (manual or rule)
+LEAD_NEW    = "new"      # legacy initial status (pre-lifecycle rows); treated like open
+
+# Scheduled sequence step lifecycle
+STEP_PENDING   = "pending"    # waiting for run_at
+STEP_DONE      = "done"       # message queued for this step
+STEP_CANCELLED = "cancelled"  # lead left the sequence (reply/won/lost/paused)
 
 # Message lifecycle
-MSG_QUEUED = "queued"    # created but not sent yet
-MSG_SENT   = "sent"      # successfully sent
-MSG_FAILED = "failed"    # provider error or validation failure
+MSG_QUEUED    = "queued"     # created but not sent yet
+MSG_SENT      = "sent"       # successfully sent
+MSG_DELIVERED = "delivered"  # provider confirmed delivery
+MSG_BOUNCED   = "bounced"    # rejected by the recipient's server
+MSG_FAILED    = "failed"     # provider error or validation failure
+
+# Precedence for out-of-order provider events: a status only moves to a higher rank,
+# so a late "queued" never overwrites "sent" and "delivered" never hides a bounce.
+MSG_STATUS_RANK = {
+    MSG_QUEUED: 0,
+    MSG_SENT: 1,
+    MSG_DELIVERED: 2,
+    MSG_BOUNCED: 3,
+    MSG_FAILED: 3,
+}
 
 __all__ = [
     # Lead
-    "LEAD_OPEN", "LEAD_REPLY", "LEAD_WON", "LEAD_LOST", "LEAD_PAUSED",
+    "LEAD_OPEN", "LEAD_REPLY", "LEAD_WON", "LEAD_LOST", "LEAD_PAUSED", "LEAD_NEW",
+    # Scheduled step
+    "STEP_PENDING", "STEP_DONE", "STEP_CANCELLED",
     # Message
-    "MSG_QUEUED", "MSG_SENT", "MSG_FAILED",
+    "MSG_QUEUED", "MSG_SENT", "MSG_DELIVERED", "MSG_BOUNCED", "MSG_FAILED", "MSG_STATUS_RANK",
 ]
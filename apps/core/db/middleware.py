@@ -0,0 +1,47 @@
+"""
+Per-request routing scope for apps.core.db.router.
+- GET/HEAD under REPLICA_READ_PATHS may read from the replica; views can opt in with @replica_reads.
+- A request that wrote sets a short-lived pin cookie so the client's next requests
+  (e.g. the redirect after a POST) read from the primary until the replica catches up.
+"""
+
+from __future__ import annotations
+import time
+from typing import Callable
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from . import router
+
+PIN_COOKIE = "db_pin"
+
+
+class ReplicaRoutingMiddleware:
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if router.replica_alias() is None:
+            return self.get_response(request)
+
+        try:
+            pinned = float(request.COOKIES.get(PIN_COOKIE, "0")) > time.time()
+        except ValueError:
+            pinned = False
+        paths = tuple(getattr(settings, "REPLICA_READ_PATHS", ()))
+        replica_ok = request.method in ("GET", "HEAD") and bool(paths) and request.path_info.startswith(paths)
+
+        token = router.begin(replica_ok=replica_ok, pinned=pinned)
+        try:
+            response = self.get_response(request)
+            state = router.current_state()
+            if state is not None and state.wrote:
+                seconds = int(getattr(settings, "REPLICA_PIN_SECONDS", 5))
+                response.set_cookie(PIN_COOKIE, str(int(time.time()) + seconds), max_age=seconds, httponly=True, samesite="Lax")
+            return response
+        finally:
+            router.end(token)
+
+
+__all__ = ["PIN_COOKIE", "ReplicaRoutingMiddleware"]
@@ -0,0 +1,121 @@
+"""
+Primary/replica database routing.
+
+Reads go to the replica only when the code asked for it and it is safe:
+  - inside @replica_reads views, `with use_replica():` blocks (exports, rollups),
+    or GET/HEAD requests under REPLICA_READ_PATHS;
+  - and the current request/context has not written, is not inside a transaction
+    on the primary, and is not pinned by a recent write (REPLICA_PIN_SECONDS
+    cookie, so a redirect after POST reads its own writes).
+Everything else, and everything when no "replica" alias is configured, uses "default".
+Writes always go to "default" and pin the rest of the request to it.
+"""
+
+from __future__ import annotations
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA = "replica"
+
+
+@dataclass
+class RouteState:
+    replica_ok: bool = False
+    pinned: bool = False
+    wrote: bool = False
+
+
+_state: ContextVar[Optional[RouteState]] = ContextVar("reclaimr_db_route", default=None)
+
+
+def replica_alias() -> Optional[str]:
+    alias = getattr(settings, "REPLICA_DATABASE_ALIAS", REPLICA)
+    return alias if alias in settings.DATABASES else None
+
+
+def current_state() -> Optional[RouteState]:
+    return _state.get()
+
+
+def begin(replica_ok: bool = False, pinned: bool = False):
+    """
+    Start a fresh routing scope (per request / task). Returns a token for end().
+    """
+    return _state.set(RouteState(replica_ok=replica_ok, pinned=pinned))
+
+
+def end(token) -> None:
+    _state.reset(token)
+
+
+@contextmanager
+def use_replica() -> Iterator[None]:
+    """
+    Allow replica reads inside the block (unless the enclosing scope already wrote).
+    """
+    outer = _state.get()
+    token = _state.set(RouteState(replica_ok=True, pinned=bool(outer and (outer.pinned or outer.wrote))))
+    try:
+        yield
+    finally:
+        inner = _state.get()
+        _state.reset(token)
+        if outer is not None and inner is not None and inner.wrote:
+            outer.wrote = True
+
+
+def replica_reads(view: Callable) -> Callable:
+    """
+    Mark a read-only view as safe to serve from the replica.
+    """
+    @functools.wraps(view)
+    def wrapper(request, *args, **kwargs):
+        state = _state.get()
+        if state is None:
+            with use_replica():
+                return view(request, *args, **kwargs)
+        state.replica_ok = True
+        return view(request, *args, **kwargs)
+
+    return wrapper
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        alias = replica_alias()
+        state = _state.get()
+        if alias is None or state is None or not state.replica_ok or state.pinned or state.wrote:
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints) -> Optional[str]:
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        aliases = {DEFAULT_DB_ALIAS, replica_alias()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> Optional[bool]:
+        # The replica is a copy of the primary; never migrate it directly.
+        if db == replica_alias():
+            return False
+        return None
+
+
+__all__ = [
+    "REPLICA", "RouteState", "replica_alias", "current_state", "begin", "end",
+    "use_replica", "replica_reads", "PrimaryReplicaRouter",
+]
@@ -0,0 +1,85 @@
+"""
+Producer and dispatcher sides of the fair queues.
+- enqueue_fair(): what services call instead of task.apply_async().
+- dispatch(): drains a fair queue into its Celery queue, one DRR batch at a time,
+  only while the broker queue is shallow (backpressure), so ordering decisions stay
+  in the fair lists instead of piling up FIFO in the broker.
+"""
+
+from __future__ import annotations
+import time
+from typing import Any, Optional, Sequence
+
+from django.conf import settings
+
+from apps.core.cache.redis_client import get_redis
+from . import tenant_queue
+
+
+def _send(task: str, args: Sequence, kwargs: dict, queue: str) -> None:
+    from celery import current_app  # lazy: keep web processes free of Celery import cost
+
+    current_app.send_task(task, args=list(args), kwargs=kwargs, queue=queue)
+
+
+def _broker_depth(queue: str) -> Optional[int]:
+    client = get_redis(getattr(settings, "CELERY_BROKER_URL", "") or None)
+    if client is None:
+        return None
+    try:
+        return int(client.llen(queue) or 0)
+    except Exception:
+        return None
+
+
+def _max_broker_depth() -> int:
+    # enough to keep every worker busy with one task in hand; the rest waits in the fair lists
+    concurrency = int(getattr(settings, "FAIR_QUEUE_WORKER_CONCURRENCY", 2))
+    return max(1, int(concurrency * float(getattr(settings, "FAIR_QUEUE_BROKER_HEADROOM", 2.0))))
+
+
+def enqueue_fair(queue: str, account_id: Any, task: str, args: Sequence = (), kwargs: Optional[dict] = None) -> None:
+    """
+    Queue `task` for `account_id` behind the fairness layer.
+    Falls back to a direct publish when Redis is unavailable.
+    """
+    if not tenant_queue.push(queue, account_id, task, args, kwargs):
+        _send(task, args, kwargs or {}, queue)
+
+
+def dispatch(queue: str, batch: Optional[int] = None, budget_s: Optional[float] = None) -> int:
+    """
+    Move work from the per-tenant lists of `queue` into the Celery queue of the same name.
+    Publishes only while the broker queue holds fewer than FAIR_QUEUE_WORKER_CONCURRENCY *
+    FAIR_QUEUE_BROKER_HEADROOM messages; stops when it is full, the lists are empty, or
+    `budget_s` elapses (the next beat tick carries on). Only one dispatcher per queue
+    holds the lock at a time. Returns the number of tasks published.
+    """
+    batch = batch or int(getattr(settings, "FAIR_QUEUE_BATCH", 50))
+    budget_s = budget_s if budget_s is not None else float(getattr(settings, "FAIR_QUEUE_BUDGET_S", 10.0))
+    token = tenant_queue.acquire_dispatch_lock(queue, ttl=int(budget_s) + 30)
+    if token is None:
+        return 0
+
+    sent = 0
+    limit = _max_broker_depth()
+    deadline = time.monotonic() + budget_s
+    try:
+        while time.monotonic() < deadline:
+            depth = _broker_depth(queue)
+            room = batch if depth is None else min(batch, limit - depth)
+            if room <= 0:
+                break
+            pulled = tenant_queue.pull_batch(queue, room)
+            if not pulled.items:
+                break
+            for item in pulled.items:
+                _send(item["task"], item.get("args", ()), item.get("kwargs", {}), queue)
+            tenant_queue.ack_batch(queue, pulled)
+            sent += len(pulled.items)
+    finally:
+        tenant_queue.release_dispatch_lock(queue, token)
+    return sent
+
+
+__all__ = ["enqueue_fair", "dispatch"]
@@ -0,0 +1,72 @@
+"""
+Deficit round-robin (DRR) across tenants.
+Pure function over queue depths so it can drive any backing store (Redis lists,
+DB rows, in-memory deques) and be reasoned about in isolation.
+"""
+
+from __future__ import annotations
+from typing import Dict, Hashable, List, Mapping, Optional, Tuple
+
+Tenant = Hashable
+
+
+def drr_plan(
+    depths: Mapping[Tenant, int],
+    deficits: Mapping[Tenant, float],
+    batch: int,
+    weights: Optional[Mapping[Tenant, float]] = None,
+    quantum: float = 1.0,
+    start_after: Optional[Tenant] = None,
+) -> Tuple[List[Tuple[Tenant, int]], Dict[Tenant, float], Optional[Tenant]]:
+    """
+    Decide how many items to take from each tenant for one batch.
+
+    - Tenants are visited in a stable rotation starting after `start_after`,
+      so consecutive batches keep rotating instead of always favouring the first tenant.
+    - Each visit credits `quantum * weight` to the tenant's deficit and takes
+      up to floor(deficit) items. Tenants that drain their queue reset to 0.
+    - Returns (takes in visit order, new deficits, last tenant served).
+      `takes` may list a tenant several times across rounds; counts are per visit.
+    """
+    weights = weights or {}
+    order = sorted((t for t, d in depths.items() if d > 0), key=str)
+    new_deficits: Dict[Tenant, float] = {t: float(deficits.get(t, 0.0)) for t in order}
+    if not order or batch <= 0:
+        return [], new_deficits, start_after
+
+    if start_after in order:
+        i = order.index(start_after) + 1
+        order = order[i:] + order[:i]
+
+    remaining = dict((t, int(depths[t])) for t in order)
+    takes: List[Tuple[Tenant, int]] = []
+    left = batch
+    last = start_after
+
+    while left > 0 and any(remaining.values()):
+        credited = False
+        for t in order:
+            if left <= 0:
+                break
+            if remaining[t] <= 0:
+                continue
+            credit = quantum * max(float(weights.get(t, 1.0)), 0.0)
+            credited = credited or credit > 0
+            new_deficits[t] += credit
+            n = min(int(new_deficits[t]), remaining[t], left)
+            if n <= 0:
+                continue
+            takes.append((t, n))
+            new_deficits[t] -= n
+            remaining[t] -= n
+            left -= n
+            last = t
+            if remaining[t] == 0:
+                new_deficits[t] = 0.0
+        if not credited:
+            break  # every remaining tenant has weight 0
+
+    return takes, new_deficits, last
+
+
+__all__ = ["drr_plan"]
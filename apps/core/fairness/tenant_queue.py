@@ -0,0 +1,235 @@
+"""
+Per-tenant fair queues in front of Celery.
+
+Producers push work into a per-(queue, account) Redis list instead of publishing
+straight to the broker. A single dispatcher per queue pulls batches with deficit
+round-robin (see drr.py) and publishes them to the real Celery queue, so one
+tenant enrolling 100k leads cannot starve everyone else.
+
+Keys (per logical queue Q):
+  reclaimr:fq:Q:t:<account>   list of JSON items {"task","args","kwargs","enq"}
+  reclaimr:fq:Q:active        set of accounts with pending items
+  reclaimr:fq:Q:deficit       hash account -> DRR deficit carried between batches
+  reclaimr:fq:Q:wait_ms       hash account -> wait of the last dispatched item (ms)
+  reclaimr:fq:Q:cursor        last account served (rotation point)
+  reclaimr:fq:Q:lock          dispatcher lock (SET NX EX, value = owner token)
+
+Delivery is at-least-once: pull_batch() only reads the heads of the tenant lists;
+the dispatcher publishes the batch and then ack_batch() trims exactly what was read.
+A crash in between re-publishes that batch on the next run instead of losing it.
+"""
+
+from __future__ import annotations
+import json
+import time
+import uuid
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence
+
+from django.conf import settings
+
+from apps.core.cache.redis_client import get_redis
+from .drr import drr_plan
+
+_PREFIX = "reclaimr:fq:"
+
+_RETIRE_LUA = """
+if redis.call('LLEN', KEYS[1]) == 0 then
+  redis.call('SREM', KEYS[2], ARGV[1])
+  redis.call('HDEL', KEYS[3], ARGV[1])
+  return 1
+end
+return 0
+"""
+
+# Delete the lock only if we still own it (it may have expired and been taken over).
+_RELEASE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class Batch(NamedTuple):
+    items: List[Dict[str, Any]]   # interleaved by DRR; each carries "account"
+    taken: Dict[str, int]         # account -> items read from the head of its list
+    accounts: List[str]           # active accounts seen when the batch was planned
+    deficits: Dict[str, float]
+    last: Optional[str]           # DRR cursor after this batch
+
+
+EMPTY = Batch([], {}, [], {}, None)
+
+
+class TenantStats(NamedTuple):
+    account: str
+    depth: int
+    oldest_age_s: float
+    last_wait_ms: float
+
+
+def _k(queue: str, *parts: str) -> str:
+    return _PREFIX + queue + ":" + ":".join(parts)
+
+
+def _weights() -> Mapping[str, float]:
+    # e.g. FAIR_QUEUE_WEIGHTS = {"42": 2.0} gives account 42 twice the share
+    return {str(k): float(v) for k, v in (getattr(settings, "FAIR_QUEUE_WEIGHTS", {}) or {}).items()}
+
+
+def push(queue: str, account_id: Any, task: str, args: Sequence = (), kwargs: Optional[dict] = None) -> bool:
+    """
+    Enqueue one task for `account_id`. Returns False when Redis is unavailable,
+    in which case the caller should publish directly (no fairness, but no loss).
+    """
+    client = get_redis()
+    if client is None:
+        return False
+    acct = str(account_id)
+    item = json.dumps({"task": task, "args": list(args), "kwargs": kwargs or {}, "enq": time.time()})
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.rpush(_k(queue, "t", acct), item)
+        pipe.sadd(_k(queue, "active"), acct)
+        pipe.execute()
+        return True
+    except Exception:
+        return False
+
+
+def _decode(v) -> str:
+    return v.decode("utf-8") if isinstance(v, bytes) else v
+
+
+def pull_batch(queue: str, batch: int) -> Batch:
+    """
+    Read up to `batch` items interleaved across accounts by DRR, without removing them.
+    Publish the items, then call ack_batch(). Must be called by the single dispatcher
+    holding the queue's lock (see dispatch()).
+    """
+    client = get_redis()
+    if client is None or batch <= 0:
+        return EMPTY
+
+    accounts = [_decode(a) for a in client.smembers(_k(queue, "active"))]
+    if not accounts:
+        return EMPTY
+    pipe = client.pipeline(transaction=False)
+    for a in accounts:
+        pipe.llen(_k(queue, "t", a))
+    depths = dict(zip(accounts, pipe.execute()))
+
+    raw_def = client.hgetall(_k(queue, "deficit"))
+    deficits = {_decode(k): float(v) for k, v in raw_def.items()}
+    cursor = client.get(_k(queue, "cursor"))
+    quantum = float(getattr(settings, "FAIR_QUEUE_QUANTUM", 1.0))
+
+    takes, new_deficits, last = drr_plan(
+        depths, deficits, batch, weights=_weights(), quantum=quantum,
+        start_after=_decode(cursor) if cursor else None,
+    )
+
+    taken: Dict[str, int] = {}
+    for a, n in takes:
+        taken[a] = taken.get(a, 0) + n
+    pipe = client.pipeline(transaction=False)
+    for a, n in taken.items():
+        pipe.lrange(_k(queue, "t", a), 0, n - 1)
+    heads = {a: list(chunk or []) for a, chunk in zip(taken, pipe.execute())}
+
+    # Producers only RPUSH and only the lock holder trims, so these heads are still
+    # at the front of their lists when ack_batch() runs.
+    got = {a: len(chunk) for a, chunk in heads.items() if chunk}
+    items: List[Dict[str, Any]] = []
+    for a, n in takes:
+        for raw in heads[a][:n]:
+            item = json.loads(raw)
+            item["account"] = a
+            items.append(item)
+        del heads[a][:n]
+    return Batch(items, got, accounts, dict(new_deficits), None if last is None else str(last))
+
+
+def ack_batch(queue: str, batch: Batch) -> None:
+    """
+    Remove a published batch from the tenant lists and persist the DRR state
+    (deficits, cursor, per-tenant wait), retiring tenants whose lists are now empty.
+    """
+    client = get_redis()
+    if client is None or not batch.accounts:
+        return
+    now = time.time()
+    waits: Dict[str, float] = {}
+    for item in batch.items:
+        waits[item["account"]] = round((now - float(item.get("enq", now))) * 1000.0, 1)
+
+    # Retire drained tenants atomically (a concurrent push re-adds them via SADD).
+    retire = client.register_script(_RETIRE_LUA)
+    pipe = client.pipeline(transaction=False)
+    for a, n in batch.taken.items():
+        pipe.ltrim(_k(queue, "t", a), n, -1)
+    for a in batch.accounts:
+        if a in batch.deficits:
+            pipe.hset(_k(queue, "deficit"), a, batch.deficits[a])
+        retire(keys=[_k(queue, "t", a), _k(queue, "active"), _k(queue, "deficit")], args=[a], client=pipe)
+    if waits:
+        pipe.hset(_k(queue, "wait_ms"), mapping=waits)
+    if batch.last is not None:
+        pipe.set(_k(queue, "cursor"), batch.last)
+    pipe.execute()
+
+
+def acquire_dispatch_lock(queue: str, ttl: int = 30) -> Optional[str]:
+    """
+    Take the dispatcher lock for `queue`; returns the owner token, or None if it is held.
+    """
+    client = get_redis()
+    token = uuid.uuid4().hex
+    if client is not None and client.set(_k(queue, "lock"), token, nx=True, ex=ttl):
+        return token
+    return None
+
+
+def release_dispatch_lock(queue: str, token: str) -> bool:
+    """
+    Release the lock only if `token` still owns it. Returns False if it had expired
+    (and possibly been taken by another dispatcher), which is left untouched.
+    """
+    client = get_redis()
+    if client is None:
+        return False
+    release = client.register_script(_RELEASE_LUA)
+    return bool(release(keys=[_k(queue, "lock")], args=[token]))
+
+
+def stats(queue: str) -> List[TenantStats]:
+    """
+    Per-tenant depth, age of the oldest waiting item, and wait of the last dispatched item.
+    Sorted by depth (largest first).
+    """
+    client = get_redis()
+    if client is None:
+        return []
+    accounts = [_decode(a) for a in client.smembers(_k(queue, "active"))]
+    waits = {_decode(k): float(v) for k, v in client.hgetall(_k(queue, "wait_ms")).items()}
+    pipe = client.pipeline(transaction=False)
+    for a in accounts:
+        pipe.llen(_k(queue, "t", a))
+        pipe.lindex(_k(queue, "t", a), 0)
+    res = pipe.execute()
+    now = time.time()
+    out = []
+    for i, a in enumerate(accounts):
+        depth, head = res[2 * i], res[2 * i + 1]
+        age = round(now - float(json.loads(head).get("enq", now)), 1) if head else 0.0
+        out.append(TenantStats(a, int(depth), age, waits.get(a, 0.0)))
+    for a, w in waits.items():
+        if a not in accounts:
+            out.append(TenantStats(a, 0, 0.0, w))
+    return sorted(out, key=lambda s: (-s.depth, s.account))
+
+
+__all__ = [
+    "Batch", "TenantStats", "push", "pull_batch", "ack_batch", "acquire_dispatch_lock", "release_dispatch_lock",
+    "stats",
+]
@@ -1,36 +1,38 @@
 from __future__ import annotations
 
 from typing import Any, Mapping, Optional
-from django.http import JsonResponse
+from django.http import HttpResponse
 
+from .fastjson import FastJsonResponse
 
-def _json(data: Mapping[str, Any] | None, status: int) -> JsonResponse:
-    return JsonResponse(data or {}, status=status, safe=False)
+
+def _json(data: Mapping[str, Any] | None, status: int) -> HttpResponse:
+    return FastJsonResponse(data or {}, status=status, safe=False)
 
 # 2xx
-def ok(data: Optional[Mapping[str, Any]] = None) -> JsonResponse:
+def ok(data: Optional[Mapping[str, Any]] = None) -> HttpResponse:
     return _json(data or {"status": "ok"}, 200)
 
-def created(data: Optional[Mapping[str, Any]] = None) -> JsonResponse:
+def created(data: Optional[Mapping[str, Any]] = None) -> HttpResponse:
     return _json(data or {"status": "created"}, 201)
 
-def accepted(data: Optional[Mapping[str, Any]] = None) -> JsonResponse:
+def accepted(data: Optional[Mapping[str, Any]] = None) -> HttpResponse:
     return _json(data or {"status": "accepted"}, 202)
 
 # 4xx
-def bad_request(errors: Optional[Mapping[str, Any]] = None) -> JsonResponse:
+def bad_request(errors: Optional[Mapping[str, Any]] = None) -> HttpResponse:
     payload = {"status": "invalid"}
     if errors:
         payload.update(errors)
     return _json(payload, 400)
 
-def unauthorized(detail: str = "auth_required") -> JsonResponse:
+def unauthorized(detail: str = "auth_required") -> HttpResponse:
     return _json({"detail": detail}, 401)
 
-def forbidden(detail: str = "forbidden") -> JsonResponse:
+def forbidden(detail: str = "forbidden") -> HttpResponse:
     return _json({"detail": detail}, 403)
 
-def not_found(detail: str = "not_found") -> JsonResponse:
+def not_found(detail: str = "not_found") -> HttpResponse:
     return _json({"detail": detail}, 404)
 
 __all__ = [
@@ -0,0 +1,60 @@
+"""
+Pluggable JSON codec for responses and request bodies.
+- orjson when installed and FAST_JSON is on; stdlib json otherwise (same output shape).
+- Types orjson doesn't know (Decimal, lazy strings, Promise, ...) go through DjangoJSONEncoder.default.
+- datetime/date/time are passed through to the same `default` (DRF's encoder for API responses), so
+  they render exactly as before: "Z" for UTC, and DjangoJSONEncoder's millisecond precision.
+- Output is compact UTF-8 (no ASCII escaping), matching DRF's UNICODE_JSON/COMPACT_JSON defaults.
+"""
+
+from __future__ import annotations
+import json
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover (import guard)
+    orjson = None  # type: ignore
+
+_default_encoder = DjangoJSONEncoder()
+
+
+def enabled() -> bool:
+    return orjson is not None and bool(getattr(settings, "FAST_JSON", True))
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None, indent: bool = False) -> bytes:
+    default = default or _default_encoder.default
+    if enabled():
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=default, option=option)
+    text = json.dumps(
+        obj, default=default, ensure_ascii=False, allow_nan=False,
+        indent=2 if indent else None, separators=None if indent else (",", ":"),
+    )
+    return text.encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    if enabled():
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJsonResponse(HttpResponse):
+    """
+    Drop-in for django.http.JsonResponse that encodes with dumps().
+    """
+
+    def __init__(self, data: Any, safe: bool = True, **kwargs: Any) -> None:
+        if safe and not isinstance(data, dict):
+            raise TypeError("In order to allow non-dict objects to be serialized set the safe parameter to False.")
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(content=dumps(data), **kwargs)
+
+
+__all__ = ["enabled", "dumps", "loads", "FastJsonResponse"]
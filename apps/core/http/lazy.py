@@ -0,0 +1,69 @@
+"""
+Lazy URLconf views: the view module is imported on the first request that
+routes to it, not when the URLconf loads. A process that only ever serves
+health/readiness probes never imports DRF, serializers or provider SDKs.
+
+    path("ingest/", lazy_view("apps.api.views.ingest_lead.ingest"), name="ingest")
+    path("stream/", lazy_view("apps.api.views.activity_feed.activity_stream", is_async=True))
+
+Attributes set by view decorators (e.g. csrf_exempt) are forwarded to the real
+view, importing it then; introspection done for every pattern when the resolver
+populates (view_class, private/dunder names) is not, so reverse() stays cheap.
+Async views must say so: Django decides sync vs async before calling the view.
+"""
+
+from __future__ import annotations
+import threading
+from importlib import import_module
+from typing import Any, Callable, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.core.exceptions import ImproperlyConfigured
+
+_NOT_FORWARDED = frozenset({"view_class", "view_initkwargs", "cls", "initkwargs"})
+
+
+class LazyView:
+    def __init__(self, dotted: str, is_async: bool = False) -> None:
+        module, _, name = dotted.rpartition(".")
+        if not module:
+            raise ImproperlyConfigured(f"lazy_view needs a dotted path, got {dotted!r}")
+        self.dotted = dotted
+        self.is_async = is_async
+        self.__module__ = module
+        self.__name__ = self.__qualname__ = name
+        self._view: Optional[Callable[..., Any]] = None
+        self._lock = threading.Lock()
+        if is_async:
+            markcoroutinefunction(self)
+
+    def resolve(self) -> Callable[..., Any]:
+        view = self._view
+        if view is None:
+            with self._lock:
+                view = self._view
+                if view is None:
+                    view = getattr(import_module(self.__module__), self.__name__)
+                    if iscoroutinefunction(view) != self.is_async:
+                        kind = "async" if self.is_async else "sync"
+                        raise ImproperlyConfigured(f"{self.dotted} was declared {kind} in lazy_view()")
+                    self._view = view
+        return view
+
+    def __call__(self, request, *args, **kwargs):
+        return self.resolve()(request, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name in _NOT_FORWARDED:
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        return f"<lazy_view {self.dotted}>"
+
+
+def lazy_view(dotted: str, is_async: bool = False) -> LazyView:
+    return LazyView(dotted, is_async=is_async)
+
+
+__all__ = ["LazyView", "lazy_view"]
@@ -0,0 +1,21 @@
+"""
+DRF parser backed by apps.core.http.fastjson (orjson when available).
+"""
+
+from __future__ import annotations
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from .fastjson import loads
+
+
+class FastJSONParser(JSONParser):
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return loads(stream.read())
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+__all__ = ["FastJSONParser"]
@@ -0,0 +1,28 @@
+"""
+DRF renderer backed by apps.core.http.fastjson (orjson when available).
+"""
+
+from __future__ import annotations
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+from .fastjson import dumps
+
+_drf_encoder = encoders.JSONEncoder()
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        renderer_context = renderer_context or {}
+        indent = bool(self.get_indent(accepted_media_type, renderer_context))
+        ret = dumps(data, default=_drf_encoder.default, indent=indent)
+        # Same as DRF: U+2028/2029 are valid JSON but break JavaScript string literals.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+
+__all__ = ["FastJSONRenderer"]
@@ -1,45 +1,57 @@
 from typing import Any, Mapping
-from django.http import JsonResponse
+from django.http import HttpResponse
+
+from .fastjson import FastJsonResponse
 
 JSONDict = Mapping[str, Any]
 
-def _json_response(data: Any, status: int = 200) -> JsonResponse:
+def _json_response(data: Any, status: int = 200) -> HttpResponse:
     """
-    Return a JsonResponse with correct 'safe' flag based on payload type.
+    Return a JSON response with correct 'safe' flag based on payload type.
     - dict => safe=True
     - non-dict (list/str/number) => safe=False
     """
     is_dict = isinstance(data, dict)
-    return JsonResponse(data, status=status, safe=is_dict, json_dumps_params={"ensure_ascii": False})
+    return FastJsonResponse(data, status=status, safe=is_dict)
 
 # --- Success helpers ---
-def ok(data: Any | None = None) -> JsonResponse:
+def ok(data: Any | None = None) -> HttpResponse:
     return _json_response({} if data is None else data, status=200)
 
-def created(data: Any | None = None) -> JsonResponse:
+def created(data: Any | None = None) -> HttpResponse:
     return _json_response({} if data is None else data, status=201)
 
 # --- Error helpers (standardized error envelope) ---
-def _err(code: str, message: str, status: int) -> JsonResponse:
+def _err(code: str, message: str, status: int) -> HttpResponse:
     payload: JSONDict = {"error": {"code": code, "message": message}}
     return _json_response(payload, status=status)
 
-def bad_request(message: str = "Bad request") -> JsonResponse:
+def bad_request(message: str = "Bad request") -> HttpResponse:
     return _err("bad_request", message, 400)
 
-def unauthorized(message: str = "Unauthorized") -> JsonResponse:
+def unauthorized(message: str = "Unauthorized") -> HttpResponse:
     return _err("unauthorized", message, 401)
 
-def forbidden(message: str = "Forbidden") -> JsonResponse:
+def forbidden(message: str = "Forbidden") -> HttpResponse:
     return _err("forbidden", message, 403)
 
-def not_found(message: str = "Not found") -> JsonResponse:
+def not_found(message: str = "Not found") -> HttpResponse:
     return _err("not_found", message, 404)
 
-def server_error(message: str = "Server error") -> JsonResponse:
+def server_error(message: str = "Server error") -> HttpResponse:
     return _err("server_error", message, 500)
 
+def not_implemented(message: str = "Not implemented") -> HttpResponse:
+    return _err("not_implemented", message, 501)
+
+def service_unavailable(message: str = "Service unavailable", retry_after: int | None = None) -> HttpResponse:
+    resp = _err("service_unavailable", message, 503)
+    if retry_after is not None:
+        resp["Retry-After"] = str(int(retry_after))
+    return resp
+
 __all__ = [
     "ok", "created",
-    "bad_request", "unauthorized", "forbidden", "not_found", "server_error",
+    "bad_request", "unauthorized", "forbidden", "not_found", "server_error", "not_implemented",
+    "service_unavailable",
 ]
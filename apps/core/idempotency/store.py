@@ -0,0 +1,203 @@
+"""
+Short-lived idempotency store.
+- Redis first: SET NX EX claims a key atomically across all workers.
+- DB fallback: a unique row insert on IdempotencyKey gives the same set-if-absent semantics.
+- Only successful (2xx) responses are stored; failures release the claim so retries can proceed.
+- A claim is held for IDEMPOTENCY_PENDING_TTL_SECONDS only, so a worker killed mid-request
+  can't block the key for long; complete() extends it to IDEMPOTENCY_TTL_SECONDS.
+- Each claim carries a request fingerprint (e.g. sha256 of the body). Reusing a key with a
+  different payload yields MISMATCH instead of someone else's stored response.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+from datetime import timedelta
+from typing import Any, NamedTuple, Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import IntegrityError, OperationalError, ProgrammingError, transaction
+
+from apps.core.cache.redis_client import get_redis
+from apps.core.time.now import now_utc
+
+# Claim states
+NEW = "new"                  # caller owns the key and must complete() or release()
+IN_PROGRESS = "in_progress"  # another request holds the key and hasn't finished
+DONE = "done"                # a stored response is available for replay
+UNAVAILABLE = "unavailable"  # no backend reachable; caller proceeds without dedupe
+MISMATCH = "mismatch"        # key was used with a different request fingerprint (→ 422)
+
+_PENDING = "__pending__"
+_PREFIX = "reclaimr:idem:"
+MAX_KEY_LENGTH = 255
+
+
+class Claim(NamedTuple):
+    state: str
+    status_code: Optional[int] = None
+    body: Any = None
+
+
+def _ttl() -> int:
+    return int(getattr(settings, "IDEMPOTENCY_TTL_SECONDS", 24 * 3600))
+
+
+def _pending_ttl() -> int:
+    return int(getattr(settings, "IDEMPOTENCY_PENDING_TTL_SECONDS", 60))
+
+
+def fingerprint(body: bytes | str | None) -> str:
+    """
+    Request fingerprint stored with a claim: sha256 of the raw body.
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return hashlib.sha256(body or b"").hexdigest()
+
+
+def digest(scope: str, key: str) -> str:
+    return hashlib.sha256(f"{scope}\x00{key}".encode("utf-8")).hexdigest()
+
+
+# --- Redis backend ---
+def _redis_claim(client, d: str, fp: str) -> Claim:
+    rkey = _PREFIX + d
+    pending = f"{_PENDING}{fp}"
+    if client.set(rkey, pending, nx=True, ex=_pending_ttl()):
+        return Claim(NEW)
+    raw = client.get(rkey)
+    if raw is None:
+        # Expired between SET and GET; try once more.
+        return Claim(NEW) if client.set(rkey, pending, nx=True, ex=_pending_ttl()) else Claim(IN_PROGRESS)
+    raw = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+    if raw.startswith(_PENDING):
+        return Claim(IN_PROGRESS) if _same(raw[len(_PENDING):], fp) else Claim(MISMATCH)
+    stored = json.loads(raw)
+    if not _same(stored.get("fp", ""), fp):
+        return Claim(MISMATCH)
+    return Claim(DONE, stored["status"], stored["body"])
+
+
+def _same(stored_fp: str, fp: str) -> bool:
+    # Claims made without a fingerprint match anything.
+    return not stored_fp or not fp or stored_fp == fp
+
+
+# --- DB backend ---
+def _db_claim(scope: str, d: str, fp: str) -> Claim:
+    from apps.core.models.idempotency_key import IdempotencyKey
+
+    now = now_utc()
+    expires_at = now + timedelta(seconds=_pending_ttl())
+    try:
+        with transaction.atomic():
+            IdempotencyKey.objects.create(digest=d, scope=scope[:64], fingerprint=fp, expires_at=expires_at)
+        return Claim(NEW)
+    except IntegrityError:
+        pass
+
+    row = IdempotencyKey.objects.filter(digest=d).only("status_code", "response", "fingerprint", "expires_at").first()
+    if row is None:
+        return _db_claim(scope, d, fp)
+    if row.expires_at <= now:
+        # Take over an expired row with a guarded update so only one caller wins.
+        taken = IdempotencyKey.objects.filter(digest=d, expires_at__lte=now).update(
+            status_code=None, response=None, fingerprint=fp, expires_at=expires_at
+        )
+        return Claim(NEW) if taken else Claim(IN_PROGRESS)
+    if not _same(row.fingerprint, fp):
+        return Claim(MISMATCH)
+    if row.status_code is None:
+        return Claim(IN_PROGRESS)
+    return Claim(DONE, row.status_code, row.response)
+
+
+def claim(scope: str, key: str, fp: str = "") -> Claim:
+    """
+    Atomically claim (scope, key) for a request with fingerprint `fp`.
+    See module docstring for the returned states.
+    """
+    d = digest(scope, key)
+    client = get_redis()
+    if client is not None:
+        try:
+            return _redis_claim(client, d, fp)
+        except Exception:
+            pass  # Redis down → fall through to DB
+    try:
+        return _db_claim(scope, d, fp)
+    except (OperationalError, ProgrammingError, ImproperlyConfigured):
+        return Claim(UNAVAILABLE)
+
+
+def complete(scope: str, key: str, status_code: int, body: Any, fp: str = "") -> None:
+    """
+    Store the response for a key claimed with state NEW, for the full TTL.
+    Non-2xx responses release instead.
+    """
+    if not 200 <= status_code < 300:
+        release(scope, key)
+        return
+    d = digest(scope, key)
+    client = get_redis()
+    if client is not None:
+        try:
+            stored = {"status": status_code, "body": body, "fp": fp}
+            client.set(_PREFIX + d, json.dumps(stored, default=str), ex=_ttl())
+            return
+        except Exception:
+            pass
+    try:
+        from apps.core.models.idempotency_key import IdempotencyKey
+
+        IdempotencyKey.objects.filter(digest=d).update(
+            status_code=status_code, response=body, fingerprint=fp,
+            expires_at=now_utc() + timedelta(seconds=_ttl()),
+        )
+    except (OperationalError, ProgrammingError, ImproperlyConfigured):
+        pass
+
+
+def release(scope: str, key: str) -> None:
+    """
+    Drop a claim so a retry can run the request again.
+    """
+    d = digest(scope, key)
+    client = get_redis()
+    if client is not None:
+        try:
+            client.delete(_PREFIX + d)
+            return
+        except Exception:
+            pass
+    try:
+        from apps.core.models.idempotency_key import IdempotencyKey
+
+        IdempotencyKey.objects.filter(digest=d, status_code__isnull=True).delete()
+    except (OperationalError, ProgrammingError, ImproperlyConfigured):
+        pass
+
+
+def purge_expired(batch: int = 5000) -> int:
+    """
+    Delete expired DB fallback rows (Redis expires on its own), in short batches so a
+    backlog from a long Redis outage doesn't hold one huge delete. Returns rows deleted.
+    Scheduled by beat (core.purge_idempotency_keys).
+    """
+    from apps.core.models.idempotency_key import IdempotencyKey
+
+    expired = IdempotencyKey.objects.filter(expires_at__lte=now_utc())
+    deleted = 0
+    while True:
+        ids = list(expired.values_list("pk", flat=True)[:batch])
+        if not ids:
+            return deleted
+        deleted += IdempotencyKey.objects.filter(pk__in=ids).delete()[0]
+
+
+__all__ = [
+    "NEW", "IN_PROGRESS", "DONE", "UNAVAILABLE", "MISMATCH", "MAX_KEY_LENGTH",
+    "Claim", "fingerprint", "digest", "claim", "complete", "release", "purge_expired",
+]
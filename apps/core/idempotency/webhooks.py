@@ -0,0 +1,102 @@
+"""
+Idempotency for inbound webhooks.
+Keys are derived from the provider's delivery ID so retried deliveries are replayed
+from the store instead of re-running the view (and re-creating Contacts/Leads).
+"""
+
+from __future__ import annotations
+import functools
+import hashlib
+from typing import Callable, Optional
+
+from django.http import HttpRequest, HttpResponse
+
+from apps.core.constants.headers import (
+    IDEMPOTENT_REPLAYED,
+    SHOPIFY_WEBHOOK_ID,
+    TWILIO_IDEMPOTENCY_TOKEN,
+)
+from . import store
+
+
+def meta_key(header: str) -> str:
+    """'X-Shopify-Webhook-Id' -> 'HTTP_X_SHOPIFY_WEBHOOK_ID'"""
+    return "HTTP_" + header.upper().replace("-", "_")
+
+
+def webhook_key(provider: str, request: HttpRequest) -> Optional[str]:
+    """
+    Derive a delivery key for `provider` ("shopify" | "twilio" | "sendgrid").
+    Falls back to a hash of the raw body, which is stable across provider retries.
+    """
+    meta = request.META
+    if provider == "shopify":
+        key = meta.get(meta_key(SHOPIFY_WEBHOOK_ID))
+        if key:
+            return key
+    elif provider == "twilio":
+        key = meta.get(meta_key(TWILIO_IDEMPOTENCY_TOKEN))
+        if key:
+            return key
+        sid = request.POST.get("MessageSid") or request.POST.get("SmsSid")
+        if sid:
+            # Status callbacks reuse the SID per status change.
+            return f"{sid}:{request.POST.get('MessageStatus', '')}"
+    body = request.body or b""
+    if not body:
+        return None
+    return "body:" + hashlib.sha256(body).hexdigest()
+
+
+def idempotent_webhook(provider: str, verify: Optional[Callable[[HttpRequest], bool]] = None) -> Callable:
+    """
+    View decorator: claim the delivery key, replay stored 2xx responses, and
+    answer 409 while an identical delivery is still being processed.
+    `verify` (the provider's signature check) runs first, so unsigned requests
+    are rejected with 401 before they can claim or replay a key.
+    """
+    scope = f"webhook:{provider}"
+
+    def decorator(view: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
+        @functools.wraps(view)
+        def wrapper(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            if verify is not None and not verify(request):
+                return HttpResponse("invalid signature", status=401, content_type="text/plain")
+            key = webhook_key(provider, request)
+            if not key:
+                return view(request, *args, **kwargs)
+
+            fp = store.fingerprint(request.body)
+            c = store.claim(scope, key, fp)
+            if c.state == store.MISMATCH:
+                return HttpResponse("idempotency key reused with a different body", status=422, content_type="text/plain")
+            if c.state == store.DONE:
+                resp = HttpResponse(
+                    c.body.get("content", ""),
+                    status=c.status_code,
+                    content_type=c.body.get("content_type", "text/plain"),
+                )
+                resp[IDEMPOTENT_REPLAYED] = "true"
+                return resp
+            if c.state == store.IN_PROGRESS:
+                return HttpResponse("in_progress", status=409, content_type="text/plain")
+
+            try:
+                resp = view(request, *args, **kwargs)
+            except Exception:
+                if c.state == store.NEW:
+                    store.release(scope, key)
+                raise
+            if c.state == store.NEW:
+                store.complete(scope, key, resp.status_code, {
+                    "content": resp.content.decode("utf-8", "replace"),
+                    "content_type": resp.get("Content-Type", "text/plain"),
+                }, fp)
+            return resp
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = ["meta_key", "webhook_key", "idempotent_webhook"]
@@ -0,0 +1,124 @@
+"""
+Cheap, cached Celery backlog sampling.
+- A daemon thread per process runs one pipelined LLEN every LOAD_SHED_DEPTH_TTL_SECONDS
+  (same shape as the readiness refresher); depth() only reads the cached value, so a
+  request never waits on Redis.
+- Only queues the web tier feeds and that carry user-facing latency count:
+  webhooks and the *.high sends. Bulk and maintenance backlogs are expected to be
+  deep and drain on their own schedule; they must not shed web traffic.
+- Unknown depth (no Redis, errors, stalled refresher) reads as 0 so a broker outage
+  alone never sheds traffic; the latency signal in the limiter covers that case.
+"""
+
+from __future__ import annotations
+import random
+import threading
+import time
+from typing import Iterable, Optional
+
+from django.conf import settings
+
+from apps.core.cache.redis_client import get_redis
+from apps.core.constants import queues
+
+SHED_QUEUES = (queues.WEBHOOKS, queues.EMAIL_HIGH, queues.SMS_HIGH)
+STALE_FACTOR = 3.0
+
+_lock = threading.Lock()
+_thread: Optional[threading.Thread] = None
+_depth: int = 0
+_sampled_at: float = 0.0  # monotonic
+
+
+def _ttl() -> float:
+    return max(0.1, float(getattr(settings, "LOAD_SHED_DEPTH_TTL_SECONDS", 2.0)))
+
+
+def sample(names: Optional[Iterable[str]] = None) -> Optional[int]:
+    """
+    Total pending messages across `names` (default SHED_QUEUES) right now, or None when unavailable.
+    """
+    client = get_redis(getattr(settings, "CELERY_BROKER_URL", "") or None)
+    if client is None:
+        return None
+    try:
+        pipe = client.pipeline(transaction=False)
+        for name in names or SHED_QUEUES:
+            pipe.llen(name)
+        return int(sum(int(n or 0) for n in pipe.execute()))
+    except Exception:
+        return None
+
+
+def refresh_once() -> int:
+    """
+    Sample now and publish the result. Safe to call from any thread.
+    """
+    global _depth, _sampled_at
+    n = sample()
+    with _lock:
+        _depth = n if n is not None else 0
+        _sampled_at = time.monotonic()
+    return _depth
+
+
+def _loop() -> None:
+    while True:
+        try:
+            refresh_once()
+        except Exception:  # pragma: no cover (sample never raises; belt and braces)
+            pass
+        time.sleep(_ttl())
+
+
+def ensure_started() -> None:
+    """
+    Start the sampler thread once per process (each prefork worker starts its own).
+    """
+    global _thread
+    if _thread is not None and _thread.is_alive():
+        return
+    with _lock:
+        if _thread is not None and _thread.is_alive():
+            return
+        _thread = threading.Thread(target=_loop, name="reclaimr-backlog", daemon=True)
+        _thread.start()
+
+
+def depth() -> int:
+    """
+    Last sampled backlog (no I/O). 0 until the first sample lands or when the sampler has stalled.
+    """
+    ensure_started()
+    if time.monotonic() - _sampled_at > _ttl() * STALE_FACTOR:
+        return 0
+    return _depth
+
+
+def last_depth() -> int:
+    """
+    Last sample without starting the sampler or checking staleness.
+    """
+    return _depth
+
+
+def shed_probability(n: int) -> float:
+    """
+    0 below LOAD_SHED_QUEUE_SOFT, 1 at LOAD_SHED_QUEUE_HARD, linear in between.
+    """
+    soft = int(getattr(settings, "LOAD_SHED_QUEUE_SOFT", 5000))
+    hard = max(soft + 1, int(getattr(settings, "LOAD_SHED_QUEUE_HARD", 20000)))
+    if n <= soft:
+        return 0.0
+    return min(1.0, (n - soft) / float(hard - soft))
+
+
+def should_shed(n: int) -> bool:
+    p = shed_probability(n)
+    return p >= 1.0 or (p > 0.0 and random.random() < p)
+
+
+__all__ = [
+    "SHED_QUEUES", "sample", "refresh_once", "ensure_started", "depth", "last_depth",
+    "shed_probability", "should_shed",
+]
@@ -0,0 +1,95 @@
+"""
+Adaptive concurrency limiter (AIMD on measured latency).
+- Every admitted request holds a slot until it completes; completion reports its latency.
+- Latency under LOAD_SHED_TARGET_MS (and no 5xx): additive increase, +1 slot per `limit` completions,
+  only while the limit is actually being used.
+- Latency over target or a 5xx: multiplicative decrease, at most once per smoothed latency window,
+  so one burst of slow responses counts as one congestion signal rather than collapsing the limit.
+- Priority traffic (webhooks) may borrow PRIORITY_HEADROOM × limit extra slots; exempt traffic
+  (health/readiness) never takes a slot.
+One limiter per process: concurrency is a per-process resource.
+"""
+
+from __future__ import annotations
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+NORMAL = "normal"
+PRIORITY = "priority"
+
+
+def _setting(name: str, default: float) -> float:
+    return float(getattr(settings, name, default))
+
+
+class AdaptiveLimiter:
+    def __init__(
+        self,
+        initial: Optional[float] = None,
+        min_limit: Optional[float] = None,
+        max_limit: Optional[float] = None,
+        target_ms: Optional[float] = None,
+        backoff: Optional[float] = None,
+        priority_headroom: Optional[float] = None,
+    ) -> None:
+        self.min_limit = max(1.0, min_limit if min_limit is not None else _setting("LOAD_SHED_MIN_LIMIT", 4))
+        self.max_limit = max(self.min_limit, max_limit if max_limit is not None else _setting("LOAD_SHED_MAX_LIMIT", 200))
+        start = initial if initial is not None else _setting("LOAD_SHED_INITIAL_LIMIT", 20)
+        self.limit = min(self.max_limit, max(self.min_limit, start))
+        self.target_s = (target_ms if target_ms is not None else _setting("LOAD_SHED_TARGET_MS", 500)) / 1000.0
+        self.backoff = backoff if backoff is not None else _setting("LOAD_SHED_BACKOFF", 0.9)
+        self.headroom = priority_headroom if priority_headroom is not None else _setting("LOAD_SHED_PRIORITY_HEADROOM", 0.5)
+        self.inflight = 0
+        self.ewma_s = 0.0
+        self.shed = 0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    def try_acquire(self, priority: str = NORMAL) -> bool:
+        with self._lock:
+            cap = self.limit * (1.0 + self.headroom) if priority == PRIORITY else self.limit
+            if self.inflight >= int(cap):
+                self.shed += 1
+                return False
+            self.inflight += 1
+            return True
+
+    def release(self, latency_s: float, failed: bool = False) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self.inflight = max(0, self.inflight - 1)
+            self.ewma_s = latency_s if not self.ewma_s else 0.8 * self.ewma_s + 0.2 * latency_s
+            if failed or latency_s > self.target_s:
+                if now - self._last_decrease >= max(self.ewma_s, self.target_s):
+                    self.limit = max(self.min_limit, self.limit * self.backoff)
+                    self._last_decrease = now
+            elif self.inflight + 1 >= self.limit / 2.0:
+                self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "limit": round(self.limit, 2),
+                "inflight": self.inflight,
+                "latency_ms": round(self.ewma_s * 1000.0, 1),
+                "shed": self.shed,
+            }
+
+
+_limiter: Optional[AdaptiveLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> AdaptiveLimiter:
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = AdaptiveLimiter()
+    return _limiter
+
+
+__all__ = ["NORMAL", "PRIORITY", "AdaptiveLimiter", "get_limiter"]
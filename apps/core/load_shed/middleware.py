@@ -0,0 +1,74 @@
+"""
+Load-shedding middleware.
+Classifies each request by path prefix:
+  - exempt   (LOAD_SHED_EXEMPT_PATHS: health/readiness)   → always served, never counted
+  - priority (LOAD_SHED_PRIORITY_PATHS: provider webhooks) → extra limiter headroom; shed on backlog
+                                                             only once it passes LOAD_SHED_QUEUE_HARD
+  - normal   (everything else under LOAD_SHED_PATHS)       → limiter + probabilistic backlog shedding
+Requests outside LOAD_SHED_PATHS (admin, static) pass through untouched.
+Shed requests get 503 + Retry-After before any view, DB, or broker work happens.
+"""
+
+from __future__ import annotations
+import random
+import time
+from typing import Callable, Optional, Sequence
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from apps.core.http.responses import service_unavailable
+from . import backlog
+from .limiter import NORMAL, PRIORITY, get_limiter
+
+EXEMPT = "exempt"
+
+
+def _prefixes(name: str, default: Sequence[str]) -> Sequence[str]:
+    return tuple(getattr(settings, name, default))
+
+
+def classify(path: str) -> Optional[str]:
+    if not path.startswith(_prefixes("LOAD_SHED_PATHS", ("/reclaimr/",))):
+        return None
+    if path.startswith(_prefixes("LOAD_SHED_EXEMPT_PATHS", ())):
+        return EXEMPT
+    if path.startswith(_prefixes("LOAD_SHED_PRIORITY_PATHS", ())):
+        return PRIORITY
+    return NORMAL
+
+
+def _retry_after() -> int:
+    # Jitter spreads client retries so they don't return as one wave.
+    base = max(1, int(getattr(settings, "LOAD_SHED_RETRY_AFTER_S", 5)))
+    return base + random.randint(0, base)
+
+
+class LoadShedMiddleware:
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not getattr(settings, "LOAD_SHED_ENABLED", True):
+            return self.get_response(request)
+        kind = classify(request.path_info)
+        if kind is None or kind == EXEMPT:
+            return self.get_response(request)
+
+        n = backlog.depth()
+        over = backlog.shed_probability(n) >= 1.0 if kind == PRIORITY else backlog.should_shed(n)
+        limiter = get_limiter()
+        if over or not limiter.try_acquire(kind):
+            return service_unavailable("Temporarily overloaded; retry later", retry_after=_retry_after())
+
+        started = time.perf_counter()
+        failed = True
+        try:
+            response = self.get_response(request)
+            failed = response.status_code >= 500
+            return response
+        finally:
+            limiter.release(time.perf_counter() - started, failed=failed)
+
+
+__all__ = ["classify", "LoadShedMiddleware"]
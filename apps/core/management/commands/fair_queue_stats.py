@@ -0,0 +1,24 @@
+from __future__ import annotations
+from django.core.management.base import BaseCommand
+
+from apps.core.constants import queues
+from apps.core.fairness import tenant_queue
+
+
+class Command(BaseCommand):
+    help = "Show per-tenant depth and wait time for the fair Celery queues."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--queue", choices=queues.FAIR, help="Limit to one queue.")
+        parser.add_argument("--top", type=int, default=20, help="Tenants to show per queue.")
+
+    def handle(self, *args, queue=None, top: int = 20, **opts):
+        for q in [queue] if queue else queues.FAIR:
+            rows = tenant_queue.stats(q)
+            total = sum(r.depth for r in rows)
+            self.stdout.write(f"== {q}: {total} pending across {len([r for r in rows if r.depth])} tenant(s)")
+            for r in rows[:top]:
+                self.stdout.write(
+                    f"  account={r.account:<10} depth={r.depth:<7} oldest_age_s={r.oldest_age_s:<8} "
+                    f"last_wait_ms={r.last_wait_ms}"
+                )
@@ -0,0 +1,131 @@
+from __future__ import annotations
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Tuple
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Each probe runs in a fresh interpreter under `python -X importtime` and prints
+# "BOOT_MS <n>" / "FIRST_MS <n>" on stdout; import timings arrive on stderr.
+_WEB = """
+import time
+t0 = time.perf_counter()
+import django
+django.setup()
+from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
+application = get_wsgi_application()
+get_resolver().url_patterns
+print("BOOT_MS", (time.perf_counter() - t0) * 1000)
+t1 = time.perf_counter()
+environ = {
+    "REQUEST_METHOD": "GET", "PATH_INFO": %(path)r, "QUERY_STRING": "", "SERVER_NAME": "localhost",
+    "SERVER_PORT": "80", "HTTP_HOST": "localhost", "wsgi.url_scheme": "http", "wsgi.input": __import__("io").BytesIO(),
+    "wsgi.errors": __import__("sys").stderr,
+}
+status = []
+b"".join(application(environ, lambda s, h, e=None: status.append(s)))
+print("FIRST_MS", (time.perf_counter() - t1) * 1000, status[0] if status else "")
+"""
+
+_WORKER = """
+import time
+t0 = time.perf_counter()
+from importlib import import_module
+import django
+django.setup()
+from config.settings.celery import app
+for name in app.conf.imports:
+    import_module(name)
+app.finalize()
+print("BOOT_MS", (time.perf_counter() - t0) * 1000)
+"""
+
+
+class Probe(NamedTuple):
+    boot_ms: float
+    first_ms: float
+    first_status: str
+    imports: List[Tuple[int, int, int, str]]  # (depth, self_us, cumulative_us, module)
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[int, int, int, str]]:
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cum_us, name = line.split(":", 1)[1].split("|")
+            self_us, cum_us = int(self_us), int(cum_us)
+        except ValueError:
+            continue
+        # "| " then two spaces per nesting level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((max(depth, 0), self_us, cum_us, name.strip()))
+    return rows
+
+
+def _group(module: str) -> str:
+    parts = module.split(".")
+    if parts[0] in ("django", "apps") and len(parts) > 2 and parts[1] in ("contrib", "core", "db"):
+        return ".".join(parts[:3])
+    return ".".join(parts[:2]) if parts[0] in ("django", "apps") else parts[0]
+
+
+class Command(BaseCommand):
+    help = "Measure cold-start cost (boot, first request, import time by package) per settings profile."
+
+    def add_arguments(self, parser):
+        parser.add_argument("profiles", nargs="*", help="Settings modules to compare (default: the current one).")
+        parser.add_argument("--target", choices=("web", "worker"), default="web")
+        parser.add_argument("--path", default="/reclaimr/health/", help="First request path (web).")
+        parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per profile; the fastest is reported.")
+        parser.add_argument("--top", type=int, default=15, help="Packages / top-level imports to list.")
+
+    def _probe(self, profile: str, target: str, path: str) -> Probe:
+        code = _WEB % {"path": path} if target == "web" else _WORKER
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": profile}
+        env["PYTHONPATH"] = os.pathsep.join(p for p in (str(settings.BASE_DIR), env.get("PYTHONPATH", "")) if p)
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=str(settings.BASE_DIR), env=env, capture_output=True, text=True,
+        )
+        out = dict((line.split(" ", 1) + [""])[:2] for line in proc.stdout.splitlines() if line[:5] in ("BOOT_", "FIRST"))
+        if proc.returncode != 0 or "BOOT_MS" not in out:
+            tail = "\n".join(l for l in proc.stderr.splitlines() if not l.startswith("import time:"))[-2000:]
+            raise CommandError(f"{profile} ({target}) failed to boot:\n{tail}")
+        first_ms, _, first_status = (out.get("FIRST_MS", "0") + " ").partition(" ")
+        return Probe(float(out["BOOT_MS"]), float(first_ms or 0), first_status.strip(), _parse_importtime(proc.stderr))
+
+    def handle(self, *args, profiles=None, target: str = "web", path: str = "/reclaimr/health/", runs: int = 3, top: int = 15, **opts):
+        profiles = profiles or [os.environ.get("DJANGO_SETTINGS_MODULE") or settings.SETTINGS_MODULE]
+        summary = []
+        for profile in profiles:
+            probes = [self._probe(profile, target, path) for _ in range(max(runs, 1))]
+            best = min(probes, key=lambda p: p.boot_ms + p.first_ms)
+            by_group: Dict[str, int] = defaultdict(int)
+            for _, self_us, _, module in best.imports:
+                by_group[_group(module)] += self_us
+            total_ms = sum(r[1] for r in best.imports) / 1000
+
+            self.stdout.write(f"== {profile} ({target}): boot {best.boot_ms:.0f} ms", ending="")
+            if target == "web":
+                self.stdout.write(f", first request {path} {best.first_ms:.0f} ms [{best.first_status}]", ending="")
+            self.stdout.write(f"; {len(best.imports)} modules, {total_ms:.0f} ms importing")
+            self.stdout.write("  packages by self time:")
+            for group, us in sorted(by_group.items(), key=lambda kv: -kv[1])[:top]:
+                self.stdout.write(f"    {us / 1000:8.1f} ms  {group}")
+            self.stdout.write("  slowest top-level imports (cumulative):")
+            for _, _, cum_us, module in sorted((r for r in best.imports if r[0] == 0), key=lambda r: -r[2])[:top]:
+                self.stdout.write(f"    {cum_us / 1000:8.1f} ms  {module}")
+            summary.append((profile, best))
+
+        if len(summary) > 1:
+            self.stdout.write("== summary")
+            for profile, best in summary:
+                self.stdout.write(
+                    f"  {profile:<32} boot {best.boot_ms:7.0f} ms  first {best.first_ms:6.0f} ms  modules {len(best.imports)}"
+                )
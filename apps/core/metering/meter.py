@@ -0,0 +1,248 @@
+"""
+Write-coalescing usage meters.
+- incr() only touches an in-process dict: no I/O on the request path.
+- A daemon thread flushes every USAGE_FLUSH_SECONDS, and again at interpreter exit /
+  Celery worker-process shutdown. A flush is one multi-row additive upsert
+  (INSERT ... ON CONFLICT DO UPDATE SET count = count + excluded.count), so hot tenants
+  cost one row write per (account, metric, bucket) per interval instead of one per event.
+- USAGE_METER_BACKEND = "redis": flushes become pipelined HINCRBYs into one shared hash,
+  and the `core.flush_usage` beat task moves the hash into the DB (fewer DB writers
+  when many processes serve the same tenants). Falls back to the DB when Redis is down.
+- Counts that fail to flush are merged back and retried; they are lost only if the
+  process dies hard (SIGKILL) with a flush pending.
+"""
+
+from __future__ import annotations
+import atexit
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from apps.core.cache.redis_client import get_redis
+
+LEADS_INGESTED = "leads.ingested"
+REDIS_KEY = "usage:pending"
+
+Key = Tuple[int, str, int]  # (account_id, metric, bucket epoch seconds)
+
+_lock = threading.Lock()
+_pending: Dict[Key, int] = {}
+_thread: Optional[threading.Thread] = None
+
+
+def messages_sent(channel: str) -> str:
+    return f"messages.sent.{channel}"
+
+
+def webhook_calls(provider: str) -> str:
+    return f"webhooks.{provider}"
+
+
+def _bucket_s() -> int:
+    return max(60, int(getattr(settings, "USAGE_BUCKET_SECONDS", 3600)))
+
+
+def _interval() -> float:
+    return max(0.5, float(getattr(settings, "USAGE_FLUSH_SECONDS", 10.0)))
+
+
+def _use_redis() -> bool:
+    return getattr(settings, "USAGE_METER_BACKEND", "db") == "redis"
+
+
+def incr(account_id: Any, metric: str, n: int = 1, at: Optional[float] = None) -> None:
+    """
+    Count `n` units of `metric` for `account_id` in the current bucket.
+    """
+    if not account_id or not n:
+        return
+    size = _bucket_s()
+    bucket = int((at if at is not None else time.time()) // size * size)
+    key = (int(account_id), metric, bucket)
+    with _lock:
+        _pending[key] = _pending.get(key, 0) + n
+    _ensure_started()
+
+
+def _merge_back(rows: Dict[Key, int]) -> None:
+    with _lock:
+        for key, n in rows.items():
+            _pending[key] = _pending.get(key, 0) + n
+
+
+def _upsert(rows: Dict[Key, int]) -> int:
+    """
+    Add `rows` into UsageCounter in one statement (chunked). Returns rows written.
+    """
+    from apps.core.models.usage_counter import UsageCounter
+
+    if not rows:
+        return 0
+    table = UsageCounter._meta.db_table
+    items = [
+        (acct, metric, datetime.fromtimestamp(bucket, timezone.utc), n)
+        for (acct, metric, bucket), n in sorted(rows.items())
+    ]
+    if connection.vendor not in ("postgresql", "sqlite"):
+        from django.db.models import F
+
+        with transaction.atomic():
+            for acct, metric, bucket, n in items:
+                updated = UsageCounter.objects.filter(account_id=acct, metric=metric, bucket=bucket).update(count=F("count") + n)
+                if not updated:
+                    UsageCounter.objects.create(account_id=acct, metric=metric, bucket=bucket, count=n)
+        return len(items)
+
+    chunk = 1000
+    with transaction.atomic(), connection.cursor() as cur:
+        for i in range(0, len(items), chunk):
+            part = items[i:i + chunk]
+            values = ", ".join(["(%s, %s, %s, %s)"] * len(part))
+            params = [v for row in part for v in row]
+            cur.execute(
+                f"INSERT INTO {table} (account_id, metric, bucket, count) VALUES {values} "
+                f"ON CONFLICT (account_id, metric, bucket) DO UPDATE SET count = {table}.count + excluded.count",
+                params,
+            )
+    return len(items)
+
+
+def _push_redis(rows: Dict[Key, int]) -> bool:
+    client = get_redis()
+    if client is None:
+        return False
+    try:
+        pipe = client.pipeline(transaction=False)
+        for (acct, metric, bucket), n in rows.items():
+            pipe.hincrby(REDIS_KEY, f"{acct}|{metric}|{bucket}", n)
+        pipe.execute()
+        return True
+    except Exception:
+        return False
+
+
+def flush() -> int:
+    """
+    Write out everything counted in this process so far. Returns keys flushed.
+    """
+    global _pending
+    with _lock:
+        rows, _pending = _pending, {}
+    if not rows:
+        return 0
+    if _use_redis() and _push_redis(rows):
+        return len(rows)
+    try:
+        return _upsert(rows)
+    except Exception:
+        _merge_back(rows)
+        raise
+
+
+def drain_redis() -> int:
+    """
+    Move the shared Redis hash into the DB. RENAME makes the hand-off atomic:
+    increments arriving meanwhile start a fresh hash.
+    """
+    client = get_redis()
+    if client is None:
+        return 0
+    draining = f"{REDIS_KEY}:draining:{uuid.uuid4().hex}"
+    try:
+        client.rename(REDIS_KEY, draining)
+    except Exception:  # no such key (nothing pending) or Redis down
+        return 0
+    rows: Dict[Key, int] = {}
+    for field, n in client.hgetall(draining).items():
+        field = field.decode("utf-8") if isinstance(field, bytes) else field
+        acct, metric, bucket = field.split("|")
+        rows[(int(acct), metric, int(bucket))] = int(n)
+    try:
+        written = _upsert(rows)
+    except Exception:
+        pipe = client.pipeline(transaction=False)
+        for (acct, metric, bucket), n in rows.items():
+            pipe.hincrby(REDIS_KEY, f"{acct}|{metric}|{bucket}", n)
+        pipe.delete(draining)
+        pipe.execute()
+        raise
+    client.delete(draining)
+    return written
+
+
+def totals(account_id: Any, metric: str, since: Optional[datetime] = None) -> int:
+    """
+    Flushed total for `metric` (plus this process's unflushed counts). For quota checks.
+    """
+    from django.db.models import Sum
+    from apps.core.db.router import use_replica
+    from apps.core.models.usage_counter import UsageCounter
+
+    qs = UsageCounter.objects.filter(account_id=account_id, metric=metric)
+    floor = 0
+    if since is not None:
+        size = _bucket_s()
+        floor = int(since.timestamp() // size * size)
+        qs = qs.filter(bucket__gte=datetime.fromtimestamp(floor, timezone.utc))
+    with use_replica():  # rollup read; a few seconds of replica lag is fine for quotas
+        total = qs.aggregate(n=Sum("count"))["n"] or 0
+    with _lock:
+        total += sum(n for (a, m, b), n in _pending.items() if a == int(account_id) and m == metric and b >= floor)
+    return int(total)
+
+
+def _loop() -> None:
+    while True:
+        time.sleep(_interval())
+        try:
+            flush()
+        except Exception:
+            pass  # counts were merged back; next cycle retries
+        finally:
+            connection.close()
+
+
+def _ensure_started() -> None:
+    global _thread
+    if _thread is not None and _thread.is_alive():
+        return
+    with _lock:
+        if _thread is not None and _thread.is_alive():
+            return
+        _thread = threading.Thread(target=_loop, name="reclaimr-usage-meter", daemon=True)
+        _thread.start()
+
+
+def flush_quietly(*args: Any, **kwargs: Any) -> None:
+    """
+    flush() for shutdown hooks (atexit, Celery worker_process_shutdown): never raises.
+    """
+    try:
+        flush()
+    except Exception:
+        pass
+
+
+def _reset_after_fork() -> None:
+    # A forked child must not re-flush the parent's counts or inherit a held lock.
+    global _pending, _thread, _lock
+    _lock = threading.Lock()
+    _pending = {}
+    _thread = None
+
+
+atexit.register(flush_quietly)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+__all__ = [
+    "LEADS_INGESTED", "messages_sent", "webhook_calls",
+    "incr", "flush", "flush_quietly", "drain_redis", "totals",
+]
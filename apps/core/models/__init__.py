@@ -0,0 +1,4 @@
+from .idempotency_key import IdempotencyKey
+from .usage_counter import UsageCounter
+
+__all__ = ["IdempotencyKey", "UsageCounter"]
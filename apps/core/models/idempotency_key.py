@@ -0,0 +1,28 @@
+from __future__ import annotations
+from django.db import models
+
+
+class IdempotencyKey(models.Model):
+    """
+    DB fallback for the idempotency store (used when Redis is unavailable).
+    `digest` is sha256(scope + key), so arbitrary client keys fit a fixed-width unique index.
+    A row with status_code NULL is an in-flight claim; otherwise it holds the stored response.
+    `fingerprint` is sha256 of the request body the key was first used with.
+    """
+    digest = models.CharField(max_length=64, unique=True)
+    scope = models.CharField(max_length=64)
+    fingerprint = models.CharField(max_length=64, blank=True, default="")
+
+    status_code = models.PositiveSmallIntegerField(blank=True, null=True)
+    response = models.JSONField(blank=True, null=True)
+
+    expires_at = models.DateTimeField(db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = "core"
+        verbose_name = "Idempotency Key"
+        verbose_name_plural = "Idempotency Keys"
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.scope}:{self.digest[:12]} -> {self.status_code or 'pending'}"
@@ -0,0 +1,24 @@
+from __future__ import annotations
+from django.db import models
+
+
+class UsageCounter(models.Model):
+    """
+    Per-account usage for billing and quotas, one row per (account, metric, time bucket).
+    Written only by apps.core.metering (additive upserts); never incremented per event.
+    """
+    account = models.ForeignKey("accounts.Account", on_delete=models.CASCADE, related_name="usage_counters")
+    metric = models.CharField(max_length=64)        # e.g. "leads.ingested", "messages.sent.email"
+    bucket = models.DateTimeField()                 # bucket start (UTC), USAGE_BUCKET_SECONDS wide
+    count = models.BigIntegerField(default=0)
+
+    class Meta:
+        app_label = "core"
+        verbose_name = "Usage Counter"
+        verbose_name_plural = "Usage Counters"
+        constraints = [
+            models.UniqueConstraint(fields=["account", "metric", "bucket"], name="unique_usage_bucket"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.account_id}:{self.metric}@{self.bucket:%Y-%m-%d %H:%M} = {self.count}"
@@ -0,0 +1,83 @@
+"""
+Dependency checks for the readiness probe.
+Each check is self-contained, never raises, and reports its own latency.
+These run on the background refresher only — never on the request path.
+"""
+
+from __future__ import annotations
+import time
+from typing import Callable, List, NamedTuple
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from apps.core.cache.redis_client import get_redis
+
+
+class CheckResult(NamedTuple):
+    name: str
+    ok: bool
+    latency_ms: float
+    detail: str
+
+
+def _timed(name: str, fn: Callable[[], str]) -> CheckResult:
+    """
+    Run `fn` and wrap its outcome. `fn` returns a short detail string on success.
+    """
+    started = time.perf_counter()
+    try:
+        detail = fn()
+        ok = True
+    except Exception as exc:
+        detail = f"{type(exc).__name__}: {exc}"[:200]
+        ok = False
+    latency_ms = round((time.perf_counter() - started) * 1000.0, 2)
+    return CheckResult(name, ok, latency_ms, detail)
+
+
+def _db() -> str:
+    with connections[DEFAULT_DB_ALIAS].cursor() as cur:
+        cur.execute("SELECT 1")
+        cur.fetchone()
+    return "ok"
+
+
+def _redis() -> str:
+    client = get_redis()
+    if client is None:
+        raise RuntimeError("broker_not_configured")
+    client.ping()
+    return "ok"
+
+
+def _migrations() -> str:
+    # Imported lazily: the executor pulls in the whole migration graph.
+    from django.db.migrations.executor import MigrationExecutor
+
+    executor = MigrationExecutor(connections[DEFAULT_DB_ALIAS])
+    plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+    if plan:
+        raise RuntimeError(f"{len(plan)} unapplied migration(s)")
+    return "ok"
+
+
+def check_db() -> CheckResult:
+    return _timed("db", _db)
+
+
+def check_redis() -> CheckResult:
+    return _timed("redis", _redis)
+
+
+def check_migrations() -> CheckResult:
+    return _timed("migrations", _migrations)
+
+
+def run_all() -> List[CheckResult]:
+    """
+    Run every check in order. DB first so a dead DB short-circuits nothing but is reported first.
+    """
+    return [check_db(), check_redis(), check_migrations()]
+
+
+__all__ = ["CheckResult", "check_db", "check_redis", "check_migrations", "run_all"]
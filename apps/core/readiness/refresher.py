@@ -0,0 +1,98 @@
+"""
+Background readiness refresher.
+- A single daemon thread per process runs the dependency checks every TTL seconds.
+- Probes call snapshot(), which only reads the last cached result (no I/O).
+- A snapshot older than STALE_FACTOR × TTL is reported as not ready (refresher stalled).
+"""
+
+from __future__ import annotations
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import connections
+
+from .checks import CheckResult, run_all
+
+STALE_FACTOR = 3.0
+
+_lock = threading.Lock()
+_thread: Optional[threading.Thread] = None
+_results: List[CheckResult] = []
+_checked_at: float = 0.0  # monotonic
+
+
+def _ttl() -> float:
+    return max(1.0, float(getattr(settings, "READINESS_TTL_SECONDS", 5.0)))
+
+
+def refresh_once() -> List[CheckResult]:
+    """
+    Run all checks now and publish the result. Safe to call from any thread.
+    """
+    global _results, _checked_at
+    try:
+        results = run_all()
+    finally:
+        # The refresher owns its own DB connection; don't keep it open between cycles.
+        connections.close_all()
+    with _lock:
+        _results = results
+        _checked_at = time.monotonic()
+    return results
+
+
+def _loop() -> None:
+    while True:
+        try:
+            refresh_once()
+        except Exception:  # pragma: no cover (checks never raise; belt and braces)
+            pass
+        time.sleep(_ttl())
+
+
+def ensure_started() -> None:
+    """
+    Start the refresher thread once per process (idempotent, fork-safe enough for
+    prefork servers because each worker starts its own on first probe).
+    """
+    global _thread
+    if _thread is not None and _thread.is_alive():
+        return
+    with _lock:
+        if _thread is not None and _thread.is_alive():
+            return
+        _thread = threading.Thread(target=_loop, name="reclaimr-readiness", daemon=True)
+        _thread.start()
+
+
+def snapshot() -> Dict[str, Any]:
+    """
+    Return the cached readiness state:
+      {"ready": bool, "age_s": float|None, "checks": {name: {"ok", "latency_ms", "detail"}}}
+    `ready` is False until the first refresh completes or when the result is stale.
+    """
+    ensure_started()
+    with _lock:
+        results = list(_results)
+        checked_at = _checked_at
+
+    if not checked_at:
+        return {"ready": False, "age_s": None, "reason": "warming_up", "checks": {}}
+
+    age = time.monotonic() - checked_at
+    stale = age > _ttl() * STALE_FACTOR
+    payload: Dict[str, Any] = {
+        "ready": (not stale) and all(r.ok for r in results),
+        "age_s": round(age, 2),
+        "checks": {
+            r.name: {"ok": r.ok, "latency_ms": r.latency_ms, "detail": r.detail} for r in results
+        },
+    }
+    if stale:
+        payload["reason"] = "stale"
+    return payload
+
+
+__all__ = ["refresh_once", "ensure_started", "snapshot"]
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+try:
+    from celery import shared_task  # type: ignore
+except Exception:  # pragma: no cover (import guard)
+    shared_task = None  # type: ignore
+
+from apps.core.metering.meter import drain_redis, flush
+
+
+def flush_usage() -> int:
+    """
+    Flush this worker's meters, then move the shared Redis usage hash into the DB. Scheduled by beat.
+    """
+    flush()
+    return drain_redis()
+
+
+if shared_task is not None:
+    flush_usage_task = shared_task(name="core.flush_usage")(flush_usage)
+
+__all__ = ["flush_usage"]
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+try:
+    from celery import shared_task  # type: ignore
+except Exception:  # pragma: no cover (import guard)
+    shared_task = None  # type: ignore
+
+from apps.core.idempotency.store import purge_expired
+
+
+def purge_idempotency_keys() -> int:
+    """
+    Drop expired idempotency keys from the DB fallback table. Scheduled by beat.
+    """
+    return purge_expired()
+
+
+if shared_task is not None:
+    purge_idempotency_keys_task = shared_task(name="core.purge_idempotency_keys")(purge_idempotency_keys)
+
+__all__ = ["purge_idempotency_keys"]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.activity import stream
+from apps.core.activity.broadcaster import broadcaster
+
+
+@override_settings(ACTIVITY_STREAM_MAXLEN=100)
+class LocalStreamTests(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch("apps.core.activity.stream.get_redis", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        stream._local.clear()
+        self.addCleanup(stream._local.clear)
+        broadcaster.loop = None
+
+    def test_id_tuple_orders_numerically(self):
+        self.assertGreater(stream.id_tuple("10-0"), stream.id_tuple("9-5"))
+        self.assertGreater(stream.id_tuple("9-10"), stream.id_tuple("9-9"))
+        self.assertEqual(stream.id_tuple(""), (0, 0))
+        self.assertEqual(stream.id_tuple("junk"), (0, 0))
+
+    def test_ids_stay_ordered_within_one_millisecond(self):
+        with mock.patch("apps.core.activity.stream.time.time", return_value=1000.0):
+            for i in range(12):
+                stream.publish(7, stream.LEAD_CREATED, {"n": i})
+        ids = [e.id for e in stream._local[7]]
+        self.assertEqual(ids[-1], f"{ids[0].split('-')[0]}-{int(ids[0].split('-')[1]) + 11}")
+        self.assertEqual(sorted(ids, key=stream.id_tuple), ids)
+
+    def test_since_is_exclusive_paged_and_per_account(self):
+        for i in range(12):
+            stream.publish(7, stream.LEAD_CREATED, {"n": i})
+        stream.publish(8, stream.LEAD_CREATED, {"n": -1})
+        events = list(stream._local[7])
+        self.assertEqual(stream.since(7, None), [])
+        self.assertEqual([e.data["n"] for e in stream.since(7, events[0].id)], list(range(1, 12)))
+        self.assertEqual([e.data["n"] for e in stream.since(7, events[0].id, limit=5)], [1, 2, 3, 4, 5])
+        self.assertEqual([e.data["n"] for e in stream.since(7, events[5].id, limit=5)], [6, 7, 8, 9, 10])
+        self.assertEqual(stream.since(7, events[-1].id), [])
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase, override_settings
+
+from apps.accounts.models.account import Account
+from apps.contacts.models.contact import Contact
+from apps.core.admin.base import LargeTableAdmin
+from apps.core.admin.paginator import EstimatedCountPaginator
+
+
+@override_settings(ADMIN_EXACT_COUNT_LIMIT=3)
+class EstimatedCountPaginatorTests(TestCase):
+    def setUp(self):
+        self.account = Account.objects.create(api_key="k", name="Shop", sender_email="shop@example.com")
+
+    def _contacts(self, n):
+        Contact.objects.bulk_create(
+            Contact(account=self.account, email=f"c{i}@example.com") for i in range(n)
+        )
+        return Contact.objects.order_by("-id")
+
+    def test_counts_exactly_up_to_the_limit_in_one_bounded_query(self):
+        paginator = EstimatedCountPaginator(self._contacts(3), 2)
+        with self.assertNumQueries(1):
+            self.assertEqual(paginator.count, 3)
+        self.assertEqual(paginator.num_pages, 2)
+
+    def test_past_the_limit_without_planner_estimate_falls_back_to_count(self):
+        paginator = EstimatedCountPaginator(self._contacts(5), 2)
+        with self.assertNumQueries(2):  # bounded count, then the full one (no EXPLAIN on sqlite)
+            self.assertEqual(paginator.count, 5)
+
+    def test_plain_lists(self):
+        self.assertEqual(EstimatedCountPaginator(list(range(7)), 2).count, 7)
+
+
+class IndexedSearchTests(TestCase):
+    def setUp(self):
+        self.rf = RequestFactory()
+        self.request = self.rf.get("/")
+        self.request.user = get_user_model()(is_superuser=True, is_staff=True)
+        account = Account.objects.create(api_key="k", name="Shop", sender_email="shop@example.com")
+        self.ann = Contact.objects.create(account=account, email="ann@example.com", phone="+14155552671")
+        self.bob = Contact.objects.create(account=account, email="bob@example.com", phone="+442079460018")
+        self.contact_admin = admin.site._registry[Contact]
+
+    def _search(self, model_admin, term):
+        qs, may_have_duplicates = model_admin.get_search_results(self.request, Contact.objects.order_by("id"), term)
+        self.assertFalse(may_have_duplicates)
+        return list(qs)
+
+    def test_contact_search_dispatch(self):
+        self.assertEqual(self._search(self.contact_admin, str(self.bob.pk)), [self.bob])
+        self.assertEqual(self._search(self.contact_admin, "+44 20"), [self.bob])
+        self.assertEqual(self._search(self.contact_admin, "Ann@"), [self.ann])
+        self.assertEqual(self._search(self.contact_admin, "  "), [self.ann, self.bob])
+
+    def test_changelist_renders_search_results(self):
+        user = get_user_model().objects.create_superuser("root", "root@example.com", "pw")
+        self.client.force_login(user)
+        resp = self.client.get("/admin/contacts/contact/", {"q": "bob@"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(list(resp.context["cl"].result_list), [self.bob])
+
+    def test_default_search_is_exact_id_only(self):
+        plain = LargeTableAdmin(Contact, admin.site)
+        self.assertEqual(self._search(plain, str(self.ann.pk)), [self.ann])
+        self.assertEqual(self._search(plain, "ann"), [])
+        self.assertTrue(plain.get_search_fields(self.request))  # search box is rendered
+
+    def test_delete_selected_is_not_offered(self):
+        for model_admin in (self.contact_admin, LargeTableAdmin(Contact, admin.site)):
+            self.assertNotIn("delete_selected", model_admin.get_actions(self.request))
@@ -0,0 +1,150 @@
+from __future__ import annotations
+import time
+from contextlib import contextmanager
+
+from django.db import connections, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from apps.accounts.models.account import Account
+from apps.core.db import router
+from apps.core.db.middleware import PIN_COOKIE, ReplicaRoutingMiddleware
+
+
+def _read_alias() -> str:
+    return Account.objects.all().db
+
+
+@contextmanager
+def _replica_scope_queries():
+    with router.use_replica(), CaptureQueriesContext(connections[router.REPLICA]) as queries:
+        yield queries
+
+
+class ReplicaAliasTestCase(TransactionTestCase):
+    """
+    Adds a "replica" alias mirroring the test database (a second sqlite connection),
+    as REPLICA_DATABASE_URL would with TEST: {"MIRROR": "default"}. Transactional
+    tests so rows written on the primary are visible through the replica connection.
+    """
+    @classmethod
+    def setUpClass(cls):
+        # Added here rather than in settings so the runner doesn't try to create it; as a
+        # mirror it is never flushed. connections.settings is settings.DATABASES, so
+        # replica_alias() sees it too.
+        connections.settings[router.REPLICA] = {**connections["default"].settings_dict, "TEST": {"MIRROR": "default"}}
+        cls.databases = {"default", router.REPLICA}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        connections[router.REPLICA].close()
+        del connections[router.REPLICA]
+        del connections.settings[router.REPLICA]
+        super().tearDownClass()
+
+    def setUp(self):
+        self.account = Account.objects.create(api_key="k", name="Shop", sender_email="shop@example.com")
+
+
+class RouterTests(ReplicaAliasTestCase):
+    def test_reads_use_primary_unless_asked(self):
+        self.assertEqual(router.replica_alias(), router.REPLICA)
+        self.assertEqual(_read_alias(), "default")
+        token = router.begin()
+        try:
+            self.assertEqual(_read_alias(), "default")
+        finally:
+            router.end(token)
+
+    def test_use_replica_reads_from_the_replica_connection(self):
+        with _replica_scope_queries() as queries:
+            self.assertEqual(_read_alias(), router.REPLICA)
+            self.assertEqual(list(Account.objects.values_list("name", flat=True)), ["Shop"])
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(_read_alias(), "default")
+
+    def test_replica_reads_decorator(self):
+        seen = []
+
+        @router.replica_reads
+        def view(request):
+            seen.append(_read_alias())
+            return HttpResponse()
+
+        view(RequestFactory().get("/"))
+        token = router.begin()
+        try:
+            view(RequestFactory().get("/"))
+        finally:
+            router.end(token)
+        self.assertEqual(seen, [router.REPLICA, router.REPLICA])
+
+    def test_write_pins_later_reads_to_primary(self):
+        token = router.begin()
+        try:
+            with router.use_replica():
+                self.assertEqual(_read_alias(), router.REPLICA)
+                Account.objects.filter(pk=self.account.pk).update(name="Renamed")
+                self.assertEqual(_read_alias(), "default")
+            self.assertTrue(router.current_state().wrote)
+            with router.use_replica():
+                self.assertEqual(_read_alias(), "default")
+        finally:
+            router.end(token)
+
+    def test_atomic_block_forces_primary(self):
+        with router.use_replica():
+            with transaction.atomic():
+                self.assertEqual(_read_alias(), "default")
+            self.assertEqual(_read_alias(), router.REPLICA)
+
+    @override_settings(REPLICA_DATABASE_ALIAS="missing")
+    def test_unconfigured_alias_routes_everything_to_primary(self):
+        self.assertIsNone(router.replica_alias())
+        with router.use_replica():
+            self.assertEqual(_read_alias(), "default")
+
+
+@override_settings(REPLICA_READ_PATHS=["/reports/"], REPLICA_PIN_SECONDS=5)
+class MiddlewareTests(ReplicaAliasTestCase):
+    def setUp(self):
+        super().setUp()
+        self.rf = RequestFactory()
+        self.seen = []
+
+        def view(request):
+            self.seen.append(_read_alias())
+            if request.method == "POST":
+                Account.objects.filter(pk=self.account.pk).update(name="Renamed")
+            return HttpResponse()
+
+        self.mw = ReplicaRoutingMiddleware(view)
+
+    def test_get_under_read_paths_uses_replica(self):
+        self.mw(self.rf.get("/reports/daily/"))
+        self.mw(self.rf.get("/other/"))
+        self.mw(self.rf.head("/reports/daily/"))
+        self.assertEqual(self.seen, [router.REPLICA, "default", router.REPLICA])
+        self.assertIsNone(router.current_state())
+
+    def test_write_sets_pin_cookie_that_later_reads_honour(self):
+        resp = self.mw(self.rf.post("/reports/daily/"))
+        pin = resp.cookies[PIN_COOKIE]
+        self.assertGreater(int(pin.value), time.time())
+        self.assertEqual(pin["max-age"], 5)
+
+        pinned = self.rf.get("/reports/daily/")
+        pinned.COOKIES[PIN_COOKIE] = pin.value
+        resp = self.mw(pinned)
+        self.assertNotIn(PIN_COOKIE, resp.cookies)  # reads don't extend the pin
+
+        expired = self.rf.get("/reports/daily/")
+        expired.COOKIES[PIN_COOKIE] = str(int(time.time()) - 1)
+        self.mw(expired)
+        garbage = self.rf.get("/reports/daily/")
+        garbage.COOKIES[PIN_COOKIE] = "junk"
+        self.mw(garbage)
+
+        self.assertEqual(self.seen, ["default", "default", router.REPLICA, router.REPLICA])
@@ -0,0 +1,215 @@
+from __future__ import annotations
+import json
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.fairness import dispatch as fair_dispatch
+from apps.core.fairness import tenant_queue
+from apps.core.fairness.drr import drr_plan
+
+
+class FakeRedis:
+    """Lists, sets, hashes, strings, pipelines and the two fair-queue scripts."""
+
+    def __init__(self):
+        self.data = {}
+
+    def _list(self, key):
+        return self.data.setdefault(key, [])
+
+    def _b(self, v):
+        return v.encode() if isinstance(v, str) else v
+
+    def rpush(self, key, *values):
+        self._list(key).extend(self._b(v) for v in values)
+
+    def llen(self, key):
+        return len(self.data.get(key, []))
+
+    def lrange(self, key, start, end):
+        items = self.data.get(key, [])
+        return items[start:] if end == -1 else items[start:end + 1]
+
+    def ltrim(self, key, start, end):
+        self.data[key] = self.lrange(key, start, end)
+        if not self.data[key]:
+            del self.data[key]
+
+    def lindex(self, key, i):
+        items = self.data.get(key, [])
+        return items[i] if i < len(items) else None
+
+    def sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(self._b(m) for m in members)
+
+    def srem(self, key, member):
+        self.data.get(key, set()).discard(self._b(member))
+
+    def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        h = self.data.setdefault(key, {})
+        for f, v in (mapping or {field: value}).items():
+            h[self._b(f)] = self._b(str(v))
+
+    def hdel(self, key, field):
+        self.data.get(key, {}).pop(self._b(field), None)
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = self._b(value)
+        return True
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+    def register_script(self, source):
+        return FakeScript(self, source)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client, self.calls = client, []
+
+    def __getattr__(self, name):
+        return lambda *a, **kw: self.calls.append((getattr(self.client, name), a, kw))
+
+    def execute(self):
+        return [fn(*a, **kw) for fn, a, kw in self.calls]
+
+
+class FakeScript:
+    def __init__(self, client, source):
+        self.client, self.source = client, source
+
+    def run(self, keys, args):
+        r = self.client
+        if self.source == tenant_queue._RETIRE_LUA:
+            if r.llen(keys[0]) == 0:
+                r.srem(keys[1], args[0])
+                r.hdel(keys[2], args[0])
+                return 1
+            return 0
+        if self.source == tenant_queue._RELEASE_LUA:
+            if r.get(keys[0]) == r._b(args[0]):
+                r.delete(keys[0])
+                return 1
+            return 0
+        raise AssertionError("unknown script")
+
+    def __call__(self, keys, args, client=None):
+        if isinstance(client, FakePipeline):
+            client.calls.append((self.run, (keys, args), {}))
+            return None
+        return self.run(keys, args)
+
+
+class DrrPlanTests(SimpleTestCase):
+    def test_interleaves_instead_of_draining_the_biggest_tenant(self):
+        takes, _, last = drr_plan({"a": 1000, "b": 2, "c": 2}, {}, batch=6)
+        self.assertEqual(takes, [("a", 1), ("b", 1), ("c", 1), ("a", 1), ("b", 1), ("c", 1)])
+        self.assertEqual(last, "c")
+
+    def test_rotation_resumes_after_cursor(self):
+        takes, _, _ = drr_plan({"a": 5, "b": 5, "c": 5}, {}, batch=2, start_after="a")
+        self.assertEqual(takes, [("b", 1), ("c", 1)])
+
+    def test_weights_scale_the_share(self):
+        takes, _, _ = drr_plan({"a": 100, "b": 100}, {}, batch=9, weights={"a": 2.0})
+        served = {t: sum(n for x, n in takes if x == t) for t in ("a", "b")}
+        self.assertEqual(served, {"a": 6, "b": 3})
+
+    def test_fractional_quantum_carries_deficit(self):
+        takes, deficits, _ = drr_plan({"a": 10}, {}, batch=1, quantum=0.5)
+        self.assertEqual(takes, [("a", 1)])
+        self.assertEqual(deficits["a"], 0.0)
+        takes, deficits, _ = drr_plan({"a": 10}, {"a": 0.25}, batch=1, quantum=0.5)
+        self.assertEqual(takes, [("a", 1)])
+        self.assertEqual(deficits["a"], 0.25)
+
+    def test_drained_tenant_resets_deficit(self):
+        _, deficits, _ = drr_plan({"a": 1, "b": 5}, {"a": 3.0}, batch=4)
+        self.assertEqual(deficits["a"], 0.0)
+
+    def test_zero_weight_tenants_are_not_served(self):
+        takes, _, _ = drr_plan({"a": 5}, {}, batch=5, weights={"a": 0})
+        self.assertEqual(takes, [])
+
+
+@override_settings(FAIR_QUEUE_QUANTUM=1, FAIR_QUEUE_WEIGHTS={}, FAIR_QUEUE_WORKER_CONCURRENCY=2, FAIR_QUEUE_BROKER_HEADROOM=2)
+class DispatchTests(SimpleTestCase):
+    Q = "email.bulk"
+
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.sent = []
+        for target in ("apps.core.fairness.tenant_queue.get_redis", "apps.core.fairness.dispatch.get_redis"):
+            patcher = mock.patch(target, return_value=self.redis)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(fair_dispatch, "_send", side_effect=self._send)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _send(self, task, args, kwargs, queue):
+        self.sent.append(args[0])
+        self.redis.rpush(queue, json.dumps({"task": task}))  # the broker queue Celery would fill
+
+    def _enqueue(self, account, n):
+        for i in range(n):
+            tenant_queue.push(self.Q, account, "messaging.send", args=(f"{account}-{i}",))
+
+    def _drain_broker(self):
+        self.redis.delete(self.Q)
+
+    def test_publishes_interleaved_and_only_up_to_broker_headroom(self):
+        self._enqueue(1, 10)
+        self._enqueue(2, 2)
+        self.assertEqual(fair_dispatch.dispatch(self.Q, batch=50, budget_s=5), 4)
+        self.assertEqual(self.sent, ["1-0", "2-0", "1-1", "2-1"])
+        # broker is full: nothing more until workers drain it
+        self.assertEqual(fair_dispatch.dispatch(self.Q, batch=50, budget_s=5), 0)
+        self._drain_broker()
+        self.assertEqual(fair_dispatch.dispatch(self.Q, batch=50, budget_s=5), 4)
+        self.assertEqual(self.sent[4:], ["1-2", "1-3", "1-4", "1-5"])
+        self.assertEqual({s.account: s.depth for s in tenant_queue.stats(self.Q)}, {"1": 4, "2": 0})
+
+    def test_items_stay_queued_when_publish_fails(self):
+        self._enqueue(1, 3)
+        with mock.patch.object(fair_dispatch, "_send", side_effect=RuntimeError("broker down")):
+            with self.assertRaises(RuntimeError):
+                fair_dispatch.dispatch(self.Q, batch=50, budget_s=5)
+        self.assertEqual(self.redis.llen(tenant_queue._k(self.Q, "t", "1")), 3)
+        self.assertIsNone(self.redis.get(tenant_queue._k(self.Q, "lock")))
+        self.assertEqual(fair_dispatch.dispatch(self.Q, batch=50, budget_s=5), 3)
+        self.assertEqual(self.sent, ["1-0", "1-1", "1-2"])
+
+    def test_drained_tenants_are_retired(self):
+        self._enqueue(1, 2)
+        fair_dispatch.dispatch(self.Q, batch=50, budget_s=5)
+        self.assertEqual(self.redis.smembers(tenant_queue._k(self.Q, "active")), set())
+
+    def test_held_lock_skips_dispatch(self):
+        self._enqueue(1, 1)
+        token = tenant_queue.acquire_dispatch_lock(self.Q)
+        self.assertEqual(fair_dispatch.dispatch(self.Q, batch=50, budget_s=5), 0)
+        self.assertTrue(tenant_queue.release_dispatch_lock(self.Q, token))
+
+    def test_release_leaves_a_lock_taken_over_by_someone_else(self):
+        stale = tenant_queue.acquire_dispatch_lock(self.Q)
+        self.redis.delete(tenant_queue._k(self.Q, "lock"))  # expired
+        fresh = tenant_queue.acquire_dispatch_lock(self.Q)
+        self.assertFalse(tenant_queue.release_dispatch_lock(self.Q, stale))
+        self.assertEqual(self.redis.get(tenant_queue._k(self.Q, "lock")), fresh.encode())
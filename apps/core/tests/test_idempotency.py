@@ -0,0 +1,157 @@
+from __future__ import annotations
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from apps.core.idempotency import store
+from apps.core.idempotency.webhooks import idempotent_webhook
+from apps.core.models.idempotency_key import IdempotencyKey
+from apps.core.time.now import now_utc
+
+
+class FakeRedis:
+    """The handful of commands the store uses, with expiry."""
+
+    def __init__(self):
+        self.data = {}
+
+    def _live(self, key):
+        value, expires = self.data.get(key, (None, 0))
+        if value is not None and expires and expires <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and self._live(key) is not None:
+            return None
+        self.data[key] = (value.encode() if isinstance(value, str) else value, time.monotonic() + ex if ex else 0)
+        return True
+
+    def get(self, key):
+        return self._live(key)
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def ttl(self, key):
+        return self.data[key][1] - time.monotonic()
+
+
+@override_settings(IDEMPOTENCY_TTL_SECONDS=3600, IDEMPOTENCY_PENDING_TTL_SECONDS=30)
+class DbStoreTests(TestCase):
+    def setUp(self):
+        patcher = mock.patch("apps.core.idempotency.store.get_redis", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_claim_complete_replay(self):
+        self.assertEqual(store.claim("s", "k", "fp1").state, store.NEW)
+        self.assertEqual(store.claim("s", "k", "fp1").state, store.IN_PROGRESS)
+        store.complete("s", "k", 201, {"id": 1}, "fp1")
+        c = store.claim("s", "k", "fp1")
+        self.assertEqual((c.state, c.status_code, c.body), (store.DONE, 201, {"id": 1}))
+
+    def test_pending_claim_is_short_and_completion_extends_it(self):
+        store.claim("s", "k", "fp1")
+        row = IdempotencyKey.objects.get()
+        self.assertLessEqual(row.expires_at, now_utc() + timedelta(seconds=30))
+        store.complete("s", "k", 200, {}, "fp1")
+        row.refresh_from_db()
+        self.assertGreater(row.expires_at, now_utc() + timedelta(seconds=3000))
+
+    def test_abandoned_claim_can_be_taken_over_after_pending_ttl(self):
+        store.claim("s", "k", "fp1")
+        IdempotencyKey.objects.update(expires_at=now_utc() - timedelta(seconds=1))
+        self.assertEqual(store.claim("s", "k", "fp1").state, store.NEW)
+
+    def test_different_body_is_a_mismatch(self):
+        store.claim("s", "k", "fp1")
+        self.assertEqual(store.claim("s", "k", "fp2").state, store.MISMATCH)
+        store.complete("s", "k", 200, {}, "fp1")
+        self.assertEqual(store.claim("s", "k", "fp2").state, store.MISMATCH)
+
+    def test_failure_releases(self):
+        store.claim("s", "k", "fp1")
+        store.complete("s", "k", 500, {}, "fp1")
+        self.assertEqual(store.claim("s", "k", "fp1").state, store.NEW)
+
+    def test_purge_task_deletes_only_expired_rows(self):
+        from apps.core.tasks.purge_idempotency_keys import purge_idempotency_keys
+
+        for key in ("a", "b", "c"):
+            store.claim("s", key, "fp")
+        store.complete("s", "c", 200, {}, "fp")
+        IdempotencyKey.objects.exclude(digest=store.digest("s", "c")).update(expires_at=now_utc() - timedelta(seconds=1))
+        self.assertEqual(purge_idempotency_keys(), 2)
+        self.assertEqual(list(IdempotencyKey.objects.values_list("digest", flat=True)), [store.digest("s", "c")])
+
+    def test_purge_runs_in_batches_until_done(self):
+        for key in ("a", "b", "c"):
+            store.claim("s", key, "fp")
+        IdempotencyKey.objects.update(expires_at=now_utc() - timedelta(seconds=1))
+        self.assertEqual(store.purge_expired(batch=2), 3)
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+
+@override_settings(IDEMPOTENCY_TTL_SECONDS=3600, IDEMPOTENCY_PENDING_TTL_SECONDS=30)
+class RedisStoreTests(TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = mock.patch("apps.core.idempotency.store.get_redis", return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _ttl(self):
+        (key,) = self.redis.data
+        return self.redis.ttl(key)
+
+    def test_claim_ttl_then_complete_ttl(self):
+        self.assertEqual(store.claim("s", "k", "fp1").state, store.NEW)
+        self.assertLessEqual(self._ttl(), 30)
+        store.complete("s", "k", 201, {"id": 1}, "fp1")
+        self.assertGreater(self._ttl(), 3000)
+        self.assertEqual(store.claim("s", "k", "fp1").state, store.DONE)
+
+    def test_mismatch_and_release(self):
+        store.claim("s", "k", "fp1")
+        self.assertEqual(store.claim("s", "k", "fp2").state, store.MISMATCH)
+        self.assertEqual(store.claim("s", "k", "fp1").state, store.IN_PROGRESS)
+        store.release("s", "k")
+        self.assertEqual(store.claim("s", "k", "fp2").state, store.NEW)
+
+
+class WebhookDecoratorTests(TestCase):
+    def setUp(self):
+        patcher = mock.patch("apps.core.idempotency.store.get_redis", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.calls = 0
+
+        def view(request):
+            self.calls += 1
+            return HttpResponse("ok", status=201)
+
+        self.view = view
+        self.rf = RequestFactory()
+
+    def _post(self, wrapped, body=b'{"a":1}', **headers):
+        return wrapped(self.rf.post("/hook/", data=body, content_type="application/json",
+                                    HTTP_X_SHOPIFY_WEBHOOK_ID="w1", **headers))
+
+    def test_unsigned_requests_never_claim(self):
+        wrapped = idempotent_webhook("shopify", verify=lambda r: False)(self.view)
+        self.assertEqual(self._post(wrapped).status_code, 401)
+        self.assertEqual(self.calls, 0)
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+    def test_replay_and_body_mismatch(self):
+        wrapped = idempotent_webhook("shopify", verify=lambda r: True)(self.view)
+        self.assertEqual(self._post(wrapped).status_code, 201)
+        replay = self._post(wrapped)
+        self.assertEqual((replay.status_code, replay["Idempotent-Replayed"]), (201, "true"))
+        self.assertEqual(self._post(wrapped, body=b'{"a":2}').status_code, 422)
+        self.assertEqual(self.calls, 1)
@@ -0,0 +1,3 @@
+from .lead_admin import LeadAdmin
+
+__all__ = ["LeadAdmin"]
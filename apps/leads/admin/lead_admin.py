@@ -0,0 +1,50 @@
+from __future__ import annotations
+from typing import Optional
+
+from django.contrib import admin
+from django.db.models import Q
+
+from apps.core.admin.actions import run_in_background
+from apps.core.admin.base import LargeTableAdmin
+from apps.core.admin.search import is_email_like, is_id, is_phone_like, phone_prefix, prefix_q
+from apps.core.constants.statuses import LEAD_LOST, LEAD_OPEN, LEAD_PAUSED
+from apps.leads.models.lead import Lead
+from apps.leads.tasks.bulk_transition import bulk_transition
+
+
+@admin.register(Lead)
+class LeadAdmin(LargeTableAdmin):
+    list_display = ("id", "account", "contact", "source", "status", "created_at")
+    list_select_related = ("account", "contact")
+    list_filter = ("status",)
+    raw_id_fields = ("account", "contact")
+    readonly_fields = ("status",)  # changes go through guarded transitions (actions below)
+    search_help_text = "Lead id, contact email prefix, phone prefix or exact source."
+    actions = ["pause_leads", "resume_leads", "mark_lost"]
+
+    def search_q(self, term: str) -> Optional[Q]:
+        if is_id(term):
+            return Q(pk=int(term))
+        if is_email_like(term):
+            return prefix_q("contact__email", term)
+        if is_phone_like(term):
+            return Q(contact__phone__startswith=phone_prefix(term))
+        return Q(source=term) | prefix_q("contact__email", term)
+
+    def _transition(self, request, queryset, to: str) -> None:
+        run_in_background(self, request, queryset, "leads.bulk_transition", bulk_transition, to, label="leads")
+
+    @admin.action(description="Pause selected leads (background)")
+    def pause_leads(self, request, queryset):
+        self._transition(request, queryset, LEAD_PAUSED)
+
+    @admin.action(description="Resume selected leads (background)")
+    def resume_leads(self, request, queryset):
+        self._transition(request, queryset, LEAD_OPEN)
+
+    @admin.action(description="Mark selected leads lost (background)")
+    def mark_lost(self, request, queryset):
+        self._transition(request, queryset, LEAD_LOST)
+
+
+__all__ = ["LeadAdmin"]
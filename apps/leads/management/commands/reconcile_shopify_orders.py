@@ -0,0 +1,74 @@
+from __future__ import annotations
+import json
+from itertools import islice
+from typing import Iterator
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.models.account import Account
+from apps.leads.services.checkout_conversion import Order, convert_orders, resolve_leads
+
+
+def _read_orders(path: str) -> Iterator[Order]:
+    """
+    Accepts an Admin API dump: a JSON list, {"orders": [...]}, or NDJSON (one order per line).
+    """
+    with open(path, "r", encoding="utf-8") as fh:
+        head = fh.read(1)
+        fh.seek(0)
+        if head == "[" or head == "{":
+            try:
+                data = json.load(fh)
+            except ValueError:
+                fh.seek(0)
+                data = None
+            if data is not None:
+                if isinstance(data, dict):
+                    rows = data["orders"] if "orders" in data else [data]
+                else:
+                    rows = data
+                for row in rows:
+                    yield Order(row.get("checkout_token") or None, row.get("email") or None)
+                return
+        for line in fh:
+            line = line.strip()
+            if line:
+                row = json.loads(line)
+                yield Order(row.get("checkout_token") or None, row.get("email") or None)
+
+
+class Command(BaseCommand):
+    help = "Backfill LEAD_WON for abandoned-cart leads from a dump of Shopify orders (token match, email fallback)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="JSON or NDJSON file of Shopify orders.")
+        parser.add_argument("--account", required=True, help="Account id or shopify_domain.")
+        parser.add_argument("--chunk", type=int, default=1000, help="Orders resolved per query batch.")
+        parser.add_argument("--dry-run", action="store_true", help="Count matches without changing leads.")
+
+    def handle(self, *args, path: str, account: str, chunk: int, dry_run: bool, **opts):
+        acct = (
+            Account.objects.filter(pk=int(account)).first()
+            if account.isdigit()
+            else Account.objects.filter(shopify_domain=account.lower()).first()
+        )
+        if acct is None:
+            raise CommandError(f"unknown account: {account}")
+
+        orders = _read_orders(path)
+        seen = matched = converted = 0
+        while True:
+            batch = list(islice(orders, max(1, chunk)))
+            if not batch:
+                break
+            seen += len(batch)
+            if dry_run:
+                matched += len(set(resolve_leads(acct.pk, batch).values()))
+            else:
+                converted += len(convert_orders(acct.pk, batch))
+            self.stdout.write(f"{seen} orders processed")
+
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS(f"dry-run: {seen} orders, {matched} lead(s) would be considered"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"done: {seen} orders, {converted} lead(s) marked won"))
@@ -0,0 +1,4 @@
+from .lead import Lead
+from .checkout_token import CheckoutToken
+
+__all__ = ["Lead", "CheckoutToken"]
@@ -0,0 +1,30 @@
+from __future__ import annotations
+from django.db import models
+
+
+class CheckoutToken(models.Model):
+    """
+    Maps a Shopify checkout token to the abandoned-cart Lead created for it,
+    so order webhooks convert leads with one index hit instead of a JSON scan
+    over Lead.metadata. `email` (lowercased) backs the fallback match.
+    """
+    account = models.ForeignKey("accounts.Account", on_delete=models.CASCADE, related_name="checkout_tokens")
+    checkout_token = models.CharField(max_length=64)
+    lead = models.ForeignKey("leads.Lead", on_delete=models.CASCADE, related_name="checkout_tokens")
+    email = models.EmailField(max_length=254, blank=True, default="")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = "leads"
+        constraints = [
+            models.UniqueConstraint(fields=["account", "checkout_token"], name="unique_checkout_token_per_account"),
+        ]
+        indexes = [
+            models.Index(fields=["account", "email", "-created_at"]),
+        ]
+        verbose_name = "Checkout Token"
+        verbose_name_plural = "Checkout Tokens"
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.checkout_token} -> Lead<{self.lead_id}>"
@@ -1,4 +1,5 @@
 from django.db import models
+from apps.core.constants.statuses import LEAD_OPEN
 
 
 class Lead(models.Model):
@@ -22,8 +23,8 @@ class Lead(models.Model):
     # Where did this lead originate? e.g., "web_form", "abandoned_cart", "manual"
     source = models.CharField(max_length=64, db_index=True)
 
-    # Simple lifecycle; extend later (e.g., "new", "messaged", "replied", "converted")
-    status = models.CharField(max_length=32, default="new", db_index=True)
+    # Lifecycle: LEAD_* in apps.core.constants.statuses; change via apps.leads.services.transitions
+    status = models.CharField(max_length=32, default=LEAD_OPEN, db_index=True)
 
     # Flexible blob for extra attributes (UTM params, cart items, custom fields)
     metadata = models.JSONField(blank=True, null=True, default=dict)
@@ -38,6 +39,8 @@ class Lead(models.Model):
         indexes = [
             models.Index(fields=["source"]),
             models.Index(fields=["status"]),
+            # Admin: a tenant's leads, newest first
+            models.Index(fields=["account", "-id"], name="lead_account_recent_idx"),
         ]
 
     def __str__(self) -> str:
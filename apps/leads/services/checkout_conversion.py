@@ -0,0 +1,104 @@
+"""
+Shopify abandoned-checkout → order conversion.
+
+record_checkout() writes the (account, checkout_token) → lead mapping at
+abandoned-checkout ingest. convert_orders() resolves a batch of orders to leads
+with one token query (unique index) plus one email query for the leftovers,
+then closes them as LEAD_WON with a single guarded transition (which also
+cancels their pending sequence steps).
+"""
+
+from __future__ import annotations
+from datetime import timedelta
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .close_lead import close_won
+
+
+class Order(NamedTuple):
+    checkout_token: Optional[str]
+    email: Optional[str]
+
+
+def record_checkout(account, checkout_token: str, lead, email: str = "") -> bool:
+    """
+    Map a checkout token to its lead. Returns False if the token was already mapped.
+    """
+    from apps.leads.models.checkout_token import CheckoutToken
+
+    try:
+        with transaction.atomic():
+            CheckoutToken.objects.create(
+                account=account, checkout_token=checkout_token, lead=lead, email=(email or "").strip().lower()
+            )
+        return True
+    except IntegrityError:
+        return False
+
+
+def lead_for_token(account_id: int, checkout_token: str) -> Optional[int]:
+    from apps.leads.models.checkout_token import CheckoutToken
+
+    return (
+        CheckoutToken.objects.filter(account_id=account_id, checkout_token=checkout_token)
+        .values_list("lead_id", flat=True)
+        .first()
+    )
+
+
+def resolve_leads(account_id: int, orders: Sequence[Order]) -> Dict[int, int]:
+    """
+    Map order index -> lead id. Token matches first; orders without a token match
+    fall back to the newest checkout for the same email within SHOPIFY_EMAIL_MATCH_DAYS.
+    """
+    from apps.leads.models.checkout_token import CheckoutToken
+
+    out: Dict[int, int] = {}
+    tokens = {o.checkout_token for o in orders if o.checkout_token}
+    by_token = dict(
+        CheckoutToken.objects.filter(account_id=account_id, checkout_token__in=list(tokens))
+        .values_list("checkout_token", "lead_id")
+    ) if tokens else {}
+
+    leftovers: Dict[str, List[int]] = {}
+    for i, o in enumerate(orders):
+        lead_id = by_token.get(o.checkout_token) if o.checkout_token else None
+        if lead_id is not None:
+            out[i] = lead_id
+        elif o.email:
+            leftovers.setdefault(o.email.strip().lower(), []).append(i)
+
+    if leftovers:
+        days = int(getattr(settings, "SHOPIFY_EMAIL_MATCH_DAYS", 30))
+        since = timezone.now() - timedelta(days=days)
+        rows = (
+            CheckoutToken.objects.filter(account_id=account_id, email__in=list(leftovers), created_at__gte=since)
+            .order_by("email", "-created_at")
+            .values_list("email", "lead_id")
+        )
+        newest: Dict[str, int] = {}
+        for email, lead_id in rows:
+            newest.setdefault(email, lead_id)
+        for email, idxs in leftovers.items():
+            if email in newest:
+                for i in idxs:
+                    out[i] = newest[email]
+    return out
+
+
+def convert_orders(account_id: int, orders: Iterable[Order]) -> List[int]:
+    """
+    Mark the abandoned-cart leads behind `orders` as won. Returns lead ids that changed.
+    """
+    orders = list(orders)
+    matched = resolve_leads(account_id, orders)
+    if not matched:
+        return []
+    return close_won(sorted(set(matched.values())), account_id=account_id)
+
+
+__all__ = ["Order", "record_checkout", "lead_for_token", "resolve_leads", "convert_orders"]
@@ -0,0 +1,22 @@
+from __future__ import annotations
+from typing import Any, List, Optional
+
+from apps.core.constants.statuses import LEAD_LOST, LEAD_WON
+from .transitions import transition
+
+
+def close_won(leads: Any, account_id: Optional[int] = None) -> List[int]:
+    """
+    Converted (e.g. order placed). Stops the sequence. Returns the ids that changed.
+    """
+    return transition(leads, LEAD_WON, account_id=account_id)
+
+
+def close_lost(leads: Any, account_id: Optional[int] = None) -> List[int]:
+    """
+    Closed without conversion — e.g. a churned campaign's whole queryset in one statement.
+    Returns the ids that changed.
+    """
+    return transition(leads, LEAD_LOST, account_id=account_id)
+
+__all__ = ["close_won", "close_lost"]
@@ -0,0 +1,31 @@
+from __future__ import annotations
+from typing import Any, Dict, Optional
+
+from django.db import transaction
+
+from apps.core.activity import stream as activity
+from apps.core.constants.statuses import LEAD_OPEN
+from apps.core.metering import meter
+
+
+def create_lead(account, contact, source: str, metadata: Optional[Dict[str, Any]] = None):
+    """
+    Create a new lead in the LEAD_OPEN state (a single INSERT).
+    Counted against the account's usage (and shown on its activity feed) once the transaction commits.
+    """
+    from apps.leads.models.lead import Lead
+
+    lead = Lead.objects.create(
+        account=account,
+        contact=contact,
+        source=source,
+        status=LEAD_OPEN,
+        metadata=metadata or {},
+    )
+    transaction.on_commit(lambda: meter.incr(account.pk, meter.LEADS_INGESTED))
+    transaction.on_commit(lambda: activity.publish(account.pk, activity.LEAD_CREATED, {
+        "lead_id": lead.pk, "contact_id": contact.pk, "source": source,
+    }))
+    return lead
+
+__all__ = ["create_lead"]
@@ -0,0 +1,31 @@
+from __future__ import annotations
+from typing import Any, List, Optional
+
+from django.db import transaction
+
+from apps.core.activity import stream as activity
+from apps.core.constants.statuses import LEAD_REPLY
+from .transitions import transition
+
+
+def mark_replied(leads: Any, account_id: Optional[int] = None) -> List[int]:
+    """
+    Customer replied: move open/paused leads to 'reply' and cancel their pending steps.
+    Returns the ids that changed (reported to each account's activity feed after commit).
+    """
+    moved = transition(leads, LEAD_REPLY, account_id=account_id)
+    if moved:
+        transaction.on_commit(lambda: _publish(moved, account_id))
+    return moved
+
+
+def _publish(lead_ids: List[int], account_id: Optional[int]) -> None:
+    if account_id is not None:
+        pairs = [(lead_id, account_id) for lead_id in lead_ids]
+    else:
+        from apps.leads.models.lead import Lead
+
+        pairs = list(Lead.objects.filter(pk__in=lead_ids).values_list("id", "account_id"))
+    activity.publish_many((acct, activity.REPLY_RECEIVED, {"lead_id": lead_id}) for lead_id, acct in pairs)
+
+__all__ = ["mark_replied"]
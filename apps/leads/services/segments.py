@@ -0,0 +1,243 @@
+"""
+Segment filter DSL over Lead, its Contact and Lead.metadata, compiled to one queryset.
+
+  source = abandoned_cart, status = lost, created within 90d, cart_value > 50
+
+Clauses are joined by "," or "and" (all must match). A clause is `field op value`:
+  fields   source, status, created (created_at), updated (updated_at),
+           email / name / phone (the lead's Contact; also contact.email etc.),
+           metadata.<key>[.<key>...]; any other bare name is a metadata key
+  ops      = != > >= < <= ~ (contains, case-insensitive) in (a, b) | not in (a, b)
+           within <N>d|h|m (datetime fields only: "in the last N days")
+  values   bare words, numbers, 'quoted strings', ISO dates, relative times (-90d)
+Metadata compared against a number is compared numerically; non-numeric values
+never match (they don't error). Everything else compares as text.
+"""
+
+from __future__ import annotations
+import re
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from django.db.models import Case, F, FloatField, Q, QuerySet, TextField, When
+from django.db.models.fields.json import KT
+from django.db.models.functions import Cast
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+
+class SegmentError(ValueError):
+    """Invalid segment expression."""
+
+
+class Segment(NamedTuple):
+    text: str
+    q: Q
+    aliases: Dict[str, Any]
+
+    def apply(self, qs: QuerySet) -> QuerySet:
+        return qs.alias(**self.aliases).filter(self.q) if self.aliases else qs.filter(self.q)
+
+
+_LEAD_FIELDS = {"source": "source", "status": "status"}
+_DATE_FIELDS = {"created": "created_at", "created_at": "created_at", "updated": "updated_at", "updated_at": "updated_at"}
+_CONTACT_FIELDS = {"email": "contact__email", "name": "contact__name", "phone": "contact__phone"}
+
+_RANGE = {">": "gt", ">=": "gte", "<": "lt", "<=": "lte"}
+_NUMERIC = re.compile(r"^-?\d+(\.\d+)?$")
+_NUMERIC_SQL = r"^-?[0-9]+(\.[0-9]+)?$"
+_DURATION = re.compile(r"^(\d+)([dhm])$")
+
+_KIND_NAMES = {"word": "a name or value", "str": "a quoted string", "op": "an operator", "punct": "',' or '('", "kw": "a keyword"}
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<str>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<op>!=|>=|<=|=|>|<|~)
+      | (?P<punct>[(),])
+      | (?P<word>[^\s(),=!<>~'"]+)
+    )""",
+    re.VERBOSE,
+)
+
+
+def _tokenize(text: str) -> List[Tuple[str, str]]:
+    tokens: List[Tuple[str, str]] = []
+    pos = 0
+    text = text.strip()
+    while pos < len(text):
+        m = _TOKEN.match(text, pos)
+        if not m or m.end() == pos:
+            raise SegmentError(f"unexpected input at {pos}: {text[pos:pos + 20]!r}")
+        pos = m.end()
+        kind = m.lastgroup
+        value = m.group(kind)
+        if kind == "str":
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        elif kind == "word" and value.lower() in ("and", "in", "not", "within"):
+            kind, value = "kw", value.lower()
+        tokens.append((kind, value))
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text: str) -> None:
+        self.tokens = _tokenize(text)
+        self.i = 0
+        self.aliases: Dict[str, Any] = {}
+
+    def peek(self) -> Optional[Tuple[str, str]]:
+        return self.tokens[self.i] if self.i < len(self.tokens) else None
+
+    def take(self, *kinds: str) -> Tuple[str, str]:
+        tok = self.peek()
+        if tok is None or tok[0] not in kinds:
+            found = repr(tok[1]) if tok else "end of input"
+            raise SegmentError(f"expected {' or '.join(_KIND_NAMES[k] for k in kinds)}, found {found}")
+        self.i += 1
+        return tok
+
+    def parse(self) -> Q:
+        q = self.clause()
+        while self.peek() is not None:
+            tok = self.peek()
+            if tok not in (("punct", ","), ("kw", "and")):
+                raise SegmentError(f"expected ',' or 'and', found {tok[1]!r}")
+            self.i += 1
+            q &= self.clause()
+        return q
+
+    def value(self) -> str:
+        return self.take("word", "str")[1]
+
+    def clause(self) -> Q:
+        field = self.take("word")[1]
+        tok = self.take("op", "kw")
+        if tok == ("kw", "not"):
+            if self.take("kw")[1] != "in":
+                raise SegmentError("expected 'in' after 'not'")
+            return ~self._in(field)
+        if tok == ("kw", "in"):
+            return self._in(field)
+        if tok == ("kw", "within"):
+            return self._within(field, self.value())
+        if tok[0] != "op":
+            raise SegmentError(f"expected an operator after {field!r}")
+        return self._compare(field, tok[1], self.value())
+
+    def _in(self, field: str) -> Q:
+        self.take("punct")
+        values = [self.value()]
+        while self.peek() == ("punct", ","):
+            self.i += 1
+            values.append(self.value())
+        if self.take("punct")[1] != ")":
+            raise SegmentError("expected ')'")
+        return Q(**{f"{self._text_path(field)}__in": values})
+
+    def _within(self, field: str, raw: str) -> Q:
+        if field not in _DATE_FIELDS:
+            raise SegmentError(f"'within' needs a date field, not {field!r}")
+        return Q(**{f"{_DATE_FIELDS[field]}__gte": timezone.now() - _duration(raw)})
+
+    def _compare(self, field: str, op: str, raw: str) -> Q:
+        if field in _DATE_FIELDS:
+            if op == "~":
+                raise SegmentError("'~' is not supported on dates")
+            path, value = _DATE_FIELDS[field], _when(raw)
+        elif _is_metadata(field) and _NUMERIC.match(raw) and op != "~":
+            path, value = self._numeric_alias(field), float(raw)
+        else:
+            path, value = self._text_path(field), raw
+            if op in _RANGE and _NUMERIC.match(raw):
+                raise SegmentError(f"numeric comparison on text field {field!r}")
+
+        if op == "=":
+            return Q(**{path: value})
+        if op == "!=":
+            return ~Q(**{path: value})
+        if op == "~":
+            return Q(**{f"{path}__icontains": value})
+        return Q(**{f"{path}__{_RANGE[op]}": value})
+
+    def _text_path(self, field: str) -> str:
+        if field in _LEAD_FIELDS:
+            return _LEAD_FIELDS[field]
+        if field.startswith("contact."):
+            if field[len("contact."):] not in _CONTACT_FIELDS:
+                raise SegmentError(f"unknown contact field: {field!r}")
+            return _CONTACT_FIELDS[field[len("contact."):]]
+        if field in _CONTACT_FIELDS:
+            return _CONTACT_FIELDS[field]
+        if field in _DATE_FIELDS:
+            raise SegmentError(f"use a comparison or 'within' for {field!r}")
+        alias = f"_seg_t{len(self.aliases)}"
+        # Cast: KT's own exact lookup JSON-encodes the value on SQLite/MySQL ("malformed JSON").
+        self.aliases[alias] = Cast(KT(_metadata_path(field)), TextField())
+        return alias
+
+    def _numeric_alias(self, field: str) -> str:
+        text = self._text_path(field)
+        alias = f"_seg_n{len(self.aliases)}"
+        # CASE guards the cast so non-numeric values become NULL instead of a DB error.
+        self.aliases[alias] = Case(
+            When(**{f"{text}__regex": _NUMERIC_SQL}, then=Cast(F(text), FloatField())),
+            default=None,
+            output_field=FloatField(),
+        )
+        return alias
+
+
+def _is_metadata(field: str) -> bool:
+    return field not in _LEAD_FIELDS and field not in _DATE_FIELDS and field not in _CONTACT_FIELDS and not field.startswith("contact.")
+
+
+def _metadata_path(field: str) -> str:
+    keys = field[len("metadata."):].split(".") if field.startswith("metadata.") else field.split(".")
+    if not all(re.match(r"^\w+$", k) for k in keys):
+        raise SegmentError(f"invalid metadata key: {field!r}")
+    return "__".join(["metadata", *keys])
+
+
+def _duration(raw: str) -> timedelta:
+    m = _DURATION.match(raw.lstrip("-"))
+    if not m:
+        raise SegmentError(f"invalid duration {raw!r} (use e.g. 90d, 12h, 30m)")
+    n, unit = int(m.group(1)), m.group(2)
+    return {"d": timedelta(days=n), "h": timedelta(hours=n), "m": timedelta(minutes=n)}[unit]
+
+
+def _when(raw: str) -> datetime:
+    if raw.startswith("-"):
+        return timezone.now() - _duration(raw)
+    dt = parse_datetime(raw)
+    if dt is None:
+        d = parse_date(raw)
+        if d is None:
+            raise SegmentError(f"invalid date {raw!r} (use ISO 8601 or -90d)")
+        dt = datetime(d.year, d.month, d.day)
+    return dt if timezone.is_aware(dt) else timezone.make_aware(dt, dt_timezone.utc)
+
+
+def compile_segment(text: str) -> Segment:
+    """
+    Parse `text` into a Segment. Raises SegmentError on invalid input.
+    """
+    if not text or not text.strip():
+        raise SegmentError("empty segment")
+    parser = _Parser(text)
+    q = parser.parse()
+    return Segment(text, q, parser.aliases)
+
+
+def segment_leads(account_id: int, segment: str | Segment) -> QuerySet:
+    """
+    Leads of `account_id` matching `segment`, unordered (ready for count/INSERT ... SELECT).
+    """
+    from apps.leads.models.lead import Lead
+
+    seg = compile_segment(segment) if isinstance(segment, str) else segment
+    return seg.apply(Lead.objects.filter(account_id=account_id)).order_by()
+
+
+__all__ = ["SegmentError", "Segment", "compile_segment", "segment_leads"]
@@ -0,0 +1,119 @@
+"""
+Guarded, set-based Lead status transitions.
+
+Every transition is a conditional UPDATE ... WHERE status IN (<allowed from-states>),
+so it can't race the scheduler or another transition (no read-modify-write save()).
+Transitions that take a lead out of its sequence cancel its pending ScheduledSteps
+in the same transaction. Works on one lead, a list of ids, or a whole queryset,
+and returns the ids that actually moved.
+
+On Postgres this is a single statement (data-modifying CTE); elsewhere the
+candidate rows are locked, updated and their steps cancelled in chunks.
+"""
+
+from __future__ import annotations
+from typing import Any, FrozenSet, Iterable, List, Optional
+
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from apps.core.constants.statuses import (
+    LEAD_LOST, LEAD_OPEN, LEAD_PAUSED, LEAD_REPLY, LEAD_WON,
+    STEP_CANCELLED, STEP_PENDING,
+)
+from apps.sequences.scheduler.stop_rules import ACTIVE_LEAD_STATUSES
+
+_ACTIVE = ACTIVE_LEAD_STATUSES
+
+# to-state -> allowed from-states
+ALLOWED_FROM = {
+    LEAD_OPEN:   frozenset({LEAD_PAUSED, LEAD_LOST}),                       # resume / re-engage
+    LEAD_PAUSED: _ACTIVE,
+    LEAD_REPLY:  _ACTIVE | {LEAD_PAUSED},
+    LEAD_WON:    _ACTIVE | {LEAD_PAUSED, LEAD_REPLY, LEAD_LOST},            # late orders still convert
+    LEAD_LOST:   _ACTIVE | {LEAD_PAUSED, LEAD_REPLY},
+}
+
+# Transitions that stop the lead's sequence
+STOPS_SEQUENCE = frozenset({LEAD_PAUSED, LEAD_REPLY, LEAD_WON, LEAD_LOST})
+
+CHUNK = 5000
+
+
+def _queryset(leads: Any, account_id: Optional[int]) -> QuerySet:
+    from apps.leads.models.lead import Lead
+
+    if isinstance(leads, QuerySet):
+        qs = leads
+    elif isinstance(leads, Lead):
+        qs = Lead.objects.filter(pk=leads.pk)
+    elif isinstance(leads, int):
+        qs = Lead.objects.filter(pk=leads)
+    else:
+        qs = Lead.objects.filter(pk__in=list(leads))
+    if account_id is not None:
+        qs = qs.filter(account_id=account_id)
+    return qs
+
+
+def _transition_postgres(qs: QuerySet, to: str, from_states: FrozenSet[str], cancel: bool) -> List[int]:
+    from apps.sequences.models.scheduled_step import ScheduledStep
+
+    lead_table = qs.model._meta.db_table
+    step_table = ScheduledStep._meta.db_table
+    sub_sql, sub_params = qs.order_by().values("pk").query.sql_with_params()
+    in_sql = ", ".join(["%s"] * len(from_states))
+
+    sql = (
+        f"WITH moved AS ("
+        f" UPDATE {lead_table} SET status = %s, updated_at = %s"
+        f" WHERE id IN ({sub_sql}) AND status IN ({in_sql})"
+        f" RETURNING id)"
+    )
+    params: list = [to, timezone.now(), *sub_params, *sorted(from_states)]
+    if cancel:
+        sql += (
+            f", cancelled AS ("
+            f" UPDATE {step_table} s SET status = %s, updated_at = %s"
+            f" FROM moved WHERE s.lead_id = moved.id AND s.status = %s)"
+        )
+        params += [STEP_CANCELLED, timezone.now(), STEP_PENDING]
+    sql += " SELECT id FROM moved"
+
+    with connection.cursor() as cur:
+        cur.execute(sql, params)
+        return [r[0] for r in cur.fetchall()]
+
+
+def _transition_generic(qs: QuerySet, to: str, from_states: FrozenSet[str], cancel: bool) -> List[int]:
+    from apps.sequences.models.scheduled_step import ScheduledStep
+
+    ids = list(qs.filter(status__in=from_states).select_for_update().values_list("pk", flat=True))
+    now = timezone.now()
+    for i in range(0, len(ids), CHUNK):
+        chunk = ids[i:i + CHUNK]
+        qs.model.objects.filter(pk__in=chunk, status__in=from_states).update(status=to, updated_at=now)
+        if cancel:
+            ScheduledStep.objects.filter(lead_id__in=chunk, status=STEP_PENDING).update(
+                status=STEP_CANCELLED, updated_at=now
+            )
+    return ids
+
+
+def transition(leads: Any, to: str, account_id: Optional[int] = None) -> List[int]:
+    """
+    Move `leads` (Lead | id | iterable of ids | QuerySet) to status `to`.
+    Only leads currently in an allowed from-state change; returns their ids.
+    Pass `account_id` to scope the update to one tenant.
+    """
+    if to not in ALLOWED_FROM:
+        raise ValueError(f"unknown lead status: {to!r}")
+    qs = _queryset(leads, account_id)
+    cancel = to in STOPS_SEQUENCE
+    apply = _transition_postgres if connection.vendor == "postgresql" else _transition_generic
+    with transaction.atomic():
+        return apply(qs, to, ALLOWED_FROM[to], cancel)
+
+
+__all__ = ["ALLOWED_FROM", "STOPS_SEQUENCE", "transition"]
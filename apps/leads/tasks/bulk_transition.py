@@ -0,0 +1,22 @@
+from __future__ import annotations
+from typing import List, Optional
+
+try:
+    from celery import shared_task  # type: ignore
+except Exception:  # pragma: no cover (import guard)
+    shared_task = None  # type: ignore
+
+from apps.leads.services.transitions import transition
+
+
+def bulk_transition(lead_ids: List[int], to: str, account_id: Optional[int] = None) -> int:
+    """
+    Move a chunk of leads to `to` (guarded; see transitions). Used by admin bulk actions.
+    """
+    return len(transition(lead_ids, to, account_id=account_id))
+
+
+if shared_task is not None:
+    bulk_transition_task = shared_task(name="leads.bulk_transition")(bulk_transition)
+
+__all__ = ["bulk_transition"]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+from datetime import timedelta
+
+from django.test import SimpleTestCase, TestCase
+
+from apps.accounts.models.account import Account
+from apps.contacts.models.contact import Contact
+from apps.core.constants.statuses import LEAD_LOST, LEAD_OPEN
+from apps.leads.models.lead import Lead
+from apps.leads.services.segments import SegmentError, compile_segment, segment_leads
+
+
+class SegmentParseTests(SimpleTestCase):
+    def test_rejects_invalid_expressions(self):
+        for text in (
+            "",
+            "source",
+            "source = ",
+            "source = a b",
+            "status in (lost",
+            "status not (lost)",
+            "source within 9d",
+            "created within soon",
+            "created ~ 2024",
+            "created = yesterday",
+            "status > 5",
+            "contact.address = x",
+            "metadata.bad-key = 1",
+            "source = 'unterminated",
+        ):
+            with self.subTest(text=text), self.assertRaises(SegmentError):
+                compile_segment(text)
+
+    def test_separators_and_quoting(self):
+        a = compile_segment("source = web_form, status = lost")
+        b = compile_segment("source = web_form AND status = lost")
+        self.assertEqual(str(a.q), str(b.q))
+        self.assertIn("it's here", str(compile_segment(r"name = 'it\'s here'").q))
+
+
+class SegmentQueryTests(TestCase):
+    def setUp(self):
+        self.account = Account.objects.create(api_key="k1", name="A", sender_email="a@example.com")
+        other = Account.objects.create(api_key="k2", name="B", sender_email="b@example.com")
+        self.cart = self._lead("cart@shop.test", "abandoned_cart", LEAD_LOST, {"cart_value": "75.5", "utm": {"source": "google"}})
+        self.small = self._lead("small@shop.test", "abandoned_cart", LEAD_LOST, {"cart_value": 20})
+        self.junk = self._lead("junk@shop.test", "abandoned_cart", LEAD_OPEN, {"cart_value": "n/a"})
+        self.form = self._lead("Form@Example.com", "web_form", LEAD_OPEN, {}, name="Ada Lovelace")
+        self._lead("theirs@shop.test", "abandoned_cart", LEAD_LOST, {"cart_value": 500}, account=other)
+        Lead.objects.filter(pk=self.small.pk).update(created_at=self.small.created_at - timedelta(days=200))
+
+    def _lead(self, email, source, status, metadata, name="", account=None):
+        account = account or self.account
+        contact = Contact.objects.create(account=account, email=email, name=name)
+        return Lead.objects.create(account=account, contact=contact, source=source, status=status, metadata=metadata)
+
+    def _ids(self, text):
+        return set(segment_leads(self.account.pk, text).values_list("pk", flat=True))
+
+    def test_lead_fields_and_account_scope(self):
+        self.assertEqual(self._ids("source = abandoned_cart, status = lost"), {self.cart.pk, self.small.pk})
+        self.assertEqual(self._ids("status in (open, paused)"), {self.junk.pk, self.form.pk})
+        self.assertEqual(self._ids("status not in (lost)"), {self.junk.pk, self.form.pk})
+        self.assertEqual(self._ids("source != web_form"), {self.cart.pk, self.small.pk, self.junk.pk})
+
+    def test_created_within_and_relative_dates(self):
+        self.assertEqual(self._ids("source = abandoned_cart and created within 90d"), {self.cart.pk, self.junk.pk})
+        self.assertEqual(self._ids("created < -90d"), {self.small.pk})
+        self.assertEqual(self._ids("created >= 2000-01-01"), {self.cart.pk, self.small.pk, self.junk.pk, self.form.pk})
+
+    def test_numeric_metadata_skips_non_numeric_values(self):
+        self.assertEqual(self._ids("cart_value > 50"), {self.cart.pk})
+        self.assertEqual(self._ids("metadata.cart_value <= 50"), {self.small.pk})
+        self.assertEqual(self._ids("cart_value = n/a"), {self.junk.pk})
+
+    def test_nested_metadata_and_contact_fields(self):
+        self.assertEqual(self._ids("utm.source = google"), {self.cart.pk})
+        self.assertEqual(self._ids("email ~ example.com"), {self.form.pk})
+        self.assertEqual(self._ids("contact.name ~ 'ada love'"), {self.form.pk})
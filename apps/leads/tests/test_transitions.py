@@ -0,0 +1,91 @@
+from __future__ import annotations
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.accounts.models.account import Account
+from apps.contacts.models.contact import Contact
+from apps.core.constants.statuses import (
+    LEAD_LOST, LEAD_NEW, LEAD_OPEN, LEAD_PAUSED, LEAD_REPLY, LEAD_WON,
+    STEP_CANCELLED, STEP_DONE, STEP_PENDING,
+)
+from apps.leads.models.lead import Lead
+from apps.leads.services.close_lead import close_lost, close_won
+from apps.leads.services.mark_replied import mark_replied
+from apps.leads.services.transitions import transition
+from apps.sequences.models.scheduled_step import ScheduledStep
+from apps.sequences.models.sequence import Sequence
+
+
+class TransitionTests(TestCase):
+    def setUp(self):
+        self.account = Account.objects.create(api_key="k1", name="A", sender_email="a@example.com")
+        self.other = Account.objects.create(api_key="k2", name="B", sender_email="b@example.com")
+        self.sequence = Sequence.objects.create(account=self.account, steps=[])
+        self.n = 0
+
+    def _lead(self, status=LEAD_OPEN, account=None, steps=()):
+        account = account or self.account
+        self.n += 1
+        contact = Contact.objects.create(account=account, email=f"c{self.n}@example.com")
+        lead = Lead.objects.create(account=account, contact=contact, source="web_form", status=status)
+        for i, step_status in enumerate(steps):
+            ScheduledStep.objects.create(
+                account=account, lead=lead, sequence=self.sequence, step_index=i, channel="email",
+                template="t", run_at=timezone.now() + timedelta(hours=i), status=step_status,
+            )
+        return lead
+
+    def _status(self, lead):
+        return Lead.objects.values_list("status", flat=True).get(pk=lead.pk)
+
+    def _steps(self, lead):
+        return list(ScheduledStep.objects.filter(lead=lead).order_by("step_index").values_list("status", flat=True))
+
+    def test_only_allowed_from_states_move(self):
+        open_, won, paused = self._lead(LEAD_OPEN), self._lead(LEAD_WON), self._lead(LEAD_PAUSED)
+        moved = transition([open_.pk, won.pk, paused.pk], LEAD_REPLY)
+        self.assertCountEqual(moved, [open_.pk, paused.pk])
+        self.assertEqual(self._status(won), LEAD_WON)
+
+    def test_legacy_new_counts_as_active(self):
+        lead = self._lead(LEAD_NEW)
+        self.assertEqual(transition(lead, LEAD_PAUSED), [lead.pk])
+
+    def test_stopping_transition_cancels_only_pending_steps(self):
+        lead = self._lead(steps=[STEP_DONE, STEP_PENDING, STEP_PENDING])
+        bystander = self._lead(steps=[STEP_PENDING])
+        mark_replied(lead)
+        self.assertEqual(self._steps(lead), [STEP_DONE, STEP_CANCELLED, STEP_CANCELLED])
+        self.assertEqual(self._steps(bystander), [STEP_PENDING])
+
+    def test_resume_does_not_cancel_steps(self):
+        lead = self._lead(LEAD_PAUSED, steps=[STEP_PENDING])
+        self.assertEqual(transition(lead, LEAD_OPEN), [lead.pk])
+        self.assertEqual(self._steps(lead), [STEP_PENDING])
+
+    def test_rejected_transition_leaves_steps_alone(self):
+        lead = self._lead(LEAD_WON, steps=[STEP_PENDING])
+        self.assertEqual(close_lost(lead), [])
+        self.assertEqual(self._steps(lead), [STEP_PENDING])
+
+    def test_late_order_converts_a_lost_lead(self):
+        lead = self._lead(LEAD_LOST)
+        self.assertEqual(close_won(lead), [lead.pk])
+
+    def test_queryset_and_account_scope(self):
+        mine = [self._lead() for _ in range(3)]
+        theirs = self._lead(account=self.other)
+        moved = close_lost(Lead.objects.all(), account_id=self.account.pk)
+        self.assertCountEqual(moved, [l.pk for l in mine])
+        self.assertEqual(self._status(theirs), LEAD_OPEN)
+
+    def test_repeating_a_transition_is_a_no_op(self):
+        lead = self._lead()
+        self.assertEqual(mark_replied(lead), [lead.pk])
+        self.assertEqual(mark_replied(lead), [])
+
+    def test_unknown_status_is_rejected(self):
+        with self.assertRaises(ValueError):
+            transition(self._lead(), "archived")
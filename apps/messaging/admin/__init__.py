@@ -0,0 +1,3 @@
+from .message_admin import MessageAdmin
+
+__all__ = ["MessageAdmin"]
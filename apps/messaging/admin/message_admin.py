@@ -0,0 +1,83 @@
+from __future__ import annotations
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.contrib import admin
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.core.admin.base import LargeTableAdmin
+from apps.core.admin.search import is_email_like, is_id, is_phone_like, phone_prefix, prefix_q
+from apps.messaging.models.message import Message
+
+PROVIDERS = ("sendgrid", "twilio")
+
+
+class CreatedWindowFilter(admin.SimpleListFilter):
+    """
+    Bounds the list to recent created_at by default so Postgres only scans the newest
+    monthly partitions; "All time" opts back into the full table.
+    """
+    title = "created"
+    parameter_name = "created_window"
+    CHOICES = (("7", "Last 7 days"), ("30", "Last 30 days"), ("365", "Last year"), ("all", "All time"))
+
+    def default_days(self) -> int:
+        return int(getattr(settings, "ADMIN_MESSAGE_WINDOW_DAYS", 90))
+
+    def lookups(self, request, model_admin):
+        return self.CHOICES
+
+    def choices(self, changelist):
+        yield {
+            "selected": self.value() is None,
+            "query_string": changelist.get_query_string(remove=[self.parameter_name]),
+            "display": f"Last {self.default_days()} days",
+        }
+        for lookup, title in self.lookup_choices:
+            yield {
+                "selected": self.value() == lookup,
+                "query_string": changelist.get_query_string({self.parameter_name: lookup}),
+                "display": title,
+            }
+
+    def queryset(self, request, queryset):
+        value = self.value()
+        if value == "all":
+            return queryset
+        days = int(value) if value and value.isdigit() else self.default_days()
+        return queryset.filter(created_at__gte=timezone.now() - timedelta(days=days))
+
+
+@admin.register(Message)
+class MessageAdmin(LargeTableAdmin):
+    """
+    Open a tenant's messages from the Account admin (?account__id__exact=<id>):
+    served by the (account, -id) index, newest first, 50 rows, no exact count.
+    Bodies are never loaded on the list page, and the list is bounded to recent
+    created_at unless "All time" is picked (partition pruning).
+    """
+    list_display = ("id", "account", "contact", "channel", "direction", "status", "provider", "created_at")
+    list_select_related = ("account", "contact")
+    list_filter = (CreatedWindowFilter, "channel", "direction", "status")
+    raw_id_fields = ("account", "contact", "lead", "body_ref")
+    readonly_fields = ("body_text",)
+    list_per_page = 50
+    search_help_text = "Message id, provider message id, contact email prefix or phone prefix."
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer("body", "error")
+
+    def search_q(self, term: str) -> Optional[Q]:
+        if is_id(term):
+            return Q(pk=int(term))
+        if is_email_like(term):
+            return prefix_q("contact__email", term)
+        if is_phone_like(term):
+            return Q(contact__phone__startswith=phone_prefix(term))
+        # provider IN (...) lets the (provider, provider_message_id) index serve an id-only lookup
+        return Q(provider__in=PROVIDERS, provider_message_id=term)
+
+
+__all__ = ["CreatedWindowFilter", "MessageAdmin"]
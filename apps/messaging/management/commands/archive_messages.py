@@ -0,0 +1,41 @@
+from __future__ import annotations
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.messaging.services import partitions
+from apps.messaging.services.archive_messages import archive_expired, expired_partitions
+
+
+class Command(BaseCommand):
+    help = "Stream Message partitions older than the retention window to compressed NDJSON, then drop them."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--keep-months", type=int, default=getattr(settings, "MESSAGE_RETENTION_MONTHS", 12),
+            help="Whole months to keep online.",
+        )
+        parser.add_argument("--out", default="archive/messages", help="Output directory for archive files.")
+        parser.add_argument("--no-drop", action="store_true", help="Write archives but keep the partitions.")
+        parser.add_argument("--dry-run", action="store_true", help="Only list partitions that would be archived.")
+
+    def handle(self, *args, keep_months: int, out: str, no_drop: bool, dry_run: bool, **opts):
+        if not partitions.is_supported():
+            self.stdout.write("skipped: archival requires PostgreSQL")
+            return
+
+        if dry_run:
+            for p in expired_partitions(keep_months):
+                self.stdout.write(f"would archive {p.name} [{p.start} .. {p.end})")
+            return
+
+        def report(res):
+            verb = "archived+dropped" if res.dropped else "archived"
+            self.stdout.write(
+                f"{verb} {res.partition}: {res.rows} rows -> {res.path}"
+                + (f"; {res.bodies_deleted} unreferenced bodies deleted" if res.bodies_deleted else "")
+            )
+
+        results = archive_expired(keep_months, Path(out), drop=not no_drop, on_done=report)
+        self.stdout.write(self.style.SUCCESS(f"done: {len(results)} partition(s)"))
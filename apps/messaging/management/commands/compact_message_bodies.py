@@ -0,0 +1,51 @@
+from __future__ import annotations
+from collections import defaultdict
+from typing import Dict, List
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.messaging.models.message import Message
+from apps.messaging.services import body_store
+
+
+def template_key(m: Message) -> str:
+    """
+    Messages don't record their template; account + channel + subject is the closest
+    proxy (one subject per sequence step), so renders of one step share a base.
+    """
+    return f"backfill:{m.account_id}:{m.channel}:{body_store.digest_of(m.subject or '')[:16]}"
+
+
+class Command(BaseCommand):
+    help = "Move inline Message.body text into the deduplicated, compressed body store."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch", type=int, default=1000)
+        parser.add_argument("--limit", type=int, default=0, help="Stop after this many messages (0 = all).")
+
+    def handle(self, *args, batch: int, limit: int, **opts):
+        done, last_id = 0, 0
+        while True:
+            rows = list(
+                Message.objects.filter(pk__gt=last_id, body__isnull=False)
+                .order_by("pk")
+                .only("pk", "account_id", "channel", "subject", "body")[:batch]
+            )
+            if not rows:
+                break
+            groups: Dict[str, List[Message]] = defaultdict(list)
+            for m in rows:
+                groups[template_key(m)].append(m)
+            for key, group in groups.items():
+                digests = body_store.put_for_template(key, (m.body for m in group))
+                for m, d in zip(group, digests):
+                    m.body_ref_id, m.body = d, None
+            with transaction.atomic():
+                Message.objects.bulk_update(rows, ["body_ref", "body"], batch_size=batch)
+            done += len(rows)
+            last_id = rows[-1].pk
+            self.stdout.write(f"compacted {done} message(s)")
+            if limit and done >= limit:
+                break
+        self.stdout.write(self.style.SUCCESS(f"done: {done} message(s)"))
@@ -0,0 +1,39 @@
+from __future__ import annotations
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.messaging.services import partitions
+
+
+class Command(BaseCommand):
+    help = "Manage monthly range partitions of the Message table (Postgres only)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("action", choices=["ensure", "convert", "list"])
+        parser.add_argument("--ahead", type=int, default=3, help="Months to pre-create beyond the current one.")
+
+    def handle(self, *args, action: str, ahead: int, **opts):
+        if not partitions.is_supported():
+            self.stdout.write("skipped: partitioning requires PostgreSQL")
+            return
+
+        if action == "list":
+            for p in partitions.list_partitions():
+                self.stdout.write(f"{p.name}  [{p.start} .. {p.end})")
+            if partitions.is_partitioned():
+                self.stdout.write(f"{partitions.DEFAULT}  {partitions.default_partition_rows()} row(s) outside monthly ranges")
+            return
+
+        if action == "convert":
+            if partitions.is_partitioned():
+                raise CommandError(f"{partitions.PARENT} is already partitioned")
+            try:
+                rows = partitions.convert_to_partitioned(months_ahead=ahead)
+            except partitions.PartitioningError as exc:
+                raise CommandError(str(exc))
+            self.stdout.write(self.style.SUCCESS(f"converted {partitions.PARENT}: {rows} rows copied"))
+            return
+
+        if not partitions.is_partitioned():
+            raise CommandError(f"{partitions.PARENT} is not partitioned; run 'message_partitions convert' first")
+        created = partitions.ensure_partitions(months_ahead=ahead)
+        self.stdout.write(self.style.SUCCESS(f"created: {', '.join(created) or 'none'}"))
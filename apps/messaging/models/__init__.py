@@ -0,0 +1,5 @@
+from .message import Message
+from .message_body import MessageBody
+from .message_body_base import MessageBodyBase
+
+__all__ = ["Message", "MessageBody", "MessageBodyBase"]
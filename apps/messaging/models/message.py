@@ -1,7 +1,9 @@
 from __future__ import annotations
+from datetime import timedelta
 from django.db import models
+from django.utils import timezone
 from apps.core.constants.channels import EMAIL, SMS
-from apps.core.constants.statuses import MSG_QUEUED, MSG_SENT, MSG_FAILED
+from apps.core.constants.statuses import MSG_QUEUED, MSG_SENT, MSG_DELIVERED, MSG_BOUNCED, MSG_FAILED
 
 CHANNEL_CHOICES = [
     (EMAIL, "Email"),
@@ -18,9 +20,24 @@ DIRECTION_CHOICES = [
 STATUS_CHOICES = [
     (MSG_QUEUED, "Queued"),
     (MSG_SENT,   "Sent"),
+    (MSG_DELIVERED, "Delivered"),
+    (MSG_BOUNCED, "Bounced"),
     (MSG_FAILED, "Failed"),
 ]
 
+class MessageQuerySet(models.QuerySet):
+    """
+    On Postgres the table is range-partitioned by month on created_at
+    (see apps.messaging.services.partitions). Filtering on created_at lets the
+    planner prune to the relevant partitions, so hot paths should use these.
+    """
+    def since(self, dt) -> "MessageQuerySet":
+        return self.filter(created_at__gte=dt)
+
+    def recent(self, days: int = 30) -> "MessageQuerySet":
+        return self.since(timezone.now() - timedelta(days=days))
+
+
 class Message(models.Model):
     """
     A single message unit (email or SMS), inbound or outbound.
@@ -35,10 +52,16 @@ class Message(models.Model):
 
     # Email-specific
     subject = models.CharField(max_length=240, blank=True, null=True)
-    body    = models.TextField(blank=True, null=True)
+    body    = models.TextField(blank=True, null=True)  # legacy inline text; new rows use body_ref
 
     # SMS-specific can also use 'body'
 
+    # Deduplicated, compressed body (apps.messaging.services.body_store); read via body_text
+    body_ref = models.ForeignKey(
+        "messaging.MessageBody", to_field="digest", db_column="body_digest",
+        on_delete=models.PROTECT, null=True, blank=True, related_name="+",
+    )
+
     # Provider plumbing
     provider = models.CharField(max_length=32, blank=True, null=True)  # "sendgrid" | "twilio"
     provider_message_id = models.CharField(max_length=120, blank=True, null=True)
@@ -52,6 +75,8 @@ class Message(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = MessageQuerySet.as_manager()
+
     class Meta:
         app_label = "messaging"
         indexes = [
@@ -59,10 +84,29 @@ class Message(models.Model):
             models.Index(fields=["account", "status"]),
             models.Index(fields=["account", "direction"]),
             models.Index(fields=["provider", "provider_message_id"]),
+            # Admin: a tenant's messages, newest first
+            models.Index(fields=["account", "-id"], name="message_account_recent_idx"),
         ]
         verbose_name = "Message"
         verbose_name_plural = "Messages"
 
+    @property
+    def body_text(self) -> str:
+        """
+        Message text, decompressed lazily (the blob is only fetched on first access).
+        Use body_store.attach_bodies() to decode a whole page of messages in one query.
+        """
+        if self.body is not None:
+            return self.body
+        if not self.body_ref_id:
+            return ""
+        cached = self.__dict__.get("_body_text")
+        if cached is None:
+            from apps.messaging.services.body_store import get
+
+            cached = self.__dict__["_body_text"] = get(self.body_ref_id) or ""
+        return cached
+
     def __str__(self) -> str:  # pragma: no cover
         who = getattr(self.contact, "email", None) or getattr(self.contact, "phone", None) or "unknown"
         return f"[{self.channel}/{self.direction}] {who} -> {self.status}"
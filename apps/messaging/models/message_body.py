@@ -0,0 +1,29 @@
+from __future__ import annotations
+from django.db import models
+
+
+class MessageBody(models.Model):
+    """
+    Content-addressed, compressed message body (see apps.messaging.services.body_store).
+    `digest` is sha256 of the UTF-8 text, so identical bodies are stored once.
+    `base` optionally names another body whose text was the compression dictionary;
+    near-identical renders of one template then cost only their merged-field deltas.
+    """
+    digest = models.CharField(max_length=64, unique=True)
+    codec = models.CharField(max_length=8)  # "zstd" | "zlib"
+    base = models.ForeignKey(
+        "self", to_field="digest", db_column="base_digest",
+        on_delete=models.PROTECT, null=True, blank=True, related_name="+",
+    )
+    data = models.BinaryField()
+    raw_size = models.PositiveIntegerField()
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = "messaging"
+        verbose_name = "Message Body"
+        verbose_name_plural = "Message Bodies"
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.digest[:12]} ({self.codec}, {self.raw_size}B -> {len(self.data or b'')}B)"
@@ -0,0 +1,25 @@
+from __future__ import annotations
+from django.db import models
+
+
+class MessageBodyBase(models.Model):
+    """
+    Compression base per template: `key` names a template (or, for backfilled rows,
+    an account/channel/subject group) and `body` is the stored render whose text is
+    the dictionary for every later body of that key (see body_store.put_for_template).
+    """
+    key = models.CharField(max_length=200, unique=True)
+    body = models.ForeignKey(
+        "messaging.MessageBody", to_field="digest", db_column="body_digest",
+        on_delete=models.PROTECT, related_name="+",
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = "messaging"
+        verbose_name = "Message Body Base"
+        verbose_name_plural = "Message Body Bases"
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.key} -> {self.body_id[:12]}"
@@ -0,0 +1,59 @@
+"""
+SendGrid (email) provider.
+The SDK (and its HTTP stack) is imported on the first send, not at module load,
+so web processes and workers that never send email don't pay for it.
+SENDGRID_API_BASE_URL points the client at another host (e.g. the soak-test stub).
+Pass account_id to count the send against the account's usage once SendGrid accepts it.
+"""
+
+from __future__ import annotations
+import threading
+from typing import Any, Mapping, Optional
+
+from django.conf import settings
+
+from apps.core.constants.channels import EMAIL
+from apps.core.metering import meter
+
+_client: Any = None
+_lock = threading.Lock()
+
+
+def client():
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                from sendgrid import SendGridAPIClient  # type: ignore
+
+                _client = SendGridAPIClient(
+                    api_key=getattr(settings, "SENDGRID_API_KEY", ""),
+                    host=getattr(settings, "SENDGRID_API_BASE_URL", "") or "https://api.sendgrid.com",
+                )
+    return _client
+
+
+def send_email(
+    to: str,
+    subject: str,
+    html: str,
+    from_email: str,
+    headers: Optional[Mapping[str, str]] = None,
+    account_id: Optional[int] = None,
+) -> str:
+    """
+    Send one message. Returns SendGrid's X-Message-Id (our provider_message_id).
+    Metered as messages.sent.email for `account_id` only after SendGrid accepted it.
+    """
+    from sendgrid.helpers.mail import Header, Mail  # type: ignore
+
+    mail = Mail(from_email=from_email, to_emails=to, subject=subject, html_content=html)
+    for name, value in (headers or {}).items():
+        mail.add_header(Header(name, value))
+    resp = client().send(mail)
+    if account_id is not None:
+        meter.incr(account_id, meter.messages_sent(EMAIL))
+    return str(resp.headers.get("X-Message-Id", ""))
+
+
+__all__ = ["client", "send_email"]
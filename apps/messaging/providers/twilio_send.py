@@ -0,0 +1,60 @@
+"""
+Twilio (SMS) provider.
+The SDK is imported on the first send, not at module load (twilio.rest pulls in
+every API domain), so processes that never send SMS don't pay for it.
+TWILIO_API_BASE_URL points the client at another host (e.g. the soak-test stub).
+Pass account_id to count the send against the account's usage once Twilio accepts it.
+"""
+
+from __future__ import annotations
+import threading
+from typing import Any, Optional
+
+from django.conf import settings
+
+from apps.core.constants.channels import SMS
+from apps.core.metering import meter
+
+_client: Any = None
+_lock = threading.Lock()
+
+
+def client():
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                from twilio.rest import Client  # type: ignore
+
+                c = Client(
+                    getattr(settings, "TWILIO_ACCOUNT_SID", ""),
+                    getattr(settings, "TWILIO_AUTH_TOKEN", ""),
+                )
+                base_url = getattr(settings, "TWILIO_API_BASE_URL", "")
+                if base_url:
+                    c.api.base_url = base_url.rstrip("/")
+                _client = c
+    return _client
+
+
+def send_sms(
+    to: str,
+    body: str,
+    from_number: Optional[str] = None,
+    status_callback: Optional[str] = None,
+    account_id: Optional[int] = None,
+) -> str:
+    """
+    Send one SMS. Returns the Message SID (our provider_message_id).
+    Metered as messages.sent.sms for `account_id` only after Twilio accepted it.
+    """
+    kwargs = {"to": to, "from_": from_number or getattr(settings, "TWILIO_FROM_NUMBER", ""), "body": body}
+    if status_callback:
+        kwargs["status_callback"] = status_callback
+    sid = str(client().messages.create(**kwargs).sid)
+    if account_id is not None:
+        meter.incr(account_id, meter.messages_sent(SMS))
+    return sid
+
+
+__all__ = ["client", "send_sms"]
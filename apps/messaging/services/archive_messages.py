@@ -0,0 +1,123 @@
+"""
+Archive whole Message partitions to compressed NDJSON, then drop them.
+- Rows are streamed through a server-side cursor (constant memory).
+- zstd when the `zstandard` package is installed, otherwise stdlib gzip.
+- Each row carries its decompressed body text ("body"), so an archive file is
+  self-contained; body_digest is kept for reference.
+- A partition is only dropped after the file is fully written and the row count matches;
+  bodies no remaining Message references are then garbage-collected.
+"""
+
+from __future__ import annotations
+import gzip
+import json
+from datetime import date
+from pathlib import Path
+from typing import IO, Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+from django.db import connection
+
+from . import body_store
+from .partitions import Partition, detach_and_drop, list_partitions, month_start, add_months
+
+try:
+    import zstandard  # type: ignore
+except Exception:  # pragma: no cover (optional dependency)
+    zstandard = None  # type: ignore
+
+FETCH_SIZE = 5000
+
+
+class ArchiveResult(NamedTuple):
+    partition: str
+    path: str
+    rows: int
+    dropped: bool
+    bodies_deleted: int = 0
+
+
+def _open_compressed(path_base: Path) -> "tuple[Path, IO[bytes]]":
+    if zstandard is not None:
+        path = path_base.with_suffix(".ndjson.zst")
+        raw = open(path, "wb")
+        return path, zstandard.ZstdCompressor(level=10).stream_writer(raw, closefd=True)
+    path = path_base.with_suffix(".ndjson.gz")
+    return path, gzip.open(path, "wb", compresslevel=6)
+
+
+def ndjson_lines(batch: Iterable[Tuple[str, Optional[str], Optional[str], Optional[bytes]]]) -> bytes:
+    """
+    (row_to_json, codec, base_digest, data) rows -> NDJSON, with stored bodies inlined as "body".
+    """
+    out = []
+    for row, codec, base, data in batch:
+        if codec is not None:
+            obj = json.loads(row)
+            obj["body"] = body_store.decode(codec, data, base)
+            row = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+        out.append(row.encode("utf-8") + b"\n")
+    return b"".join(out)
+
+
+def expired_partitions(keep_months: int, today: Optional[date] = None) -> List[Partition]:
+    """
+    Partitions whose whole range ends before the retention cutoff.
+    """
+    from apps.core.time.now import now_utc
+
+    today = today or now_utc().date()
+    cutoff = add_months(month_start(today), -keep_months)
+    return [p for p in list_partitions() if p.end <= cutoff]
+
+
+def archive_partition(p: Partition, out_dir: Path, drop: bool = True) -> ArchiveResult:
+    """
+    Stream one partition to `<out_dir>/<partition>.ndjson.{zst,gz}` and (optionally) drop it.
+    """
+    qn = connection.ops.quote_name
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path, fh = _open_compressed(out_dir / p.name)
+
+    rows = 0
+    with fh:
+        with connection.chunked_cursor() as cur:
+            cur.execute(
+                f"SELECT row_to_json(t)::text, b.codec, b.base_digest, b.data FROM {qn(p.name)} t"
+                " LEFT JOIN messaging_messagebody b ON b.digest = t.body_digest ORDER BY t.id"
+            )
+            while True:
+                batch = cur.fetchmany(FETCH_SIZE)
+                if not batch:
+                    break
+                fh.write(ndjson_lines(batch))
+                rows += len(batch)
+
+    with connection.cursor() as cur:
+        cur.execute(f"SELECT count(*) FROM {qn(p.name)}")
+        (expected,) = cur.fetchone()
+    if expected != rows:
+        raise RuntimeError(f"{p.name}: wrote {rows} rows but partition has {expected}; not dropping")
+
+    bodies_deleted = 0
+    if drop:
+        detach_and_drop(p)
+        bodies_deleted = body_store.collect_garbage()
+    return ArchiveResult(p.name, str(path), rows, drop, bodies_deleted)
+
+
+def archive_expired(
+    keep_months: int,
+    out_dir: Path,
+    drop: bool = True,
+    on_done: Optional[Callable[[ArchiveResult], None]] = None,
+) -> List[ArchiveResult]:
+    results = []
+    for p in expired_partitions(keep_months):
+        res = archive_partition(p, out_dir, drop=drop)
+        results.append(res)
+        if on_done:
+            on_done(res)
+    return results
+
+
+__all__ = ["ArchiveResult", "ndjson_lines", "expired_partitions", "archive_partition", "archive_expired"]
@@ -0,0 +1,239 @@
+"""
+Deduplicated, compressed storage for message bodies.
+
+- Bodies are keyed by sha256(text): identical renders share one MessageBody row.
+- Compression is zstd when `zstandard` is installed, otherwise zlib; each row records
+  its codec so both stay readable.
+- Base body: the first stored render of a template is used as a preset dictionary
+  (zlib zdict / zstd raw-content dict) for every later render of it, so a
+  near-identical body shrinks to roughly the size of its merged fields. The
+  template -> base mapping lives in MessageBodyBase, shared by all processes.
+- Reads decompress lazily and go through a small in-process LRU (admin/dashboard).
+- Bodies no Message references any more (after partitions are archived and
+  dropped) are removed by collect_garbage().
+"""
+
+from __future__ import annotations
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+
+try:
+    import zstandard  # type: ignore
+except Exception:  # pragma: no cover (optional dependency)
+    zstandard = None  # type: ignore
+
+CODEC_ZSTD = "zstd"
+CODEC_ZLIB = "zlib"
+ZLIB_MAX_DICT = 32 * 1024  # zlib window; only the tail of a longer base is used
+
+_lock = threading.Lock()
+_text_cache: "OrderedDict[str, str]" = OrderedDict()
+_bases: Dict[str, str] = {}  # template key -> base digest, read-through cache of MessageBodyBase
+
+
+def digest_of(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# --- codecs ---
+def _compress(raw: bytes, base: Optional[bytes]) -> Tuple[str, bytes]:
+    if zstandard is not None:
+        kwargs = {"level": 10}
+        if base:
+            kwargs["dict_data"] = zstandard.ZstdCompressionDict(base, dict_type=zstandard.DICT_TYPE_RAWCONTENT)
+        return CODEC_ZSTD, zstandard.ZstdCompressor(**kwargs).compress(raw)
+    c = zlib.compressobj(9, zdict=base[-ZLIB_MAX_DICT:]) if base else zlib.compressobj(9)
+    return CODEC_ZLIB, c.compress(raw) + c.flush()
+
+
+def _decompress(codec: str, data: bytes, base: Optional[bytes]) -> bytes:
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd-compressed bodies")
+        kwargs = {}
+        if base:
+            kwargs["dict_data"] = zstandard.ZstdCompressionDict(base, dict_type=zstandard.DICT_TYPE_RAWCONTENT)
+        return zstandard.ZstdDecompressor(**kwargs).decompress(data)
+    d = zlib.decompressobj(zdict=base[-ZLIB_MAX_DICT:]) if base else zlib.decompressobj()
+    return d.decompress(data) + d.flush()
+
+
+# --- read cache ---
+def _cache_put(d: str, text: str) -> None:
+    size = int(getattr(settings, "MESSAGE_BODY_CACHE_SIZE", 1024))
+    with _lock:
+        _text_cache[d] = text
+        _text_cache.move_to_end(d)
+        while len(_text_cache) > size:
+            _text_cache.popitem(last=False)
+
+
+def _cache_get(d: str) -> Optional[str]:
+    with _lock:
+        text = _text_cache.get(d)
+        if text is not None:
+            _text_cache.move_to_end(d)
+        return text
+
+
+# --- writes ---
+def put_many(texts: Iterable[str], base: Optional[str] = None) -> List[str]:
+    """
+    Store bodies (dedup by digest; existing rows are left untouched). Returns digests in order.
+    `base` is the digest of a stored body to use as compression dictionary.
+    """
+    from apps.messaging.models.message_body import MessageBody
+
+    texts = list(texts)
+    digests = [digest_of(t) for t in texts]
+    base_text = get(base) if base else None
+    base_raw = base_text.encode("utf-8") if base_text else None
+
+    unique = {d: t for d, t in zip(digests, texts)}
+    existing = set(MessageBody.objects.filter(digest__in=list(unique)).values_list("digest", flat=True))
+    rows = []
+    for d, t in unique.items():
+        if d in existing:
+            continue
+        raw = t.encode("utf-8")
+        use_base = base_raw if base_raw and d != base else None
+        codec, data = _compress(raw, use_base)
+        rows.append(MessageBody(
+            digest=d, codec=codec, base_id=base if use_base else None, data=data, raw_size=len(raw),
+        ))
+        _cache_put(d, t)
+    if rows:
+        MessageBody.objects.bulk_create(rows, ignore_conflicts=True, batch_size=500)
+    return digests
+
+
+def put(text: str, base: Optional[str] = None) -> str:
+    return put_many([text], base=base)[0]
+
+
+def base_for(template_key: str, text: str) -> str:
+    """
+    Digest of the compression base for `template_key`. The first time a key is seen,
+    `text` is stored plainly and becomes the base; concurrent first writers for the
+    same key agree on whichever mapping row was inserted first.
+    """
+    from apps.messaging.models.message_body_base import MessageBodyBase
+
+    with _lock:
+        cached = _bases.get(template_key)
+    if cached is not None:
+        return cached
+    d = MessageBodyBase.objects.filter(key=template_key).values_list("body_id", flat=True).first()
+    if d is None:
+        row, _ = MessageBodyBase.objects.get_or_create(key=template_key, defaults={"body_id": put(text)})
+        d = row.body_id
+    with _lock:
+        _bases[template_key] = d
+    return d
+
+
+def put_for_template(template_key: str, texts: Iterable[str]) -> List[str]:
+    """
+    Store renders of one template, compressed against the template's base body
+    (see base_for). Returns digests in order.
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+    return put_many(texts, base=base_for(template_key, texts[0]))
+
+
+def collect_garbage(batch: int = 5000) -> int:
+    """
+    Delete bodies nothing points at: no Message, no body compressed against it and no
+    template base. Repeats until a pass finds nothing, so a base freed by the previous
+    pass goes too. Returns the number of rows deleted.
+    """
+    from django.db.models import Exists, OuterRef
+
+    from apps.messaging.models.message import Message
+    from apps.messaging.models.message_body import MessageBody
+    from apps.messaging.models.message_body_base import MessageBodyBase
+
+    orphans = MessageBody.objects.filter(
+        ~Exists(Message.objects.filter(body_ref=OuterRef("digest"))),
+        ~Exists(MessageBody.objects.filter(base=OuterRef("digest"))),
+        ~Exists(MessageBodyBase.objects.filter(body=OuterRef("digest"))),
+    )
+    deleted = 0
+    while True:
+        ids = list(orphans.values_list("pk", flat=True)[:batch])
+        if not ids:
+            return deleted
+        deleted += MessageBody.objects.filter(pk__in=ids).delete()[0]
+
+
+# --- reads ---
+def get_many(digests: Iterable[str]) -> Dict[str, str]:
+    """
+    Decoded texts by digest (unknown digests omitted). Cache misses cost one query,
+    plus one for any base bodies not already cached.
+    """
+    from apps.messaging.models.message_body import MessageBody
+
+    wanted = set(d for d in digests if d)
+    out: Dict[str, str] = {}
+    for d in list(wanted):
+        text = _cache_get(d)
+        if text is not None:
+            out[d] = text
+            wanted.discard(d)
+    if not wanted:
+        return out
+
+    rows = list(MessageBody.objects.filter(digest__in=list(wanted)).values_list("digest", "codec", "base_id", "data"))
+    bases_needed = {b for _, _, b, _ in rows if b and b not in out}
+    bases = get_many(bases_needed) if bases_needed else {}
+    bases.update(out)
+
+    for d, codec, base_d, data in rows:
+        base_raw = bases[base_d].encode("utf-8") if base_d else None
+        text = _decompress(codec, bytes(data), base_raw).decode("utf-8")
+        _cache_put(d, text)
+        out[d] = text
+    return out
+
+
+def decode(codec: str, data: bytes, base: Optional[str] = None) -> str:
+    """
+    Text of one row fetched outside get_many (e.g. joined into an export query); only
+    the base body, if any, goes through the cache.
+    """
+    base_text = get(base) if base else None
+    return _decompress(codec, bytes(data), base_text.encode("utf-8") if base_text else None).decode("utf-8")
+
+
+def get(d: str) -> Optional[str]:
+    return get_many([d]).get(d)
+
+
+def attach_bodies(messages: Iterable) -> None:
+    """
+    Pre-decode body_text for a list of Message instances (one query for all cache misses).
+    """
+    messages = [m for m in messages if m.body is None and m.body_ref_id]
+    texts = get_many(m.body_ref_id for m in messages)
+    for m in messages:
+        m.__dict__["_body_text"] = texts.get(m.body_ref_id, "")
+
+
+def clear_cache() -> None:
+    with _lock:
+        _text_cache.clear()
+        _bases.clear()
+
+
+__all__ = [
+    "digest_of", "put", "put_many", "base_for", "put_for_template", "get", "get_many", "decode",
+    "attach_bodies", "collect_garbage", "clear_cache",
+]
@@ -0,0 +1,292 @@
+"""
+Bulk delivery-status ingestion keyed by (provider, provider_message_id).
+
+Webhook views normalize provider events into DeliveryEvent and hand them to
+buffer(). Events are parked in a Redis list and applied in batches by the
+`messaging.apply_delivery_events` task (or applied inline when Redis is absent).
+
+apply_events():
+- collapses each batch to one event per message (highest precedence wins),
+- on Postgres issues a single UPDATE ... FROM (VALUES ...) per chunk,
+- elsewhere reads the matching rows and uses chunked bulk_update().
+Both paths only move a message to a higher MSG_STATUS_RANK, so late or
+duplicate events are harmless. Messages that actually moved are reported to
+the account's activity stream once the chunk commits.
+
+A callback can beat the send task's write of provider_message_id. drain() parks
+events that match no message in a retry list and feeds them back on the next
+drains, up to DELIVERY_EVENTS_MAX_RETRIES times, before dropping them.
+"""
+
+from __future__ import annotations
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from apps.core.activity import stream as activity
+from apps.core.cache.redis_client import get_redis
+from apps.core.constants.statuses import (
+    MSG_BOUNCED, MSG_DELIVERED, MSG_FAILED, MSG_QUEUED, MSG_SENT, MSG_STATUS_RANK,
+)
+
+BUFFER_KEY = "reclaimr:dlv:buf"
+RETRY_KEY = "reclaimr:dlv:retry"
+CHUNK = 1000
+
+# Provider vocabularies → our statuses (unknown events are ignored)
+SENDGRID_EVENTS = {
+    "processed": MSG_SENT,
+    "deferred": MSG_SENT,
+    "delivered": MSG_DELIVERED,
+    "bounce": MSG_BOUNCED,
+    "dropped": MSG_FAILED,
+}
+TWILIO_STATUSES = {
+    "accepted": MSG_QUEUED,
+    "queued": MSG_QUEUED,
+    "sending": MSG_QUEUED,
+    "sent": MSG_SENT,
+    "delivered": MSG_DELIVERED,
+    "undelivered": MSG_BOUNCED,
+    "failed": MSG_FAILED,
+}
+
+# Our statuses → activity event kinds (queued isn't reported)
+ACTIVITY_KINDS = {
+    MSG_SENT: activity.MESSAGE_SENT,
+    MSG_DELIVERED: activity.MESSAGE_DELIVERED,
+    MSG_BOUNCED: activity.MESSAGE_FAILED,
+    MSG_FAILED: activity.MESSAGE_FAILED,
+}
+
+
+class DeliveryEvent(NamedTuple):
+    provider: str
+    provider_message_id: str
+    status: str
+    error: Optional[str]
+    ts: float  # unix seconds
+    attempts: int = 0  # drains that found no message for it yet
+
+
+# --- normalization ---
+def from_sendgrid(events: Iterable[dict]) -> List[DeliveryEvent]:
+    out = []
+    for e in events:
+        status = SENDGRID_EVENTS.get(str(e.get("event", "")))
+        sg_id = str(e.get("sg_message_id") or "")
+        if not status or not sg_id:
+            continue
+        # sg_message_id is "<X-Message-Id>.<filter suffix>"; we store the X-Message-Id.
+        pmid = sg_id.split(".", 1)[0]
+        error = (e.get("reason") or e.get("response")) if status in (MSG_BOUNCED, MSG_FAILED) else None
+        out.append(DeliveryEvent("sendgrid", pmid, status, error, float(e.get("timestamp") or 0)))
+    return out
+
+
+def from_twilio(params) -> Optional[DeliveryEvent]:
+    status = TWILIO_STATUSES.get(str(params.get("MessageStatus", "")).lower())
+    sid = params.get("MessageSid") or params.get("SmsSid")
+    if not status or not sid:
+        return None
+    error = None
+    if status in (MSG_BOUNCED, MSG_FAILED):
+        code = params.get("ErrorCode")
+        error = f"twilio_error_{code}" if code else status
+    return DeliveryEvent("twilio", sid, status, error, datetime.now(timezone.utc).timestamp())
+
+
+# --- batching ---
+def collapse(events: Iterable[DeliveryEvent]) -> List[DeliveryEvent]:
+    """
+    One event per message: highest rank wins; ties keep the latest timestamp.
+    """
+    best: Dict[Tuple[str, str], DeliveryEvent] = {}
+    for e in events:
+        key = (e.provider, e.provider_message_id)
+        cur = best.get(key)
+        if cur is None or (MSG_STATUS_RANK[e.status], e.ts) > (MSG_STATUS_RANK[cur.status], cur.ts):
+            best[key] = e
+    return list(best.values())
+
+
+def _rank_case_sql(column: str) -> str:
+    whens = " ".join(f"WHEN '{s}' THEN {r}" for s, r in MSG_STATUS_RANK.items())
+    return f"(CASE {column} {whens} ELSE 0 END)"
+
+
+Changed = List[Tuple[int, int, str, str, str]]  # (message_id, account_id, new status, provider, provider_message_id)
+
+
+def _window_days() -> int:
+    # provider callbacks arrive within minutes/days of the send; bounding created_at
+    # lets Postgres prune the UPDATE to the last couple of monthly partitions
+    return int(getattr(settings, "DELIVERY_STATUS_WINDOW_DAYS", 30))
+
+
+def _apply_postgres(events: List[DeliveryEvent]) -> Changed:
+    rows_sql = ", ".join(["(%s, %s, %s, %s, %s::timestamptz, %s::int)"] * len(events))
+    params: list = []
+    for e in events:
+        ts = datetime.fromtimestamp(e.ts or 0, timezone.utc) if e.ts else datetime.now(timezone.utc)
+        params += [e.provider, e.provider_message_id, e.status, e.error, ts, MSG_STATUS_RANK[e.status]]
+    params.append(datetime.now(timezone.utc) - timedelta(days=_window_days()))
+    sent_like = ", ".join(f"'{s}'" for s in (MSG_SENT, MSG_DELIVERED))
+    sql = f"""
+        UPDATE messaging_message AS m
+        SET status = v.status,
+            error = COALESCE(v.error, m.error),
+            sent_at = CASE WHEN v.status IN ({sent_like}) THEN COALESCE(m.sent_at, v.ts) ELSE m.sent_at END,
+            updated_at = now()
+        FROM (VALUES {rows_sql}) AS v(provider, pmid, status, error, ts, rank)
+        WHERE m.provider = v.provider
+          AND m.provider_message_id = v.pmid
+          AND {_rank_case_sql("m.status")} < v.rank
+          AND m.created_at >= %s
+        RETURNING m.id, m.account_id, v.status, v.provider, v.pmid
+    """
+    with connection.cursor() as cur:
+        cur.execute(sql, params)
+        return [tuple(row) for row in cur.fetchall()]
+
+
+def _apply_orm(events: List[DeliveryEvent]) -> Changed:
+    from django.db.models import Q
+    from apps.messaging.models.message import Message
+
+    by_key = {(e.provider, e.provider_message_id): e for e in events}
+    q = Q()
+    for provider in {e.provider for e in events}:
+        q |= Q(provider=provider, provider_message_id__in=[k[1] for k in by_key if k[0] == provider])
+    changed = []
+    for m in Message.objects.recent(_window_days()).filter(q).only("id", "account_id", "provider", "provider_message_id", "status", "error", "sent_at"):
+        e = by_key.get((m.provider, m.provider_message_id))
+        if e is None or MSG_STATUS_RANK.get(m.status, 0) >= MSG_STATUS_RANK[e.status]:
+            continue
+        m.status = e.status
+        if e.error:
+            m.error = e.error
+        if e.status in (MSG_SENT, MSG_DELIVERED) and m.sent_at is None:
+            m.sent_at = datetime.fromtimestamp(e.ts, timezone.utc) if e.ts else datetime.now(timezone.utc)
+        m.updated_at = datetime.now(timezone.utc)
+        changed.append(m)
+    Message.objects.bulk_update(changed, ["status", "error", "sent_at", "updated_at"], batch_size=500)
+    return [(m.id, m.account_id, m.status, m.provider, m.provider_message_id) for m in changed]
+
+
+def _publish(changed: Changed) -> None:
+    activity.publish_many(
+        (account_id, ACTIVITY_KINDS[status], {"message_id": message_id, "status": status})
+        for message_id, account_id, status, _, _ in changed
+        if status in ACTIVITY_KINDS
+    )
+
+
+def _unmatched(events: List[DeliveryEvent]) -> List[DeliveryEvent]:
+    """
+    Events whose (provider, provider_message_id) matches no recent message.
+    """
+    from django.db.models import Q
+    from apps.messaging.models.message import Message
+
+    if not events:
+        return []
+    q = Q()
+    for provider in {e.provider for e in events}:
+        q |= Q(provider=provider, provider_message_id__in=[e.provider_message_id for e in events if e.provider == provider])
+    found = set(Message.objects.recent(_window_days()).filter(q).values_list("provider", "provider_message_id"))
+    return [e for e in events if (e.provider, e.provider_message_id) not in found]
+
+
+def _apply(events: Iterable[DeliveryEvent]) -> Tuple[int, List[DeliveryEvent]]:
+    collapsed = collapse(events)
+    apply = _apply_postgres if connection.vendor == "postgresql" else _apply_orm
+    changed, unmatched = 0, []
+    for i in range(0, len(collapsed), CHUNK):
+        chunk = collapsed[i:i + CHUNK]
+        with transaction.atomic():
+            moved = apply(chunk)
+            transaction.on_commit(lambda moved=moved: _publish(moved))
+        changed += len(moved)
+        hit = {(provider, pmid) for _, _, _, provider, pmid in moved}
+        unmatched += _unmatched([e for e in chunk if (e.provider, e.provider_message_id) not in hit])
+    return changed, unmatched
+
+
+def apply_events(events: Iterable[DeliveryEvent]) -> int:
+    """
+    Apply a batch of events. Returns the number of Message rows changed.
+    """
+    return _apply(events)[0]
+
+
+# --- buffer ---
+def buffer(events: List[DeliveryEvent]) -> bool:
+    """
+    Park events for the batch applier. Applies inline (one batch) when Redis is unavailable.
+    Returns True when buffered, False when applied inline.
+    """
+    if not events:
+        return True
+    client = get_redis()
+    if client is not None:
+        try:
+            client.rpush(BUFFER_KEY, *[json.dumps(e) for e in events])
+            return True
+        except Exception:
+            pass
+    apply_events(events)
+    return False
+
+
+def _retry_later(client, events: List[DeliveryEvent]) -> None:
+    max_retries = int(getattr(settings, "DELIVERY_EVENTS_MAX_RETRIES", 12))
+    keep = [e._replace(attempts=e.attempts + 1) for e in events if e.attempts < max_retries]
+    if keep:
+        client.rpush(RETRY_KEY, *[json.dumps(e) for e in keep])
+
+
+def drain(max_batches: Optional[int] = None) -> int:
+    """
+    Apply buffered events batch by batch. Returns rows changed.
+    Events popped but not applied (DB error) are pushed back to the head of the buffer.
+    Events that matched no message are retried on the next drain (not this one).
+    """
+    client = get_redis()
+    if client is None:
+        return 0
+    batch = int(getattr(settings, "DELIVERY_EVENTS_BATCH", 5000))
+    max_batches = max_batches or int(getattr(settings, "DELIVERY_EVENTS_MAX_BATCHES", 20))
+
+    pipe = client.pipeline(transaction=True)
+    pipe.lrange(RETRY_KEY, 0, -1)
+    pipe.delete(RETRY_KEY)
+    retries = pipe.execute()[0]
+    if retries:
+        client.lpush(BUFFER_KEY, *reversed(retries))
+
+    changed = 0
+    for _ in range(max_batches):
+        raw = client.lpop(BUFFER_KEY, batch)
+        if not raw:
+            break
+        events = [DeliveryEvent(*json.loads(r)) for r in raw]
+        try:
+            moved, unmatched = _apply(events)
+        except Exception:
+            client.lpush(BUFFER_KEY, *reversed(raw))
+            raise
+        changed += moved
+        _retry_later(client, unmatched)
+        if len(raw) < batch:
+            break
+    return changed
+
+
+__all__ = [
+    "DeliveryEvent", "from_sendgrid", "from_twilio", "collapse",
+    "apply_events", "buffer", "drain",
+]
@@ -0,0 +1,220 @@
+"""
+Monthly range partitioning for the Message table (Postgres only).
+
+Layout:
+  messaging_message            -- partitioned parent, PARTITION BY RANGE (created_at)
+  messaging_message_p2025_01   -- [2025-01-01, 2025-02-01)
+  ...
+  messaging_message_default    -- DEFAULT partition: rows outside every monthly range
+                                  (clock skew, backfills) land here instead of failing
+
+Notes:
+- Postgres requires the partition key in every unique constraint, so the physical
+  primary key is (id, created_at). Django keeps treating `id` as the pk; ids still
+  come from a single identity sequence, so they stay unique.
+- Indexes declared on Message.Meta are created on the parent and cascade to partitions.
+- Retention is DETACH + DROP of whole partitions (metadata only), never a bulk DELETE.
+- Creating a month whose range already has rows in the DEFAULT partition fails; the
+  beat task pre-creates months ahead, so the default should stay empty (check it with
+  `message_partitions list`).
+- Postgres can't point a foreign key at `id` alone once the pk is (id, created_at), so
+  conversion refuses to run while other tables reference messaging_message.
+- Queries only prune partitions when they filter on created_at: use
+  Message.objects.since()/recent() on hot paths.
+"""
+
+from __future__ import annotations
+import re
+from datetime import date, datetime, timezone
+from typing import List, NamedTuple, Optional
+
+from django.db import connection, transaction
+
+PARENT = "messaging_message"
+DEFAULT = f"{PARENT}_default"
+_NAME_RE = re.compile(r"^messaging_message_p(?P<y>\d{4})_(?P<m>\d{2})$")
+
+
+class PartitioningError(RuntimeError):
+    pass
+
+
+class Partition(NamedTuple):
+    name: str
+    start: date  # inclusive
+    end: date    # exclusive
+
+
+def is_supported() -> bool:
+    return connection.vendor == "postgresql"
+
+
+def month_start(d: date) -> date:
+    return date(d.year, d.month, 1)
+
+
+def add_months(d: date, n: int) -> date:
+    idx = d.year * 12 + (d.month - 1) + n
+    return date(idx // 12, idx % 12 + 1, 1)
+
+
+def partition_for(d: date) -> Partition:
+    start = month_start(d)
+    return Partition(f"{PARENT}_p{start.year:04d}_{start.month:02d}", start, add_months(start, 1))
+
+
+def is_partitioned() -> bool:
+    with connection.cursor() as cur:
+        cur.execute(
+            "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = %s AND pg_table_is_visible(c.oid)",
+            [PARENT],
+        )
+        return cur.fetchone() is not None
+
+
+def list_partitions() -> List[Partition]:
+    """
+    Attached monthly partitions, oldest first (names not matching our scheme are ignored).
+    """
+    with connection.cursor() as cur:
+        cur.execute(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = %s AND pg_table_is_visible(p.oid)",
+            [PARENT],
+        )
+        names = [r[0] for r in cur.fetchall()]
+    parts = []
+    for name in names:
+        m = _NAME_RE.match(name)
+        if m:
+            parts.append(partition_for(date(int(m["y"]), int(m["m"]), 1)))
+    return sorted(parts, key=lambda p: p.start)
+
+
+def _create_partition(cur, p: Partition) -> None:
+    qn = connection.ops.quote_name
+    cur.execute(
+        f"CREATE TABLE IF NOT EXISTS {qn(p.name)} PARTITION OF {qn(PARENT)} "
+        f"FOR VALUES FROM (%s) TO (%s)",
+        [datetime(p.start.year, p.start.month, 1, tzinfo=timezone.utc),
+         datetime(p.end.year, p.end.month, 1, tzinfo=timezone.utc)],
+    )
+
+
+def _create_default_partition(cur) -> None:
+    qn = connection.ops.quote_name
+    cur.execute(f"CREATE TABLE IF NOT EXISTS {qn(DEFAULT)} PARTITION OF {qn(PARENT)} DEFAULT")
+
+
+def default_partition_rows() -> int:
+    with connection.cursor() as cur:
+        cur.execute(f"SELECT count(*) FROM {connection.ops.quote_name(DEFAULT)}")
+        return cur.fetchone()[0]
+
+
+def referencing_foreign_keys() -> List[str]:
+    """
+    Foreign keys in other tables that point at messaging_message ("table.constraint").
+    """
+    with connection.cursor() as cur:
+        cur.execute(
+            "SELECT conrelid::regclass::text, conname FROM pg_constraint "
+            "WHERE contype = 'f' AND confrelid = %s::regclass AND conrelid <> confrelid",
+            [PARENT],
+        )
+        return [f"{table}.{name}" for table, name in cur.fetchall()]
+
+
+def ensure_partitions(months_ahead: int = 3, today: Optional[date] = None) -> List[str]:
+    """
+    Create partitions for the current month through `months_ahead` months out (and the
+    DEFAULT partition). Idempotent; returns names of monthly partitions that did not exist before.
+    """
+    today = today or datetime.now(timezone.utc).date()
+    existing = {p.name for p in list_partitions()}
+    created = []
+    with transaction.atomic(), connection.cursor() as cur:
+        _create_default_partition(cur)
+        for i in range(months_ahead + 1):
+            p = partition_for(add_months(month_start(today), i))
+            if p.name not in existing:
+                _create_partition(cur, p)
+                created.append(p.name)
+    return created
+
+
+def convert_to_partitioned(months_ahead: int = 3) -> int:
+    """
+    One-time conversion of a plain messaging_message table into the partitioned layout.
+    Runs in a single transaction (takes an ACCESS EXCLUSIVE lock; schedule a window).
+    Returns the number of rows copied. Raises PartitioningError (before touching anything)
+    if other tables hold foreign keys to messaging_message.
+    """
+    qn = connection.ops.quote_name
+    legacy = f"{PARENT}_legacy"
+    blockers = referencing_foreign_keys()
+    if blockers:
+        raise PartitioningError(
+            f"foreign keys reference {PARENT} and can't survive the conversion: {', '.join(blockers)}; "
+            "drop them (or point them elsewhere) first"
+        )
+    with transaction.atomic(), connection.cursor() as cur:
+        cur.execute(f"ALTER TABLE {qn(PARENT)} RENAME TO {qn(legacy)}")
+        cur.execute(
+            f"CREATE TABLE {qn(PARENT)} (LIKE {qn(legacy)} INCLUDING DEFAULTS INCLUDING IDENTITY "
+            f"INCLUDING CONSTRAINTS) PARTITION BY RANGE (created_at)"
+        )
+        cur.execute(f"ALTER TABLE {qn(PARENT)} ADD PRIMARY KEY (id, created_at)")
+
+        cur.execute(f"SELECT min(created_at), max(id) FROM {qn(legacy)}")
+        oldest, max_id = cur.fetchone()
+        first = month_start(oldest.date()) if oldest else month_start(datetime.now(timezone.utc).date())
+        last = add_months(month_start(datetime.now(timezone.utc).date()), months_ahead)
+        m = first
+        while m <= last:
+            _create_partition(cur, partition_for(m))
+            m = add_months(m, 1)
+        _create_default_partition(cur)
+
+        cur.execute(f"INSERT INTO {qn(PARENT)} SELECT * FROM {qn(legacy)}")
+        copied = cur.rowcount
+        if max_id:
+            cur.execute("SELECT setval(pg_get_serial_sequence(%s, 'id'), %s)", [PARENT, max_id])
+
+        # Foreign keys and Meta.indexes are recreated on the parent (they cascade to partitions).
+        cur.execute(
+            "SELECT pg_get_constraintdef(oid), conname FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype = 'f'",
+            [legacy],
+        )
+        fks = cur.fetchall()
+        cur.execute("SELECT indexdef FROM pg_indexes WHERE tablename = %s AND indexname NOT LIKE %s",
+                    [legacy, "%_pkey"])
+        index_defs = [r[0] for r in cur.fetchall()]
+        cur.execute(f"DROP TABLE {qn(legacy)}")
+        for definition, name in fks:
+            cur.execute(f"ALTER TABLE {qn(PARENT)} ADD CONSTRAINT {qn(name)} {definition}")
+        for ddl in index_defs:
+            cur.execute(ddl.replace(f" ON public.{legacy} ", f" ON public.{PARENT} ")
+                        .replace(f" ON {legacy} ", f" ON {PARENT} "))
+    return copied
+
+
+def detach_and_drop(p: Partition) -> None:
+    """
+    Retention: detach then drop a whole partition (metadata operation, no row-level DELETE).
+    """
+    qn = connection.ops.quote_name
+    with transaction.atomic(), connection.cursor() as cur:
+        cur.execute(f"ALTER TABLE {qn(PARENT)} DETACH PARTITION {qn(p.name)}")
+        cur.execute(f"DROP TABLE {qn(p.name)}")
+
+
+__all__ = [
+    "PARENT", "DEFAULT", "PartitioningError", "Partition", "is_supported", "is_partitioned", "partition_for",
+    "month_start", "add_months", "list_partitions", "ensure_partitions",
+    "default_partition_rows", "referencing_foreign_keys", "convert_to_partitioned", "detach_and_drop",
+]
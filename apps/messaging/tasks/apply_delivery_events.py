@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+try:
+    from celery import shared_task  # type: ignore
+except Exception:  # pragma: no cover (import guard)
+    shared_task = None  # type: ignore
+
+from apps.messaging.services.delivery_status import drain
+
+
+def apply_delivery_events() -> int:
+    """
+    Apply buffered SendGrid/Twilio status events in batches. Scheduled by beat.
+    """
+    return drain()
+
+
+if shared_task is not None:
+    apply_delivery_events_task = shared_task(name="webhooks.apply_delivery_events")(apply_delivery_events)
+
+__all__ = ["apply_delivery_events"]
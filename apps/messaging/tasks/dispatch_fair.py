@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+try:
+    from celery import shared_task  # type: ignore
+except Exception:  # pragma: no cover (import guard)
+    shared_task = None  # type: ignore
+
+from apps.core.constants import queues
+from apps.core.fairness.dispatch import dispatch
+
+
+def dispatch_fair_queues() -> dict:
+    """
+    Drain every fair queue into Celery (per-tenant DRR interleaving). Scheduled by beat.
+    """
+    return {q: dispatch(q) for q in queues.FAIR}
+
+
+if shared_task is not None:
+    dispatch_fair_queues_task = shared_task(name="messaging.dispatch_fair_queues")(dispatch_fair_queues)
+
+__all__ = ["dispatch_fair_queues"]
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from django.conf import settings
+
+try:
+    from celery import shared_task  # type: ignore
+except Exception:  # pragma: no cover (import guard)
+    shared_task = None  # type: ignore
+
+from apps.messaging.services import partitions
+
+
+def ensure_message_partitions() -> list:
+    """
+    Pre-create upcoming monthly Message partitions so inserts never miss a range.
+    No-op on non-Postgres databases or before the table is converted.
+    """
+    if not partitions.is_supported() or not partitions.is_partitioned():
+        return []
+    ahead = int(getattr(settings, "MESSAGE_PARTITIONS_AHEAD", 3))
+    return partitions.ensure_partitions(months_ahead=ahead)
+
+
+if shared_task is not None:
+    ensure_message_partitions_task = shared_task(name="messaging.ensure_message_partitions")(ensure_message_partitions)
+
+__all__ = ["ensure_message_partitions"]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.accounts.models.account import Account
+from apps.core.constants.channels import EMAIL, SMS
+from apps.messaging.models.message import Message
+from apps.messaging.models.message_body import MessageBody
+from apps.messaging.models.message_body_base import MessageBodyBase
+from apps.messaging.services import body_store
+from apps.messaging.services.archive_messages import ndjson_lines
+
+TEMPLATE = "<p>Hi {name}, you left {item} in your cart.</p>" + "<p>Free shipping on every order, easy returns.</p>" * 40
+
+
+class BodyStoreTests(TestCase):
+    def setUp(self):
+        self.account = Account.objects.create(api_key="k", name="Shop", sender_email="shop@example.com")
+        body_store.clear_cache()
+        self.addCleanup(body_store.clear_cache)
+
+    def _message(self, **kw):
+        return Message.objects.create(account=self.account, channel=EMAIL, **kw)
+
+    def test_put_many_dedups_identical_text(self):
+        digests = body_store.put_many(["same", "other", "same"])
+        self.assertEqual(digests[0], digests[2])
+        self.assertEqual(digests[0], body_store.digest_of("same"))
+        self.assertEqual(body_store.put("same"), digests[0])
+        self.assertEqual(MessageBody.objects.count(), 2)
+
+    def test_round_trip_with_template_base(self):
+        texts = [TEMPLATE.format(name=n, item="a lamp") for n in ("Ann", "Bob", "Cy")]
+        digests = body_store.put_for_template("revive1", texts)
+        base = MessageBodyBase.objects.get(key="revive1").body_id
+        self.assertEqual(base, digests[0])
+        row = MessageBody.objects.get(digest=digests[1])
+        self.assertEqual(row.base_id, base)
+        self.assertLess(len(row.data), row.raw_size // 10)
+
+        body_store.clear_cache()  # decode from the rows, not the write-side cache
+        self.assertEqual(body_store.get(digests[2]), texts[2])
+        self.assertEqual(body_store.get_many(digests + ["missing"]), dict(zip(digests, texts)))
+
+        body_store.clear_cache()
+        messages = [self._message(body_ref_id=d) for d in digests]
+        fresh = list(Message.objects.filter(pk__in=[m.pk for m in messages]).order_by("pk"))
+        with self.assertNumQueries(2):  # the bodies, then their base
+            body_store.attach_bodies(fresh)
+        with self.assertNumQueries(0):
+            self.assertEqual([m.body_text for m in fresh], texts)
+
+    def test_template_base_is_shared_across_processes(self):
+        first = body_store.put_for_template("revive2", [TEMPLATE.format(name="Ann", item="x")])[0]
+        body_store.clear_cache()  # another worker: nothing in memory
+        second = body_store.put_for_template("revive2", [TEMPLATE.format(name="Bob", item="y")])[0]
+        self.assertEqual(MessageBody.objects.get(digest=second).base_id, first)
+
+    def test_body_text_reads_inline_and_referenced_rows(self):
+        legacy = self._message(body="inline text")
+        stored = self._message(body_ref_id=body_store.put("stored text"))
+        empty = self._message()
+        body_store.clear_cache()
+        legacy, stored, empty = (Message.objects.get(pk=m.pk) for m in (legacy, stored, empty))
+        self.assertEqual(legacy.body_text, "inline text")
+        with self.assertNumQueries(1):
+            self.assertEqual(stored.body_text, "stored text")
+            self.assertEqual(stored.body_text, "stored text")
+        self.assertEqual(empty.body_text, "")
+
+    def test_backfill_moves_inline_bodies_into_the_store(self):
+        texts = [TEMPLATE.format(name=n, item="a lamp") for n in ("Ann", "Bob", "Ann")]
+        for t in texts:
+            self._message(subject="Your cart", body=t)
+        sms = Message.objects.create(account=self.account, channel=SMS, body="Your cart is waiting")
+
+        call_command("compact_message_bodies", batch=2, stdout=StringIO())
+
+        self.assertFalse(Message.objects.filter(body__isnull=False).exists())
+        self.assertFalse(Message.objects.filter(body_ref__isnull=True).exists())
+        self.assertEqual(MessageBody.objects.count(), 3)  # Ann twice -> one row
+        self.assertEqual(MessageBodyBase.objects.count(), 2)  # email step + sms
+        body_store.clear_cache()
+        by_pk = {m.pk: m.body_text for m in Message.objects.all()}
+        self.assertEqual(sorted(by_pk.values()), sorted(texts + ["Your cart is waiting"]))
+        self.assertEqual(by_pk[sms.pk], "Your cart is waiting")
+
+    def test_collect_garbage_keeps_referenced_bodies_and_bases(self):
+        digests = body_store.put_for_template("revive3", [TEMPLATE.format(name=n, item="x") for n in "AB"])
+        referenced = self._message(body_ref_id=digests[1])
+        orphan = body_store.put("nobody points here")
+        self.assertEqual(body_store.collect_garbage(), 1)
+        self.assertFalse(MessageBody.objects.filter(digest=orphan).exists())
+        self.assertEqual(MessageBody.objects.filter(digest__in=digests).count(), 2)
+
+        referenced.delete()
+        MessageBodyBase.objects.all().delete()
+        self.assertEqual(body_store.collect_garbage(), 2)  # the delta, then its freed base
+
+    def test_archive_lines_inline_the_body(self):
+        d = body_store.put_for_template("revive4", [TEMPLATE.format(name="A", item="x"), "delta text"])[1]
+        row = MessageBody.objects.get(digest=d)
+        body_store.clear_cache()
+        lines = ndjson_lines([
+            (json.dumps({"id": 1, "body": None, "body_digest": d}), row.codec, row.base_id, row.data),
+            (json.dumps({"id": 2, "body": "legacy", "body_digest": None}), None, None, None),
+        ]).splitlines()
+        self.assertEqual([json.loads(l)["body"] for l in lines], ["delta text", "legacy"])
@@ -0,0 +1,95 @@
+from __future__ import annotations
+import json
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from apps.accounts.models.account import Account
+from apps.core.constants.statuses import MSG_DELIVERED, MSG_QUEUED, MSG_SENT
+from apps.messaging.models.message import Message
+from apps.messaging.services import delivery_status
+from apps.messaging.services.delivery_status import BUFFER_KEY, RETRY_KEY, DeliveryEvent
+
+
+class FakeRedis:
+    def __init__(self):
+        self.lists = {}
+
+    def rpush(self, key, *values):
+        self.lists.setdefault(key, []).extend(values)
+
+    def lpush(self, key, *values):
+        for v in values:
+            self.lists.setdefault(key, []).insert(0, v)
+
+    def lpop(self, key, count):
+        items = self.lists.get(key, [])
+        out, self.lists[key] = items[:count], items[count:]
+        return out or None
+
+    def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+    def delete(self, key):
+        self.lists.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        client, calls = self, []
+
+        class Pipe:
+            def __getattr__(self, name):
+                return lambda *a: calls.append((getattr(client, name), a))
+
+            def execute(self):
+                return [fn(*a) for fn, a in calls]
+
+        return Pipe()
+
+
+@override_settings(DELIVERY_EVENTS_MAX_RETRIES=2, DELIVERY_STATUS_WINDOW_DAYS=30)
+class DrainTests(TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = mock.patch("apps.messaging.services.delivery_status.get_redis", return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch("apps.messaging.services.delivery_status._publish")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.account = Account.objects.create(api_key="k", name="Shop", sender_email="shop@example.com")
+
+    def _message(self, pmid):
+        return Message.objects.create(account=self.account, channel="sms", provider="twilio", provider_message_id=pmid)
+
+    def _retrying(self):
+        return [DeliveryEvent(*json.loads(r)) for r in self.redis.lists.get(RETRY_KEY, [])]
+
+    def test_only_moves_status_forward(self):
+        m = self._message("SM1")
+        delivery_status.buffer([DeliveryEvent("twilio", "SM1", MSG_DELIVERED, None, 1.0)])
+        delivery_status.buffer([DeliveryEvent("twilio", "SM1", MSG_SENT, None, 2.0)])
+        self.assertEqual(delivery_status.drain(), 1)
+        m.refresh_from_db()
+        self.assertEqual(m.status, MSG_DELIVERED)
+        self.assertEqual(self._retrying(), [])
+
+    def test_event_ahead_of_its_message_is_retried_on_a_later_drain(self):
+        delivery_status.buffer([DeliveryEvent("twilio", "SM2", MSG_SENT, None, 1.0)])
+        self.assertEqual(delivery_status.drain(), 0)
+        self.assertEqual([e.attempts for e in self._retrying()], [1])
+        self.assertEqual(self.redis.lists.get(BUFFER_KEY), [])
+
+        m = self._message("SM2")
+        self.assertEqual(m.status, MSG_QUEUED)
+        self.assertEqual(delivery_status.drain(), 1)
+        m.refresh_from_db()
+        self.assertEqual(m.status, MSG_SENT)
+        self.assertEqual(self._retrying(), [])
+
+    def test_unmatched_event_is_dropped_after_max_retries(self):
+        delivery_status.buffer([DeliveryEvent("twilio", "SM3", MSG_SENT, None, 1.0)])
+        for attempts in (1, 2):
+            delivery_status.drain()
+            self.assertEqual([e.attempts for e in self._retrying()], [attempts])
+        delivery_status.drain()
+        self.assertEqual(self._retrying(), [])
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class SequencesConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.sequences"
+    label = "sequences"
+
+    def ready(self) -> None:
+        from apps.sequences import signals  # noqa: F401  (connect receivers)
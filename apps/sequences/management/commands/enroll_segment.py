@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.leads.services.segments import SegmentError, compile_segment
+from apps.sequences.services.enroll_segment import CHUNK, enroll_segment
+
+
+class Command(BaseCommand):
+    help = (
+        "Enroll a segment of existing leads into a sequence, e.g. "
+        "--segment \"source = abandoned_cart, status = lost, created within 90d, cart_value > 50\""
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--account", type=int, required=True)
+        parser.add_argument("--sequence", type=int, required=True)
+        parser.add_argument("--segment", required=True, help="Segment expression (see apps.leads.services.segments).")
+        parser.add_argument("--chunk", type=int, default=CHUNK, help="Leads per INSERT ... SELECT.")
+        parser.add_argument("--reopen", action="store_true", help="Move enrolled paused/lost leads back to open.")
+        parser.add_argument("--dry-run", action="store_true", help="Only count matching leads.")
+
+    def handle(self, *args, account: int, sequence: int, segment: str, chunk: int, reopen: bool, dry_run: bool, **opts):
+        try:
+            seg = compile_segment(segment)
+        except SegmentError as exc:
+            raise CommandError(f"invalid segment: {exc}")
+
+        def report(done: int, total: int) -> None:
+            self.stdout.write(f"{done}/{total} leads ({done * 100 // max(1, total)}%)")
+
+        try:
+            res = enroll_segment(
+                account, sequence, seg, dry_run=dry_run, reopen=reopen, chunk=chunk, on_progress=report
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        if res.dry_run:
+            self.stdout.write(self.style.SUCCESS(f"dry-run: {res.matched} lead(s) match"))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f"done: {res.matched} matched, {res.enrolled} enrolled, {res.steps_created} step(s) scheduled"
+            ))
@@ -0,0 +1,4 @@
+from .sequence import Sequence
+from .scheduled_step import ScheduledStep
+
+__all__ = ["Sequence", "ScheduledStep"]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+from django.db import models
+from django.db.models import Q
+from apps.core.constants.statuses import STEP_PENDING, STEP_DONE, STEP_CANCELLED
+
+STEP_STATUS_CHOICES = [
+    (STEP_PENDING, "Pending"),
+    (STEP_DONE, "Done"),
+    (STEP_CANCELLED, "Cancelled"),
+]
+
+
+class ScheduledStep(models.Model):
+    """
+    One materialized step of a Sequence for one Lead, due at `run_at`.
+    Rows are created on enrollment and cancelled in bulk when the lead leaves
+    the sequence (see apps.leads.services.transitions).
+    """
+    account = models.ForeignKey("accounts.Account", on_delete=models.CASCADE, related_name="scheduled_steps")
+    lead = models.ForeignKey("leads.Lead", on_delete=models.CASCADE, related_name="scheduled_steps")
+    sequence = models.ForeignKey("sequences.Sequence", on_delete=models.CASCADE, related_name="scheduled_steps")
+
+    step_index = models.PositiveSmallIntegerField()
+    channel = models.CharField(max_length=8)
+    template = models.CharField(max_length=120)
+    run_at = models.DateTimeField()
+
+    status = models.CharField(max_length=10, choices=STEP_STATUS_CHOICES, default=STEP_PENDING)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "sequences"
+        constraints = [
+            models.UniqueConstraint(fields=["lead", "sequence", "step_index"], name="unique_step_per_lead_sequence"),
+        ]
+        indexes = [
+            # Scheduler scan: due pending steps only
+            models.Index(fields=["run_at"], condition=Q(status=STEP_PENDING), name="step_pending_due_idx"),
+            # Bulk cancel on lead transitions
+            models.Index(fields=["lead", "status"]),
+        ]
+        verbose_name = "Scheduled Step"
+        verbose_name_plural = "Scheduled Steps"
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"Lead<{self.lead_id}> step {self.step_index} [{self.channel}] @ {self.run_at} ({self.status})"
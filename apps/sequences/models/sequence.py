@@ -5,10 +5,12 @@ class Sequence(models.Model):
     """
     A cadence definition for an Account.
     Each step is a dict: {"t": "+2h", "channel": "email", "template": "revive1"}
+    `sources` limits the sequence to leads from those sources (empty = any source).
     """
     account = models.ForeignKey("accounts.Account", on_delete=models.CASCADE, related_name="sequences")
     name = models.CharField(max_length=120, default="Default Revival")
     steps = models.JSONField(default=list)  # e.g., [{"t":"+2h","channel":"email","template":"revive1"}]
+    sources = models.JSONField(default=list, blank=True)  # e.g., ["abandoned_cart"]
     active = models.BooleanField(default=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
@@ -0,0 +1,16 @@
+"""
+When a lead's sequence must stop. Mirrors apps.leads.services.transitions:
+any status outside the active set means pending steps are (or should be) cancelled.
+"""
+
+from __future__ import annotations
+
+from apps.core.constants.statuses import LEAD_NEW, LEAD_OPEN
+
+ACTIVE_LEAD_STATUSES = frozenset({LEAD_OPEN, LEAD_NEW})
+
+
+def should_stop(lead_status: str) -> bool:
+    return lead_status not in ACTIVE_LEAD_STATUSES
+
+__all__ = ["ACTIVE_LEAD_STATUSES", "should_stop"]
@@ -0,0 +1,156 @@
+"""
+Bulk-enroll a lead segment into a Sequence.
+
+The segment (apps.leads.services.segments) compiles to one lead queryset; steps are
+materialized without loading leads into Python:
+  - Postgres: per chunk of lead ids (keyset on pk), one
+      INSERT INTO scheduled_step ... SELECT lead.id, step.* FROM (<segment>) CROSS JOIN (VALUES <steps>)
+      ON CONFLICT (lead, sequence, step_index) DO NOTHING RETURNING lead_id
+  - elsewhere: the same chunks via bulk_create(ignore_conflicts=True).
+Each chunk commits on its own, so a long enrollment makes steady progress and
+re-running it is safe (already-enrolled steps are skipped).
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from apps.core.constants.statuses import LEAD_OPEN, STEP_PENDING
+from apps.core.db.router import use_replica
+from apps.leads.services.segments import Segment, segment_leads
+from .expand_steps import CompiledStep, compile_steps
+
+CHUNK = 5000
+
+Progress = Callable[[int, int], None]  # (leads processed, leads matched)
+
+
+class EnrollResult(NamedTuple):
+    matched: int
+    enrolled: int         # leads that got at least one new step
+    steps_created: int
+    dry_run: bool
+
+
+def _chunks(qs: QuerySet, chunk: int):
+    """
+    Yield consecutive (low, high] pk windows of at most `chunk` matching leads.
+    """
+    last = 0
+    while True:
+        window = list(qs.filter(pk__gt=last).order_by("pk").values_list("pk", flat=True)[chunk - 1:chunk])
+        if window:
+            yield last, window[0]
+            last = window[0]
+            continue
+        if qs.filter(pk__gt=last).exists():
+            yield last, None
+        return
+
+
+def _insert_postgres(
+    qs: QuerySet, account_id: int, sequence_id: int, steps: Tuple[CompiledStep, ...], start: datetime
+) -> Tuple[int, List[int]]:
+    from apps.sequences.models.scheduled_step import ScheduledStep
+
+    table = ScheduledStep._meta.db_table
+    sub_sql, sub_params = qs.values("id").query.sql_with_params()
+    values = ", ".join(["(%s::smallint, %s::varchar, %s::varchar, %s::timestamptz)"] * len(steps))
+    step_params: list = []
+    for s in steps:
+        step_params += [s.index, s.channel, s.template, start + s.offset]
+    now = timezone.now()
+    sql = (
+        f"INSERT INTO {table}"
+        f" (account_id, lead_id, sequence_id, step_index, channel, template, run_at, status, created_at, updated_at)"
+        f" SELECT %s, l.id, %s, s.column1, s.column2, s.column3, s.column4, %s, %s, %s"
+        f" FROM ({sub_sql}) AS l CROSS JOIN (VALUES {values}) AS s"
+        f" ON CONFLICT (lead_id, sequence_id, step_index) DO NOTHING"
+        f" RETURNING lead_id"
+    )
+    params = [account_id, sequence_id, STEP_PENDING, now, now, *sub_params, *step_params]
+    with connection.cursor() as cur:
+        cur.execute(sql, params)
+        lead_ids = [r[0] for r in cur.fetchall()]
+    return len(lead_ids), sorted(set(lead_ids))
+
+
+def _insert_generic(
+    qs: QuerySet, account_id: int, sequence_id: int, steps: Tuple[CompiledStep, ...], start: datetime
+) -> Tuple[int, List[int]]:
+    from apps.sequences.models.scheduled_step import ScheduledStep
+
+    lead_ids = list(qs.values_list("pk", flat=True))
+    existing = set(
+        ScheduledStep.objects.filter(lead_id__in=lead_ids, sequence_id=sequence_id)
+        .values_list("lead_id", "step_index")
+    )
+    rows = [
+        ScheduledStep(
+            account_id=account_id, lead_id=lead_id, sequence_id=sequence_id, step_index=s.index,
+            channel=s.channel, template=s.template, run_at=start + s.offset, status=STEP_PENDING,
+        )
+        for lead_id in lead_ids
+        for s in steps
+        if (lead_id, s.index) not in existing
+    ]
+    ScheduledStep.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+    return len(rows), sorted({r.lead_id for r in rows})
+
+
+def enroll_segment(
+    account_id: int,
+    sequence_id: int,
+    segment: str | Segment,
+    dry_run: bool = False,
+    reopen: bool = False,
+    start_at: Optional[datetime] = None,
+    chunk: int = CHUNK,
+    on_progress: Optional[Progress] = None,
+) -> EnrollResult:
+    """
+    Schedule every step of sequence `sequence_id` for the leads of `account_id` in `segment`.
+    Step times are relative to `start_at` (default: now). With `reopen`, enrolled leads in a
+    stopped state that may resume (paused/lost) move back to LEAD_OPEN so the scheduler runs them.
+    Raises SegmentError for a bad segment and ValueError for a bad/foreign sequence.
+    """
+    from apps.leads.services.transitions import transition
+    from apps.sequences.models.sequence import Sequence
+
+    seq = Sequence.objects.filter(pk=sequence_id, account_id=account_id).values_list("steps", flat=True).first()
+    if seq is None:
+        raise ValueError(f"sequence {sequence_id} not found for account {account_id}")
+    steps = compile_steps(seq)
+    if not steps:
+        raise ValueError(f"sequence {sequence_id} has no steps")
+
+    qs = segment_leads(account_id, segment)
+    if dry_run:
+        with use_replica():
+            return EnrollResult(qs.count(), 0, 0, True)
+    matched = qs.count()
+    if not matched:
+        return EnrollResult(0, 0, 0, False)
+
+    start = start_at or timezone.now()
+    insert = _insert_postgres if connection.vendor == "postgresql" else _insert_generic
+    processed = enrolled = created = 0
+    for low, high in _chunks(qs, max(1, chunk)):
+        window = qs.filter(pk__gt=low) if high is None else qs.filter(pk__gt=low, pk__lte=high)
+        with transaction.atomic():
+            n, lead_ids = insert(window, account_id, sequence_id, steps, start)
+            if reopen and lead_ids:
+                transition(lead_ids, LEAD_OPEN, account_id=account_id)
+        created += n
+        enrolled += len(lead_ids)
+        processed = min(matched, processed + max(1, chunk)) if high is not None else matched
+        if on_progress is not None:
+            on_progress(processed, matched)
+    return EnrollResult(matched, enrolled, created, False)
+
+
+__all__ = ["EnrollResult", "enroll_segment"]
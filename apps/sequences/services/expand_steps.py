@@ -0,0 +1,42 @@
+"""
+Compile Sequence.steps (JSON) into immutable, validated step tuples.
+Done once per sequence version (see pick_active_sequence), never per lead.
+"""
+
+from __future__ import annotations
+from datetime import timedelta
+from typing import Any, Iterable, Mapping, NamedTuple, Tuple
+
+from apps.core.constants.channels import EMAIL, SMS
+from apps.core.time.parse import parse_offset
+
+_CHANNELS = {EMAIL, SMS}
+
+
+class CompiledStep(NamedTuple):
+    index: int
+    offset: timedelta   # relative to enrollment
+    channel: str
+    template: str
+
+
+def compile_steps(steps: Iterable[Mapping[str, Any]]) -> Tuple[CompiledStep, ...]:
+    """
+    Validate and compile step dicts like {"t": "+2h", "channel": "email", "template": "revive1"}.
+    Raises ValueError on the first invalid step.
+    """
+    out = []
+    for i, step in enumerate(steps or []):
+        if not isinstance(step, Mapping):
+            raise ValueError(f"step {i}: must be an object")
+        channel = step.get("channel")
+        if channel not in _CHANNELS:
+            raise ValueError(f"step {i}: unknown channel {channel!r}")
+        template = step.get("template")
+        if not template or not isinstance(template, str):
+            raise ValueError(f"step {i}: template is required")
+        out.append(CompiledStep(i, parse_offset(step.get("t", "")), channel, template))
+    return tuple(out)
+
+
+__all__ = ["CompiledStep", "compile_steps"]
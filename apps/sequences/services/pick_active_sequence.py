@@ -0,0 +1,111 @@
+"""
+Pick the active Sequence for a new lead, from a per-account in-process cache.
+
+The cache holds each account's active sequences pre-compiled (steps parsed once)
+and is invalidated by a per-account version bumped on Sequence save/delete
+(apps.sequences.signals). Accounts with no active sequence are negatively cached,
+so enrollment costs no sequence queries on the hot path.
+
+Selection by lead source:
+  1) active sequences whose `sources` list contains the lead's source
+  2) otherwise active catch-all sequences (empty `sources`)
+  Ties go to the most recently created sequence.
+"""
+
+from __future__ import annotations
+import logging
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from apps.core.cache.versioned import VersionedCache
+from .expand_steps import CompiledStep, compile_steps
+
+log = logging.getLogger(__name__)
+
+
+class CompiledSequence(NamedTuple):
+    id: int
+    name: str
+    sources: FrozenSet[str]  # empty = any source
+    steps: Tuple[CompiledStep, ...]
+
+
+class SequencePlan(NamedTuple):
+    by_source: Dict[str, CompiledSequence]
+    fallback: Optional[CompiledSequence]
+
+    def pick(self, source: Optional[str]) -> Optional[CompiledSequence]:
+        if source:
+            hit = self.by_source.get(source)
+            if hit is not None:
+                return hit
+        return self.fallback
+
+
+def _load_plans(account_ids: Iterable[int]) -> Dict[int, SequencePlan]:
+    from apps.sequences.models.sequence import Sequence
+
+    ids = list(account_ids)
+    rows = (
+        Sequence.objects.filter(account_id__in=ids, active=True)
+        .order_by("account_id", "-created_at", "-pk")
+        .values_list("account_id", "pk", "name", "sources", "steps")
+    )
+    compiled: Dict[int, List[CompiledSequence]] = {}
+    for account_id, pk, name, sources, steps in rows:
+        try:
+            seq = CompiledSequence(pk, name, frozenset(sources or ()), compile_steps(steps))
+        except ValueError as exc:
+            log.warning("sequence %s skipped: %s", pk, exc)
+            continue
+        compiled.setdefault(account_id, []).append(seq)
+
+    plans = {}
+    for account_id, seqs in compiled.items():
+        by_source: Dict[str, CompiledSequence] = {}
+        fallback = None
+        for seq in seqs:  # newest first: first writer wins
+            for src in seq.sources:
+                by_source.setdefault(src, seq)
+            if not seq.sources and fallback is None:
+                fallback = seq
+        plans[account_id] = SequencePlan(by_source, fallback)
+    # Accounts absent here have no usable active sequence → negatively cached.
+    return plans
+
+
+_plans: VersionedCache[int, SequencePlan] = VersionedCache(
+    "sequences", _load_plans, "SEQUENCE_CACHE_CHECK_SECONDS"
+)
+
+
+def bump_version(account_id: int) -> None:
+    _plans.bump(account_id)
+
+
+def pick_active_sequence(account_id: Optional[int], source: Optional[str] = None) -> Optional[CompiledSequence]:
+    """
+    The compiled sequence a new lead from `source` should enter, or None.
+    """
+    if account_id is None:
+        return None
+    plan = _plans.get(account_id)
+    return plan.pick(source) if plan else None
+
+
+def pick_many(requests: Iterable[Tuple[int, Optional[str]]]) -> List[Optional[CompiledSequence]]:
+    """
+    Batch variant for bulk enrollment: [(account_id, source), ...] -> sequences, in order.
+    """
+    reqs = list(requests)
+    plans = _plans.get_many(a for a, _ in reqs if a is not None)
+    return [plans[a].pick(s) if a in plans else None for a, s in reqs]
+
+
+def clear_cache() -> None:
+    _plans.clear()
+
+
+__all__ = [
+    "CompiledSequence", "SequencePlan", "pick_active_sequence", "pick_many",
+    "bump_version", "clear_cache",
+]
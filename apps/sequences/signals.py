@@ -0,0 +1,15 @@
+from __future__ import annotations
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.sequences.models.sequence import Sequence
+from apps.sequences.services.pick_active_sequence import bump_version
+
+
+@receiver([post_save, post_delete], sender=Sequence, dispatch_uid="sequences_invalidate_plan")
+def _invalidate_on_sequence_change(sender, instance: Sequence, **kwargs) -> None:
+    # After commit, so a worker can't cache the old plan under the new version.
+    transaction.on_commit(partial(bump_version, instance.account_id))
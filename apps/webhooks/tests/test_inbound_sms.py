@@ -0,0 +1,56 @@
+from __future__ import annotations
+from unittest import mock
+from urllib.parse import urlencode
+
+from django.test import TestCase, override_settings
+
+from apps.accounts.models.account import Account
+from apps.contacts.models.contact import Contact
+from apps.contacts.models.suppression import Suppression
+from apps.core.constants.channels import SMS
+from apps.core.constants.statuses import LEAD_OPEN, LEAD_REPLY
+from apps.leads.models.lead import Lead
+from apps.webhooks.verify.twilio_sig import compute_signature
+
+URL = "/reclaimr/webhooks/twilio/inbound/"
+
+
+@override_settings(TWILIO_AUTH_TOKEN="tok", TWILIO_WEBHOOK_BASE_URL="")
+class InboundSmsTests(TestCase):
+    def setUp(self):
+        for target in ("apps.core.idempotency.store.get_redis", "apps.contacts.services.suppression_store.get_redis"):
+            patcher = mock.patch(target, return_value=None)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.account = Account.objects.create(api_key="k", name="Shop", sender_email="shop@example.com")
+        self.contact = Contact.objects.create(account=self.account, email="a@example.com", phone="+14155552671")
+        self.lead = Lead.objects.create(account=self.account, contact=self.contact, source="web_form")
+
+    def _post(self, body, sid="SM1", sender="+1 (415) 555-2671", signed=True):
+        params = {"MessageSid": sid, "From": sender, "To": "+15550000000", "Body": body}
+        headers = {"HTTP_X_TWILIO_SIGNATURE": compute_signature("tok", "http://testserver" + URL, params)} if signed else {}
+        return self.client.post(URL, urlencode(params), content_type="application/x-www-form-urlencoded", **headers)
+
+    def test_reply_marks_open_leads_replied(self):
+        resp = self._post("yes please")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp["Content-Type"], "text/xml")
+        self.lead.refresh_from_db()
+        self.assertEqual(self.lead.status, LEAD_REPLY)
+        self.assertFalse(Suppression.objects.exists())
+
+    def test_stop_suppresses_sms_only(self):
+        self._post(" stop ")
+        self.assertEqual(list(Suppression.objects.values_list("channel", "address")), [(SMS, "+14155552671")])
+        self.lead.refresh_from_db()
+        self.assertEqual(self.lead.status, LEAD_OPEN)
+
+    def test_unknown_sender_is_acknowledged(self):
+        self.assertEqual(self._post("hi", sender="+14155550000").status_code, 200)
+        self.lead.refresh_from_db()
+        self.assertEqual(self.lead.status, LEAD_OPEN)
+
+    def test_unsigned_request_is_rejected(self):
+        self.assertEqual(self._post("yes", signed=False).status_code, 401)
+        self.lead.refresh_from_db()
+        self.assertEqual(self.lead.status, LEAD_OPEN)
@@ -0,0 +1,11 @@
+from django.urls import path
+
+from apps.core.http.lazy import lazy_view
+
+urlpatterns = [
+    path("sendgrid/events/", lazy_view("apps.webhooks.views.delivery_status.sendgrid_events"), name="sendgrid_events"),
+    path("twilio/status/", lazy_view("apps.webhooks.views.delivery_status.twilio_status"), name="twilio_status"),
+    path("twilio/inbound/", lazy_view("apps.webhooks.views.inbound_sms.inbound_sms"), name="twilio_inbound_sms"),
+    path("shopify/checkouts/", lazy_view("apps.webhooks.views.shopify_abandoned.shopify_abandoned"), name="shopify_abandoned"),
+    path("shopify/orders/", lazy_view("apps.webhooks.views.shopify_order_created.shopify_order_created"), name="shopify_order_created"),
+]
@@ -0,0 +1,55 @@
+"""
+Twilio request signature check (X-Twilio-Signature).
+signature = base64(HMAC-SHA1(auth_token, full_url + concat(sorted POST key+value)))
+
+full_url is the URL Twilio called. Behind a TLS-terminating proxy Django sees
+http:// and an internal host, so set TWILIO_WEBHOOK_BASE_URL to the public origin
+(e.g. "https://app.example.com"); the request path and query are appended to it.
+"""
+
+from __future__ import annotations
+import base64
+import hashlib
+import hmac
+from typing import Mapping
+
+from django.conf import settings
+from django.http import HttpRequest
+
+from apps.core.constants.headers import TWILIO_SIGNATURE
+
+
+def compute_signature(auth_token: str, url: str, params: Mapping[str, str]) -> str:
+    payload = url + "".join(f"{k}{params[k]}" for k in sorted(params))
+    digest = hmac.new(auth_token.encode("utf-8"), payload.encode("utf-8"), hashlib.sha1).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def public_url(request: HttpRequest) -> str:
+    """
+    The URL Twilio signed: TWILIO_WEBHOOK_BASE_URL + path/query when configured,
+    else the URL as Django sees it.
+    """
+    base = (getattr(settings, "TWILIO_WEBHOOK_BASE_URL", "") or "").rstrip("/")
+    if base:
+        return base + request.get_full_path()
+    return request.build_absolute_uri()
+
+
+def verify_request(request: HttpRequest) -> bool:
+    """
+    True when the request carries a valid Twilio signature.
+    With no TWILIO_AUTH_TOKEN configured, verification is skipped only when DEBUG is on.
+    """
+    token = getattr(settings, "TWILIO_AUTH_TOKEN", "")
+    if not token:
+        return bool(getattr(settings, "DEBUG", False))
+    sig = request.META.get("HTTP_" + TWILIO_SIGNATURE.upper().replace("-", "_"), "")
+    if not sig:
+        return False
+    params = {k: request.POST.get(k) for k in request.POST}
+    expected = compute_signature(token, public_url(request), params)
+    return hmac.compare_digest(expected, sig)
+
+
+__all__ = ["compute_signature", "public_url", "verify_request"]
@@ -0,0 +1,32 @@
+from __future__ import annotations
+import json
+from typing import Any, Optional, Tuple
+
+from django.http import HttpRequest, HttpResponse
+
+from apps.core.constants.headers import SHOPIFY_SHOP_DOMAIN
+from apps.core.metering import meter
+from apps.webhooks.verify.shopify_hmac import verify_request
+
+
+def shopify_context(request: HttpRequest) -> Tuple[Optional[Any], Optional[dict], Optional[HttpResponse]]:
+    """
+    Shared preamble for Shopify webhooks: verify HMAC, resolve the Account by shop
+    domain, parse JSON. Returns (account, payload, None) or (None, None, error_response).
+    """
+    from apps.accounts.models.account import Account
+
+    if not verify_request(request):
+        return None, None, HttpResponse("invalid signature", status=401, content_type="text/plain")
+    domain = request.META.get("HTTP_" + SHOPIFY_SHOP_DOMAIN.upper().replace("-", "_"), "").strip().lower()
+    account = Account.objects.filter(shopify_domain=domain).first() if domain else None
+    if account is None:
+        return None, None, HttpResponse("unknown shop", status=404, content_type="text/plain")
+    meter.incr(account.pk, meter.webhook_calls("shopify"))
+    try:
+        payload = json.loads(request.body or b"{}")
+    except ValueError:
+        return None, None, HttpResponse("invalid json", status=400, content_type="text/plain")
+    if not isinstance(payload, dict):
+        return None, None, HttpResponse("expected an object", status=400, content_type="text/plain")
+    return account, payload, None
@@ -0,0 +1,67 @@
+from __future__ import annotations
+import json
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from apps.messaging.services import delivery_status
+from apps.webhooks.verify.twilio_sig import verify_request as verify_twilio
+
+
+def _verify_sendgrid(request) -> bool:
+    """
+    SendGrid Signed Event Webhook (ECDSA). Skipped only in DEBUG when no key is configured.
+    """
+    public_key = getattr(settings, "SENDGRID_WEBHOOK_PUBLIC_KEY", "")
+    if not public_key:
+        return bool(getattr(settings, "DEBUG", False))
+    try:
+        from sendgrid.helpers.eventwebhook import EventWebhook, EventWebhookHeader  # type: ignore
+    except Exception:
+        return False
+    sig = request.META.get("HTTP_" + EventWebhookHeader.SIGNATURE.upper().replace("-", "_"), "")
+    ts = request.META.get("HTTP_" + EventWebhookHeader.TIMESTAMP.upper().replace("-", "_"), "")
+    if not sig or not ts:
+        return False
+    ew = EventWebhook()
+    try:
+        return bool(ew.verify_signature(request.body.decode("utf-8"), sig, ts, ew.convert_public_key_to_ecdsa(public_key)))
+    except Exception:
+        return False
+
+
+@csrf_exempt
+@require_POST
+def sendgrid_events(request):
+    """
+    SendGrid Event Webhook: a JSON array of events per POST.
+    Events are buffered for batch application; we answer fast so SendGrid doesn't retry.
+    """
+    if not _verify_sendgrid(request):
+        return HttpResponse("invalid signature", status=403, content_type="text/plain")
+    try:
+        payload = json.loads(request.body or b"[]")
+    except ValueError:
+        return HttpResponse("invalid json", status=400, content_type="text/plain")
+    if not isinstance(payload, list):
+        return HttpResponse("expected a list", status=400, content_type="text/plain")
+    delivery_status.buffer(delivery_status.from_sendgrid(e for e in payload if isinstance(e, dict)))
+    return HttpResponse(status=204)
+
+
+@csrf_exempt
+@require_POST
+def twilio_status(request):
+    """
+    Twilio StatusCallback: one form-encoded event per POST.
+    """
+    if not verify_twilio(request):
+        return HttpResponse("invalid signature", status=403, content_type="text/plain")
+    event = delivery_status.from_twilio(request.POST)
+    if event is not None:
+        delivery_status.buffer([event])
+    return HttpResponse(status=204)
+
+__all__ = ["sendgrid_events", "twilio_status"]
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from django.http import HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from apps.contacts.services.suppression_store import normalize
+from apps.contacts.services.unsubscribe_contact import unsubscribe_contact
+from apps.core.constants.channels import SMS
+from apps.core.idempotency.webhooks import idempotent_webhook
+from apps.leads.services.mark_replied import mark_replied
+from apps.webhooks.verify.twilio_sig import verify_request
+
+# Twilio's default opt-out keywords (Twilio itself answers them and blocks further sends)
+STOP_WORDS = frozenset({"STOP", "STOPALL", "UNSUBSCRIBE", "CANCEL", "END", "QUIT"})
+
+_EMPTY_TWIML = '<?xml version="1.0" encoding="UTF-8"?><Response/>'
+
+
+@csrf_exempt
+@require_POST
+@idempotent_webhook("twilio", verify=verify_request)
+def inbound_sms(request):
+    """
+    Twilio incoming message. The sender is matched to contacts by phone:
+    an opt-out keyword suppresses SMS to them, anything else marks their
+    open leads as replied (which stops their sequences). Answers empty TwiML.
+    """
+    from apps.contacts.models.contact import Contact
+    from apps.leads.models.lead import Lead
+
+    sender = normalize(SMS, request.POST.get("From", ""))
+    contacts = list(Contact.objects.filter(phone=sender, account__isnull=False)) if sender else []
+    if contacts:
+        if (request.POST.get("Body") or "").strip().upper() in STOP_WORDS:
+            for contact in contacts:
+                unsubscribe_contact(contact, channels=(SMS,), reason="sms_stop")
+        else:
+            mark_replied(Lead.objects.filter(contact__in=contacts))
+    return HttpResponse(_EMPTY_TWIML, content_type="text/xml")
+
+__all__ = ["STOP_WORDS", "inbound_sms"]
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from django.db import transaction
+from django.http import HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from apps.contacts.services.upsert_contact import ContactRejected, upsert_contact
+from apps.core.idempotency.webhooks import idempotent_webhook
+from apps.leads.services.checkout_conversion import lead_for_token, record_checkout
+from apps.leads.services.create_lead import create_lead
+from apps.webhooks.verify.shopify_hmac import verify_request
+from ._shopify import shopify_context
+
+
+@csrf_exempt
+@require_POST
+@idempotent_webhook("shopify", verify=verify_request)
+def shopify_abandoned(request):
+    """
+    Shopify checkouts/create + checkouts/update.
+    Creates one abandoned-cart Lead per checkout token and records the
+    (account, checkout_token) mapping used by order conversion.
+    """
+    account, payload, error = shopify_context(request)
+    if error is not None:
+        return error
+
+    token = str(payload.get("token") or payload.get("checkout_token") or "")
+    email = (payload.get("email") or "").strip()
+    if not token or not email:
+        # Checkouts without an email can't be followed up; acknowledge so Shopify doesn't retry.
+        return HttpResponse(status=204)
+    if lead_for_token(account.pk, token) is not None:
+        return HttpResponse(status=200)  # checkouts/update for a known checkout
+
+    customer = payload.get("customer") or {}
+    name = " ".join(x for x in (customer.get("first_name"), customer.get("last_name")) if x)
+    metadata = {
+        "checkout_token": token,
+        "cart_value": payload.get("total_price"),
+        "currency": payload.get("currency"),
+        "recovery_url": payload.get("abandoned_checkout_url"),
+        "items": [
+            {"title": li.get("title"), "quantity": li.get("quantity"), "price": li.get("price")}
+            for li in payload.get("line_items") or []
+        ],
+    }
+    with transaction.atomic():
+        try:
+            contact = upsert_contact(account, email, name=name, phone=payload.get("phone"))
+        except ContactRejected:
+            # Disposable/role/malformed address: nothing to follow up; acknowledge so Shopify doesn't retry.
+            return HttpResponse(status=204)
+        lead = create_lead(account, contact, "abandoned_cart", metadata)
+        if not record_checkout(account, token, lead, email):
+            # Lost a race with a concurrent delivery for the same checkout.
+            transaction.set_rollback(True)
+            return HttpResponse(status=200)
+    return HttpResponse(status=201)
+
+__all__ = ["shopify_abandoned"]
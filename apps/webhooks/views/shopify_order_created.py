@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from apps.core.idempotency.webhooks import idempotent_webhook
+from apps.leads.services.checkout_conversion import Order, convert_orders
+from apps.webhooks.verify.shopify_hmac import verify_request
+from ._shopify import shopify_context
+
+
+@csrf_exempt
+@require_POST
+@idempotent_webhook("shopify", verify=verify_request)
+def shopify_order_created(request):
+    """
+    Shopify orders/create: find the abandoned-cart lead by checkout token
+    (email fallback), mark it LEAD_WON and stop its sequence.
+    """
+    account, payload, error = shopify_context(request)
+    if error is not None:
+        return error
+
+    order = Order(
+        checkout_token=str(payload.get("checkout_token") or "") or None,
+        email=(payload.get("email") or payload.get("contact_email") or "").strip() or None,
+    )
+    converted = convert_orders(account.pk, [order])
+    return JsonResponse({"converted": converted})
+
+__all__ = ["shopify_order_created"]
@@ -1,6 +1,8 @@
 from pathlib import Path
 import os
 
+from apps.core.db.config import database_from_url
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 # --- Core ---
@@ -25,11 +27,14 @@ INSTALLED_APPS = [
     "apps.leads",
     "apps.sequences",
     "apps.messaging",
+    "apps.webhooks",
     "apps.api",
 ]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "apps.core.load_shed.middleware.LoadShedMiddleware",
+    "apps.core.db.middleware.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -58,13 +63,29 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "config.wsgi.application"
 
-# --- Database: local sqlite for dev/tests ---
+# --- Databases: DATABASE_URL (primary) + optional REPLICA_DATABASE_URL (read replica) ---
+# Postgres aliases are pooled (psycopg_pool) or persistent; see apps.core.db.config.
+DATABASE_URL = os.getenv("DATABASE_URL", "")
+REPLICA_DATABASE_URL = os.getenv("REPLICA_DATABASE_URL", "")
+_DB_POOL = {
+    "pool": os.getenv("DB_POOL", "1") == "1",
+    "pool_min": int(os.getenv("DB_POOL_MIN", "2")),
+    "pool_max": int(os.getenv("DB_POOL_MAX", "10")),
+    "conn_max_age": int(os.getenv("DB_CONN_MAX_AGE", "600")),
+}
+
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+    "default": (
+        database_from_url(DATABASE_URL, BASE_DIR, **_DB_POOL) if DATABASE_URL
+        else {"ENGINE": "django.db.backends.sqlite3", "NAME": BASE_DIR / "db.sqlite3"}
+    ),
 }
+if REPLICA_DATABASE_URL:
+    DATABASES["replica"] = {**database_from_url(REPLICA_DATABASE_URL, BASE_DIR, **_DB_POOL), "TEST": {"MIRROR": "default"}}
+
+DATABASE_ROUTERS = ["apps.core.db.router.PrimaryReplicaRouter"]
+REPLICA_READ_PATHS = [p.strip() for p in os.getenv("REPLICA_READ_PATHS", "").split(",") if p.strip()]  # e.g. /admin/
+REPLICA_PIN_SECONDS = int(os.getenv("REPLICA_PIN_SECONDS", "5"))
 
 # --- Password validation (defaults) ---
 AUTH_PASSWORD_VALIDATORS = [
@@ -87,19 +108,145 @@ STATICFILES_DIRS = [BASE_DIR / "static"]
 MEDIA_URL = "media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
-# --- DRF minimal ---
+# --- DRF minimal (JSON via apps.core.http.fastjson; orjson when installed) ---
+FAST_JSON = os.getenv("FAST_JSON", "1") == "1"
 REST_FRAMEWORK = {
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "apps.core.http.renderers.FastJSONRenderer",
         "rest_framework.renderers.BrowsableAPIRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser",
+        "apps.core.http.parsers.FastJSONParser",
         "rest_framework.parsers.FormParser",
         "rest_framework.parsers.MultiPartParser",
     ],
 }
 
+# --- Redis (Upstash in prod): Celery broker + shared state ---
+REDIS_URL = os.getenv("REDIS_URL", "")
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", REDIS_URL)
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "2"))
+
+# --- Readiness probe: background refresh interval (seconds) ---
+READINESS_TTL_SECONDS = float(os.getenv("READINESS_TTL_SECONDS", "5"))
+
+# --- Load shedding: adaptive concurrency limit (AIMD on latency) + Celery backlog thresholds ---
+LOAD_SHED_ENABLED = os.getenv("LOAD_SHED_ENABLED", "1") == "1"
+LOAD_SHED_PATHS = ["/reclaimr/"]
+LOAD_SHED_EXEMPT_PATHS = ["/reclaimr/health/", "/reclaimr/ready/", "/reclaimr/activity/stream/"]
+LOAD_SHED_PRIORITY_PATHS = ["/reclaimr/webhooks/"]
+LOAD_SHED_TARGET_MS = float(os.getenv("LOAD_SHED_TARGET_MS", "500"))
+LOAD_SHED_INITIAL_LIMIT = int(os.getenv("LOAD_SHED_INITIAL_LIMIT", "20"))
+LOAD_SHED_MIN_LIMIT = int(os.getenv("LOAD_SHED_MIN_LIMIT", "4"))
+LOAD_SHED_MAX_LIMIT = int(os.getenv("LOAD_SHED_MAX_LIMIT", "200"))
+LOAD_SHED_BACKOFF = float(os.getenv("LOAD_SHED_BACKOFF", "0.9"))
+LOAD_SHED_PRIORITY_HEADROOM = float(os.getenv("LOAD_SHED_PRIORITY_HEADROOM", "0.5"))
+LOAD_SHED_QUEUE_SOFT = int(os.getenv("LOAD_SHED_QUEUE_SOFT", "5000"))
+LOAD_SHED_QUEUE_HARD = int(os.getenv("LOAD_SHED_QUEUE_HARD", "20000"))
+LOAD_SHED_DEPTH_TTL_SECONDS = float(os.getenv("LOAD_SHED_DEPTH_TTL_SECONDS", "2"))
+LOAD_SHED_RETRY_AFTER_S = int(os.getenv("LOAD_SHED_RETRY_AFTER_S", "5"))
+
+# --- Idempotency: how long stored ingest/webhook responses are replayable; how long an in-flight claim holds (seconds) ---
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", str(24 * 3600)))
+IDEMPOTENCY_PENDING_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_PENDING_TTL_SECONDS", "60"))
+
+# --- Message partitioning (Postgres): months pre-created ahead, months kept online ---
+MESSAGE_PARTITIONS_AHEAD = int(os.getenv("MESSAGE_PARTITIONS_AHEAD", "3"))
+MESSAGE_RETENTION_MONTHS = int(os.getenv("MESSAGE_RETENTION_MONTHS", "12"))
+# Status callbacks only match messages created this recently (prunes partitions); admin list default window
+DELIVERY_STATUS_WINDOW_DAYS = int(os.getenv("DELIVERY_STATUS_WINDOW_DAYS", "30"))
+ADMIN_MESSAGE_WINDOW_DAYS = int(os.getenv("ADMIN_MESSAGE_WINDOW_DAYS", "90"))
+
+# --- Per-tenant fair queues (deficit round-robin in front of Celery) ---
+FAIR_QUEUE_BATCH = int(os.getenv("FAIR_QUEUE_BATCH", "50"))
+FAIR_QUEUE_QUANTUM = float(os.getenv("FAIR_QUEUE_QUANTUM", "1"))
+FAIR_QUEUE_BUDGET_S = float(os.getenv("FAIR_QUEUE_BUDGET_S", "10"))
+FAIR_QUEUE_WEIGHTS: dict = {}  # {"<account_id>": weight}; default weight 1
+# Backpressure: publish only while a broker queue holds < concurrency * headroom messages
+FAIR_QUEUE_WORKER_CONCURRENCY = int(os.getenv("FAIR_QUEUE_WORKER_CONCURRENCY", os.getenv("CONCURRENCY", "2")))
+FAIR_QUEUE_BROKER_HEADROOM = float(os.getenv("FAIR_QUEUE_BROKER_HEADROOM", "2"))
+
+CELERY_BEAT_SCHEDULE = {
+    "ensure-message-partitions": {
+        "task": "messaging.ensure_message_partitions",
+        "schedule": 24 * 3600,
+    },
+    "dispatch-fair-queues": {
+        "task": "messaging.dispatch_fair_queues",
+        "schedule": 2.0,
+    },
+    "apply-delivery-events": {
+        "task": "webhooks.apply_delivery_events",
+        "schedule": 5.0,
+    },
+    "flush-usage": {
+        "task": "core.flush_usage",
+        "schedule": 30.0,
+    },
+    "purge-idempotency-keys": {
+        "task": "core.purge_idempotency_keys",
+        "schedule": 3600.0,
+    },
+}
+
+# --- Providers: SendGrid (email) / Twilio (SMS) credentials; SDKs load on first send ---
+SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY", "")
+# Provider API hosts; override only to point sends at a stub (tools/soak)
+SENDGRID_API_BASE_URL = os.getenv("SENDGRID_API_BASE_URL", "https://api.sendgrid.com")
+TWILIO_API_BASE_URL = os.getenv("TWILIO_API_BASE_URL", "https://api.twilio.com")
+TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID", "")
+TWILIO_FROM_NUMBER = os.getenv("TWILIO_FROM_NUMBER", "")
+
+# --- Delivery-status webhooks: provider secrets and batch sizes ---
+TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN", "")
+# Public origin Twilio calls (scheme + host); the signature covers it, and a TLS proxy hides it from Django
+TWILIO_WEBHOOK_BASE_URL = os.getenv("TWILIO_WEBHOOK_BASE_URL", "")
+SENDGRID_WEBHOOK_PUBLIC_KEY = os.getenv("SENDGRID_WEBHOOK_PUBLIC_KEY", "")
+DELIVERY_EVENTS_BATCH = int(os.getenv("DELIVERY_EVENTS_BATCH", "5000"))
+DELIVERY_EVENTS_MAX_BATCHES = int(os.getenv("DELIVERY_EVENTS_MAX_BATCHES", "20"))
+# Events for a message whose provider id isn't stored yet are retried on this many later drains
+DELIVERY_EVENTS_MAX_RETRIES = int(os.getenv("DELIVERY_EVENTS_MAX_RETRIES", "12"))
+
+# --- Admin: exact COUNT(*) up to this many rows, planner estimate beyond ---
+ADMIN_EXACT_COUNT_LIMIT = int(os.getenv("ADMIN_EXACT_COUNT_LIMIT", "10000"))
+
+# --- Usage meters: bucket width, per-process flush interval, "db" | "redis" (shared HINCRBY hash) ---
+USAGE_BUCKET_SECONDS = int(os.getenv("USAGE_BUCKET_SECONDS", "3600"))
+USAGE_FLUSH_SECONDS = float(os.getenv("USAGE_FLUSH_SECONDS", "10"))
+USAGE_METER_BACKEND = os.getenv("USAGE_METER_BACKEND", "db")
+
+# --- Activity feed (SSE): stream log length per account, heartbeat, client retry, token lifetime, per-connection buffer ---
+ACTIVITY_STREAM_MAXLEN = int(os.getenv("ACTIVITY_STREAM_MAXLEN", "1000"))
+ACTIVITY_HEARTBEAT_SECONDS = float(os.getenv("ACTIVITY_HEARTBEAT_SECONDS", "15"))
+ACTIVITY_RETRY_MS = int(os.getenv("ACTIVITY_RETRY_MS", "3000"))
+ACTIVITY_TOKEN_MAX_AGE = int(os.getenv("ACTIVITY_TOKEN_MAX_AGE", "3600"))
+ACTIVITY_QUEUE_SIZE = int(os.getenv("ACTIVITY_QUEUE_SIZE", "256"))
+
+# --- Contact quality gate (ingest + upsert_contact): disposable list (compiled by build_domain_set), role addresses, typo suggestions, phone default ---
+CONTACT_DISPOSABLE_DOMAINS_FILE = os.getenv("CONTACT_DISPOSABLE_DOMAINS_FILE", "")  # "" = apps/contacts/data/disposable_domains.txt
+CONTACT_REJECT_ROLE_ADDRESSES = os.getenv("CONTACT_REJECT_ROLE_ADDRESSES", "1") == "1"
+CONTACT_SUGGEST_EMAIL_TYPOS = os.getenv("CONTACT_SUGGEST_EMAIL_TYPOS", "1") == "1"
+CONTACT_DEFAULT_COUNTRY_CODE = os.getenv("CONTACT_DEFAULT_COUNTRY_CODE", "1")
+
+# --- Shopify webhooks: app secret, and how far back an order may match a checkout by email ---
+SHOPIFY_WEBHOOK_SECRET = os.getenv("SHOPIFY_WEBHOOK_SECRET", "")
+SHOPIFY_EMAIL_MATCH_DAYS = int(os.getenv("SHOPIFY_EMAIL_MATCH_DAYS", "30"))
+
+# --- Suppression (unsubscribes): worker Bloom sync interval / re-scanned trailing window / full rebuild / target FP rate ---
+SUPPRESSION_SYNC_SECONDS = float(os.getenv("SUPPRESSION_SYNC_SECONDS", "2"))
+SUPPRESSION_SYNC_OVERLAP_SECONDS = float(os.getenv("SUPPRESSION_SYNC_OVERLAP_SECONDS", "60"))
+SUPPRESSION_BLOOM_REBUILD_SECONDS = float(os.getenv("SUPPRESSION_BLOOM_REBUILD_SECONDS", "3600"))
+SUPPRESSION_BLOOM_FP = float(os.getenv("SUPPRESSION_BLOOM_FP", "0.001"))
+
+# --- Sender resolution cache: how often workers re-check the per-account version (seconds) ---
+SENDER_CACHE_CHECK_SECONDS = float(os.getenv("SENDER_CACHE_CHECK_SECONDS", "5"))
+
+# --- Active-sequence cache: how often workers re-check the per-account version (seconds) ---
+SEQUENCE_CACHE_CHECK_SECONDS = float(os.getenv("SEQUENCE_CACHE_CHECK_SECONDS", "5"))
+
+# --- Message body store: decoded bodies kept in the per-process LRU ---
+MESSAGE_BODY_CACHE_SIZE = int(os.getenv("MESSAGE_BODY_CACHE_SIZE", "1024"))
+
 # --- Email: console backend for local ---
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 DEFAULT_FROM_EMAIL = "Reclaimr <noreply@example.com>"
@@ -138,6 +285,7 @@ _required_reclaimr_apps = [
     "apps.leads",
     "apps.sequences",
     "apps.messaging",
+    "apps.webhooks",
     "apps.api",
 ]
 for _app in _required_reclaimr_apps:
@@ -0,0 +1,56 @@
+"""
+Celery application for Reclaimr.
+
+Run with:  celery -A config.settings.celery worker ...   (see scripts/run_celery.sh)
+
+Queues are split by channel and priority (apps.core.constants.queues). Outbound
+sends go through the per-tenant fairness layer (apps.core.fairness) and are
+published to their queue by the `messaging.dispatch_fair_queues` beat task.
+"""
+
+from __future__ import annotations
+import os
+
+from celery import Celery
+from celery.signals import worker_process_shutdown
+from kombu import Queue
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.base")
+
+from apps.core.constants import queues  # noqa: E402  (plain constants; no Django import)
+
+app = Celery("reclaimr")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+
+app.conf.task_queues = [Queue(name) for name in queues.ALL]
+app.conf.task_default_queue = queues.MAINTENANCE
+app.conf.task_routes = {
+    "webhooks.*": {"queue": queues.WEBHOOKS},
+    "messaging.ensure_message_partitions": {"queue": queues.MAINTENANCE},
+    "messaging.dispatch_fair_queues": {"queue": queues.MAINTENANCE},
+    "core.flush_usage": {"queue": queues.MAINTENANCE},
+    "core.purge_idempotency_keys": {"queue": queues.MAINTENANCE},
+}
+# Fair dispatch already interleaves tenants; don't let one worker hoard a big prefetch.
+app.conf.worker_prefetch_multiplier = 1
+app.conf.task_acks_late = True
+
+app.conf.imports = (
+    "apps.messaging.tasks.maintain_partitions",
+    "apps.messaging.tasks.dispatch_fair",
+    "apps.messaging.tasks.apply_delivery_events",
+    "apps.core.tasks.flush_usage",
+    "apps.core.tasks.purge_idempotency_keys",
+    "apps.leads.tasks.bulk_transition",
+    "apps.contacts.tasks.bulk_suppress",
+)
+
+
+@worker_process_shutdown.connect
+def _flush_usage_meters(**kwargs) -> None:
+    # Prefork children exit via os._exit, which skips atexit; flush meters explicitly.
+    from apps.core.metering.meter import flush_quietly
+
+    flush_quietly()
+
+__all__ = ["app"]
@@ -0,0 +1,51 @@
+"""
+Lean profile for API web processes and Celery workers:
+DJANGO_SETTINGS_MODULE=config.settings.lean
+
+Production settings (config.settings.prod) without the admin, sessions, the
+messages framework, staticfiles or DRF's session/basic auth. Nothing here serves
+HTML or logs users in: API views authenticate with X-Account-Key and webhooks
+verify provider signatures. Run the admin from a separate process on
+config.settings.prod. `python manage.py import_report` compares boot cost.
+"""
+
+from config.settings.prod import *  # noqa: F401,F403
+from config.settings.prod import INSTALLED_APPS, MIDDLEWARE, REST_FRAMEWORK, TEMPLATES
+
+_DROPPED_APPS = {
+    "django.contrib.admin",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+}
+_DROPPED_MIDDLEWARE = {
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+}
+_DROPPED_CONTEXT_PROCESSORS = {
+    "django.contrib.auth.context_processors.auth",
+    "django.contrib.messages.context_processors.messages",
+}
+
+INSTALLED_APPS = [a for a in INSTALLED_APPS if a not in _DROPPED_APPS]
+MIDDLEWARE = [m for m in MIDDLEWARE if m not in _DROPPED_MIDDLEWARE]
+TEMPLATES = [
+    {
+        **t,
+        "OPTIONS": {
+            **t.get("OPTIONS", {}),
+            "context_processors": [
+                p for p in t.get("OPTIONS", {}).get("context_processors", []) if p not in _DROPPED_CONTEXT_PROCESSORS
+            ],
+        },
+    }
+    for t in TEMPLATES
+]
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    "DEFAULT_AUTHENTICATION_CLASSES": [],
+    "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.AllowAny"],
+    "UNAUTHENTICATED_USER": None,
+}
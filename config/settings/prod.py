@@ -0,0 +1,17 @@
+"""
+Production profile: DJANGO_SETTINGS_MODULE=config.settings.prod
+Everything from config.base, minus debug and the browsable API (JSON only).
+"""
+
+import os
+
+from config.base import *  # noqa: F401,F403
+from config.base import REST_FRAMEWORK
+
+DEBUG = os.getenv("DJANGO_DEBUG", "0") == "1"
+ALLOWED_HOSTS = [h.strip() for h in os.getenv("DJANGO_ALLOWED_HOSTS", "").split(",") if h.strip()] or ["localhost"]
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    "DEFAULT_RENDERER_CLASSES": ["apps.core.http.renderers.FastJSONRenderer"],
+}
@@ -1,7 +1,13 @@
-from django.contrib import admin
+from django.apps import apps
 from django.urls import path, include
 
 urlpatterns = [
-    path("admin/", admin.site.urls),
     path("reclaimr/", include("apps.api.urls")),
+    path("reclaimr/webhooks/", include("apps.webhooks.urls")),
 ]
+
+# The lean profile (config.settings.lean) leaves the admin out entirely.
+if apps.is_installed("django.contrib.admin"):
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path("admin/", admin.site.urls))
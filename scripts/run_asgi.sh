@@ -0,0 +1,27 @@
+#!/usr/bin/env bash
+# Reclaimr — ASGI web server (uvicorn)
+# Usage:
+#   bash scripts/run_asgi.sh
+#
+# Serves every route; required for the live activity feed
+# (/reclaimr/activity/stream/), which holds one long-lived SSE connection per
+# dashboard. Under WSGI (gunicorn, PythonAnywhere's default web app) that
+# endpoint answers 501.
+#
+# Env:
+#   HOST      (default: 127.0.0.1)
+#   PORT      (default: 8000)
+#   WORKERS   (default: 1)
+#   LOGLEVEL  (default: info)
+#   DJANGO_SETTINGS_MODULE (default: config.settings.prod)
+
+set -euo pipefail
+
+HOST="${HOST:-127.0.0.1}"
+PORT="${PORT:-8000}"
+WORKERS="${WORKERS:-1}"
+LOGLEVEL="${LOGLEVEL:-info}"
+export DJANGO_SETTINGS_MODULE="${DJANGO_SETTINGS_MODULE:-config.settings.prod}"
+
+exec uvicorn config.asgi:application --host "$HOST" --port "$PORT" --workers "$WORKERS" \
+  --log-level "$LOGLEVEL" --proxy-headers --timeout-graceful-shutdown 5
@@ -0,0 +1,109 @@
+"""
+JSON encode/decode benchmark: stock DRF/stdlib vs apps.core.http.fastjson.
+
+  python -m tools.bench.json_codec --rows 500 --batch 200 --repeat 200
+
+Cases:
+  - list endpoint: render N lead rows (DRF JSONRenderer vs FastJSONRenderer)
+  - batch ingest:  parse a body of N LeadIn payloads (DRF JSONParser vs FastJSONParser)
+  - core.http:     JsonResponse vs FastJsonResponse for the same list
+Prints per-call timings and the speed-up; no DB or network.
+"""
+
+from __future__ import annotations
+import argparse
+import io
+import os
+import timeit
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Tuple
+
+
+def _rows(n: int) -> List[dict]:
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "id": i,
+            "status": "open",
+            "source": "abandoned_cart",
+            "created_at": (now + timedelta(seconds=i)).isoformat(),
+            "contact": {"id": i, "email": f"user{i}@example.com", "name": f"Ünïcode User {i}", "phone": "+15555550123"},
+            "metadata": {
+                "cart_value": "129.90",
+                "currency": "USD",
+                "items": [{"title": "Widget", "quantity": 2, "price": "64.95"}] * 3,
+            },
+        }
+        for i in range(n)
+    ]
+
+
+def _ingest_batch(n: int) -> List[dict]:
+    return [
+        {
+            "source": "web_form",
+            "contact": {"email": f"user{i}@example.com", "name": f"User {i}", "phone": "+15555550123"},
+            "metadata": {"utm_source": "newsletter", "page": "/pricing", "score": i % 100},
+        }
+        for i in range(n)
+    ]
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    # Best of 3 runs, reported per call in microseconds.
+    return min(timeit.repeat(fn, number=repeat, repeat=3)) / repeat * 1e6
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(prog="python -m tools.bench.json_codec", description=__doc__.split("\n")[1])
+    ap.add_argument("--rows", type=int, default=500, help="Rows in the list-endpoint payload")
+    ap.add_argument("--batch", type=int, default=200, help="Leads in the batch-ingest body")
+    ap.add_argument("--repeat", type=int, default=200)
+    args = ap.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.base")
+    import django
+
+    django.setup()
+
+    from django.http import JsonResponse
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+
+    from apps.core.http import fastjson
+    from apps.core.http.fastjson import FastJsonResponse
+    from apps.core.http.parsers import FastJSONParser
+    from apps.core.http.renderers import FastJSONRenderer
+
+    if not fastjson.enabled():
+        print("[warn] orjson not installed (or FAST_JSON off): fast path falls back to stdlib json")
+
+    rows = _rows(args.rows)
+    body = JSONRenderer().render(_ingest_batch(args.batch))
+    std_r, fast_r = JSONRenderer(), FastJSONRenderer()
+    std_p, fast_p = JSONParser(), FastJSONParser()
+
+    cases: List[Tuple[str, Callable[[], object], Callable[[], object]]] = [
+        (f"list endpoint render ({args.rows} rows)", lambda: std_r.render(rows), lambda: fast_r.render(rows)),
+        (
+            f"batch ingest parse ({args.batch} leads, {len(body) // 1024} KiB)",
+            lambda: std_p.parse(io.BytesIO(body)),
+            lambda: fast_p.parse(io.BytesIO(body)),
+        ),
+        (
+            f"core.http response ({args.rows} rows)",
+            lambda: JsonResponse(rows, safe=False, json_dumps_params={"ensure_ascii": False}),
+            lambda: FastJsonResponse(rows, safe=False),
+        ),
+    ]
+
+    assert std_p.parse(io.BytesIO(body)) == fast_p.parse(io.BytesIO(body))
+
+    print(f"{'case':<48} {'stock us':>10} {'fast us':>10} {'speed-up':>9}")
+    for name, stock, fast in cases:
+        a, b = _time(stock, args.repeat), _time(fast, args.repeat)
+        print(f"{name:<48} {a:>10.1f} {b:>10.1f} {a / b:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Reclaimr end-to-end soak harness (python -m tools.soak --help)
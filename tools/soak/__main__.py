@@ -0,0 +1,135 @@
+"""
+Reclaimr soak harness.
+
+  python -m tools.soak --base-url http://127.0.0.1:8000 --key acc_live_test \\
+      --rate ingest=20 --rate shopify_checkout=5 --rate shopify_order=1 --rate inbound_sms=2 \\
+      --duration 300 --fake-redis --pg-dsn postgresql://localhost/reclaimr
+
+Starts stub SendGrid/Twilio servers (and optionally a fakeredis server), prints the
+settings to point the app at them, drives traffic, then reports:
+  - HTTP status mix and latency per traffic kind
+  - sends accepted by the provider stubs
+  - queue backlog over time, DB query rates over time
+Lead-to-first-message latency is not reported: nothing in the app sends on lead
+creation yet, so there is no first message to time.
+"""
+
+from __future__ import annotations
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from .metrics import Sampler
+from .stubs import Recorder, start_fake_redis, start_provider_stub
+from .traffic import PATHS, Config, Stats, run_kind
+
+
+def _pct(values: List[float], p: float) -> float:
+    if not values:
+        return 0.0
+    s = sorted(values)
+    return round(s[min(len(s) - 1, int(p / 100.0 * len(s)))], 1)
+
+
+def _parse_rates(items: List[str]) -> Dict[str, float]:
+    rates = {}
+    for item in items:
+        kind, _, value = item.partition("=")
+        if kind not in PATHS:
+            raise SystemExit(f"[error] unknown traffic kind: {kind} (use {', '.join(PATHS)})")
+        rates[kind] = float(value)
+    return rates
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(prog="python -m tools.soak", description="Reclaimr end-to-end soak harness")
+    ap.add_argument("--base-url", default="http://127.0.0.1:8000")
+    ap.add_argument("--key", default="acc_live_test", help="X-Account-Key for /ingest/")
+    ap.add_argument("--rate", action="append", default=[], help="kind=req_per_s (repeatable)")
+    ap.add_argument("--duration", type=float, default=60.0)
+    ap.add_argument("--drain", type=float, default=30.0, help="Seconds to keep measuring after traffic stops")
+    ap.add_argument("--concurrency", type=int, default=64)
+    ap.add_argument("--sample-interval", type=float, default=5.0)
+    ap.add_argument("--stub-host", default="127.0.0.1")
+    ap.add_argument("--sendgrid-port", type=int, default=18025)
+    ap.add_argument("--twilio-port", type=int, default=18026)
+    ap.add_argument("--fake-redis", action="store_true", help="Start fakeredis on --redis-port")
+    ap.add_argument("--redis-port", type=int, default=16379)
+    ap.add_argument("--redis-url", default="", help="Sample backlog from this Redis")
+    ap.add_argument("--pg-dsn", default="", help="Sample pg_stat_database from this DSN")
+    ap.add_argument("--shopify-secret", default="")
+    ap.add_argument("--twilio-token", default="", help="TWILIO_AUTH_TOKEN, to sign inbound SMS")
+    args = ap.parse_args()
+
+    rates = _parse_rates(args.rate) or {"ingest": 5.0}
+
+    recorder = Recorder()
+    servers = [
+        start_provider_stub(args.stub_host, args.sendgrid_port, recorder),
+        start_provider_stub(args.stub_host, args.twilio_port, recorder),
+    ]
+    redis_url = args.redis_url
+    if args.fake_redis:
+        started = start_fake_redis(args.stub_host, args.redis_port)
+        if started is None:
+            raise SystemExit("[error] --fake-redis needs 'pip install fakeredis'")
+        servers.append(started[0])
+        redis_url = redis_url or started[1]
+
+    print("== Reclaimr soak ==")
+    print(f"SENDGRID_API_BASE_URL=http://{args.stub_host}:{args.sendgrid_port}")
+    print(f"TWILIO_API_BASE_URL=http://{args.stub_host}:{args.twilio_port}")
+    if redis_url:
+        print(f"REDIS_URL={redis_url}")
+    print(f"target={args.base_url} rates={rates} duration={args.duration}s")
+
+    cfg = Config(args.base_url, args.key, args.shopify_secret, args.twilio_token)
+    stats = Stats()
+    sampler = Sampler(args.sample_interval, redis_url or None, args.pg_dsn or None)
+    sampler.start()
+
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        gens = [run_kind(k, r, args.duration, cfg, stats, pool, stop, seed=i + 1) for i, (k, r) in enumerate(rates.items())]
+        try:
+            for g in gens:
+                g.join()
+        except KeyboardInterrupt:
+            stop.set()
+    print(f"[soak] traffic done; draining {args.drain}s")
+    try:
+        time.sleep(args.drain)
+    except KeyboardInterrupt:
+        pass
+    sampler.stop()
+    for s in servers:
+        s.shutdown()
+
+    _report(stats, recorder, sampler)
+
+
+def _report(stats: Stats, recorder: Recorder, sampler: Sampler) -> None:
+    print("\n== HTTP ==")
+    for kind, counter in sorted(stats.status.items()):
+        lat = stats.latency_ms.get(kind, [])
+        mix = ", ".join(f"{code or 'err'}:{n}" for code, n in sorted(counter.items()))
+        print(f"{kind:<18} n={len(lat):<7} p50={_pct(lat, 50)}ms p95={_pct(lat, 95)}ms p99={_pct(lat, 99)}ms  [{mix}]")
+
+    print("\n== Provider stubs ==")
+    print(f"sendgrid={recorder.counts.get('sendgrid', 0)} twilio={recorder.counts.get('twilio', 0)}")
+
+    if sampler.backlog:
+        print("\n== Queue backlog ==")
+        for t, sample in sampler.backlog:
+            busy = {k: v for k, v in sample.items() if v}
+            print(f"t={t:6.1f}s {busy or 'empty'}")
+    if sampler.db_rates:
+        print("\n== DB rates ==")
+        for t, rates in sampler.db_rates:
+            print(f"t={t:6.1f}s {rates}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Periodic samplers: broker/fair-queue backlog (Redis) and DB query rates (Postgres).
+"""
+
+from __future__ import annotations
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+CELERY_QUEUES = ["webhooks", "email.high", "email.bulk", "sms.high", "sms.bulk", "maintenance"]
+
+
+def _redis(url: str):
+    try:
+        import redis  # type: ignore
+    except Exception:
+        return None
+    return redis.Redis.from_url(url, socket_timeout=2)
+
+
+def sample_backlog(client) -> Dict[str, int]:
+    """
+    Celery queue lengths plus pending items in the per-tenant fair queues.
+    """
+    out: Dict[str, int] = {}
+    pipe = client.pipeline(transaction=False)
+    for q in CELERY_QUEUES:
+        pipe.llen(q)
+    for q, n in zip(CELERY_QUEUES, pipe.execute()):
+        out[q] = int(n)
+    for q in ("email.high", "email.bulk", "sms.high", "sms.bulk"):
+        accounts = client.smembers(f"reclaimr:fq:{q}:active")
+        if accounts:
+            pipe = client.pipeline(transaction=False)
+            for a in accounts:
+                a = a.decode() if isinstance(a, bytes) else a
+                pipe.llen(f"reclaimr:fq:{q}:t:{a}")
+            out[f"fair:{q}"] = sum(int(n) for n in pipe.execute())
+        else:
+            out[f"fair:{q}"] = 0
+    out["delivery_events"] = int(client.llen("reclaimr:dlv:buf"))
+    return out
+
+
+_PG_SQL = (
+    "SELECT xact_commit + xact_rollback, tup_returned + tup_fetched, "
+    "tup_inserted, tup_updated, tup_deleted FROM pg_stat_database WHERE datname = current_database()"
+)
+
+
+class Sampler:
+    def __init__(self, interval: float, redis_url: Optional[str], pg_dsn: Optional[str]):
+        self.interval = interval
+        self.redis = _redis(redis_url) if redis_url else None
+        self.pg_dsn = pg_dsn
+        self.backlog: List[Tuple[float, Dict[str, int]]] = []
+        self.db_rates: List[Tuple[float, Dict[str, float]]] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=self.interval + 2)
+
+    def _pg_counters(self, conn) -> Optional[Tuple[int, ...]]:
+        with conn.cursor() as cur:
+            cur.execute(_PG_SQL)
+            row = cur.fetchone()
+        return tuple(int(x) for x in row) if row else None
+
+    def _loop(self) -> None:
+        conn = None
+        if self.pg_dsn:
+            try:
+                import psycopg  # type: ignore
+
+                conn = psycopg.connect(self.pg_dsn, autocommit=True)
+            except Exception as exc:
+                print(f"[soak] pg sampling disabled: {exc}")
+        t0 = time.monotonic()
+        prev = self._pg_counters(conn) if conn else None
+        prev_t = time.monotonic()
+        while not self._stop.wait(self.interval):
+            now = time.monotonic()
+            if self.redis is not None:
+                try:
+                    self.backlog.append((now - t0, sample_backlog(self.redis)))
+                except Exception as exc:
+                    print(f"[soak] backlog sample failed: {exc}")
+            if conn is not None and prev is not None:
+                cur = self._pg_counters(conn)
+                dt = max(now - prev_t, 1e-6)
+                names = ("xact_per_s", "rows_read_per_s", "inserts_per_s", "updates_per_s", "deletes_per_s")
+                self.db_rates.append((now - t0, {n: round((c - p) / dt, 1) for n, c, p in zip(names, cur, prev)}))
+                prev, prev_t = cur, now
+        if conn is not None:
+            conn.close()
+
+
+__all__ = ["Sampler", "sample_backlog"]
@@ -0,0 +1,93 @@
+"""
+Local stand-ins for SendGrid, Twilio and Redis.
+
+- SendGrid stub: POST /v3/mail/send -> 202 with X-Message-Id
+- Twilio stub:   POST /2010-04-01/Accounts/<sid>/Messages.json -> 201 {"sid": ...}
+Both count accepted sends per provider for the report.
+
+Redis: fakeredis' TCP server when installed (pip install fakeredis); otherwise
+point --redis-url at a real local redis-server.
+"""
+
+from __future__ import annotations
+import json
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs
+
+
+class Recorder:
+    """Thread-safe totals of accepted sends per provider."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = {"sendgrid": 0, "twilio": 0}
+
+    def record(self, provider: str, recipient: str) -> None:
+        with self._lock:
+            self.counts[provider] = self.counts.get(provider, 0) + 1
+
+
+def _handler(recorder: Recorder):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):  # keep the console for the report
+            pass
+
+        def _body(self) -> bytes:
+            n = int(self.headers.get("Content-Length") or 0)
+            return self.rfile.read(n) if n else b""
+
+        def do_POST(self):
+            body = self._body()
+            if self.path.startswith("/v3/mail/send"):
+                try:
+                    payload = json.loads(body or b"{}")
+                    for p in payload.get("personalizations", []):
+                        for to in p.get("to", []):
+                            recorder.record("sendgrid", to.get("email", ""))
+                except ValueError:
+                    pass
+                self.send_response(202)
+                self.send_header("X-Message-Id", uuid.uuid4().hex[:22])
+                self.end_headers()
+                return
+            if self.path.startswith("/2010-04-01/Accounts/") and self.path.endswith("/Messages.json"):
+                form = parse_qs(body.decode("utf-8", "replace"))
+                to = (form.get("To") or [""])[0]
+                recorder.record("twilio", to)
+                out = json.dumps({"sid": "SM" + uuid.uuid4().hex, "status": "queued", "to": to}).encode()
+                self.send_response(201)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(out)))
+                self.end_headers()
+                self.wfile.write(out)
+                return
+            self.send_response(404)
+            self.end_headers()
+
+    return Handler
+
+
+def start_provider_stub(host: str, port: int, recorder: Recorder) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), _handler(recorder))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name=f"stub-{port}", daemon=True).start()
+    return server
+
+
+def start_fake_redis(host: str, port: int) -> Optional[Tuple[object, str]]:
+    """
+    Start fakeredis' TCP server; returns (server, url) or None when fakeredis is missing.
+    """
+    try:
+        from fakeredis import TcpFakeServer  # type: ignore
+    except Exception:
+        return None
+    server = TcpFakeServer((host, port), server_type="redis")
+    threading.Thread(target=server.serve_forever, name="fake-redis", daemon=True).start()
+    return server, f"redis://{host}:{port}/0"
+
+
+__all__ = ["Recorder", "start_provider_stub", "start_fake_redis"]
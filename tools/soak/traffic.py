@@ -0,0 +1,176 @@
+"""
+Traffic generators: widget submits, Shopify checkout/order webhooks, inbound Twilio SMS.
+Inbound SMS come from the phones given on earlier submits, so replies and STOPs
+hit real contacts and leads. Each kind is paced at a fixed rate by its own thread and sent through a shared pool.
+"""
+
+from __future__ import annotations
+import base64
+import hashlib
+import hmac
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
+from urllib.parse import urlencode
+
+# kind -> default path under --base-url
+PATHS = {
+    "ingest": "/reclaimr/ingest/",
+    "shopify_checkout": "/reclaimr/webhooks/shopify/checkouts/",
+    "shopify_order": "/reclaimr/webhooks/shopify/orders/",
+    "inbound_sms": "/reclaimr/webhooks/twilio/inbound/",
+}
+
+
+class Config:
+    def __init__(self, base_url: str, api_key: str, shopify_secret: str = "", twilio_token: str = "",
+                 shop_domain: str = "soak.myshopify.com"):
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.shopify_secret = shopify_secret
+        self.twilio_token = twilio_token
+        self.shop_domain = shop_domain
+
+
+class Stats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.status: Dict[str, Counter] = {}
+        self.latency_ms: Dict[str, List[float]] = {}
+        self.checkouts: List[Tuple[str, str]] = []  # (token, email) for order conversion
+        self.phones: List[str] = []  # submitted contact phones, senders for inbound SMS
+
+    def record(self, kind: str, status: int, ms: float) -> None:
+        with self._lock:
+            self.status.setdefault(kind, Counter())[status] += 1
+            self.latency_ms.setdefault(kind, []).append(ms)
+
+
+def _post(url: str, body: bytes, headers: Dict[str, str], timeout: float = 15.0) -> int:
+    req = urllib.request.Request(url, data=body, headers=headers, method="POST")
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            resp.read()
+            return resp.status
+    except urllib.error.HTTPError as exc:
+        return exc.code
+    except Exception:
+        return 0  # connection error / timeout
+
+
+def _n(i: int) -> str:
+    return f"{i:08d}"
+
+
+def _phone(i: int) -> str:
+    # NANP-plausible (exchange 220-289, never N11) so the contact quality gate keeps it
+    return f"+1415{220 + i % 70}{i % 10000:04d}"
+
+
+# --- request builders: return (body, headers) ---
+def build_ingest(cfg: Config, i: int, rng: random.Random, stats: Stats):
+    email = f"soak+{_n(i)}@example.test"
+    phone = _phone(i)
+    body = json.dumps({
+        "source": "web_form",
+        "contact": {"email": email, "name": f"Soak {i}", "phone": phone},
+        "metadata": {"utm_source": rng.choice(["google", "meta", "email"])},
+    }).encode()
+    with stats._lock:
+        stats.phones.append(phone)
+    headers = {"Content-Type": "application/json", "X-Account-Key": cfg.api_key, "Idempotency-Key": f"soak-{i}"}
+    return body, headers
+
+
+def _shopify_headers(cfg: Config, topic: str, body: bytes, i: int) -> Dict[str, str]:
+    digest = hmac.new(cfg.shopify_secret.encode(), body, hashlib.sha256).digest() if cfg.shopify_secret else b""
+    return {
+        "Content-Type": "application/json",
+        "X-Shopify-Topic": topic,
+        "X-Shopify-Shop-Domain": cfg.shop_domain,
+        "X-Shopify-Webhook-Id": f"soak-{topic}-{i}",
+        "X-Shopify-Hmac-SHA256": base64.b64encode(digest).decode(),
+    }
+
+
+def build_shopify_checkout(cfg: Config, i: int, rng: random.Random, stats: Stats):
+    email = f"cart+{_n(i)}@example.test"
+    token = f"chk{_n(i)}"
+    body = json.dumps({
+        "id": i, "token": token, "email": email,
+        "total_price": f"{rng.uniform(10, 400):.2f}", "currency": "USD",
+        "abandoned_checkout_url": f"https://{cfg.shop_domain}/checkouts/{token}",
+        "line_items": [{"title": "Soak Item", "quantity": rng.randint(1, 3)}],
+    }).encode()
+    with stats._lock:
+        stats.checkouts.append((token, email))
+    return body, _shopify_headers(cfg, "checkouts/create", body, i)
+
+
+def build_shopify_order(cfg: Config, i: int, rng: random.Random, stats: Stats):
+    with stats._lock:
+        token, email = rng.choice(stats.checkouts) if stats.checkouts else (f"chk{_n(i)}", f"cart+{_n(i)}@example.test")
+    body = json.dumps({"id": 10_000_000 + i, "checkout_token": token, "email": email,
+                       "total_price": "42.00"}).encode()
+    return body, _shopify_headers(cfg, "orders/create", body, i)
+
+
+def build_inbound_sms(cfg: Config, i: int, rng: random.Random, stats: Stats):
+    with stats._lock:
+        sender = rng.choice(stats.phones) if stats.phones else _phone(i)
+    params = {"MessageSid": f"SMsoak{_n(i)}", "From": sender, "To": "+15550000000",
+              "Body": rng.choice(["STOP", "yes", "call me", "thanks"])}
+    headers = {"Content-Type": "application/x-www-form-urlencoded"}
+    if cfg.twilio_token:
+        payload = cfg.base_url + PATHS["inbound_sms"] + "".join(f"{k}{params[k]}" for k in sorted(params))
+        sig = hmac.new(cfg.twilio_token.encode(), payload.encode(), hashlib.sha1).digest()
+        headers["X-Twilio-Signature"] = base64.b64encode(sig).decode()
+    return urlencode(params).encode(), headers
+
+
+def run_kind(kind: str, rate: float, duration: float, cfg: Config, stats: Stats,
+             pool: ThreadPoolExecutor, stop: threading.Event, seed: int = 0) -> threading.Thread:
+    """
+    Fire `kind` requests at `rate`/s for `duration` seconds (open-loop: pacing doesn't
+    wait for responses, so a slow server shows up as latency, not as lower load).
+    """
+    rng = random.Random(seed)
+    url = cfg.base_url + PATHS[kind]
+    builders: Dict[str, Callable] = {
+        "ingest": lambda i: build_ingest(cfg, i, rng, stats),
+        "shopify_checkout": lambda i: build_shopify_checkout(cfg, i, rng, stats),
+        "shopify_order": lambda i: build_shopify_order(cfg, i, rng, stats),
+        "inbound_sms": lambda i: build_inbound_sms(cfg, i, rng, stats),
+    }
+
+    def one(i: int) -> None:
+        body, headers = builders[kind](i)
+        started = time.perf_counter()
+        status = _post(url, body, headers)
+        stats.record(kind, status, (time.perf_counter() - started) * 1000.0)
+
+    def loop() -> None:
+        if rate <= 0:
+            return
+        interval = 1.0 / rate
+        t0 = time.monotonic()
+        i = 0
+        while not stop.is_set() and time.monotonic() - t0 < duration:
+            pool.submit(one, seed * 100_000_000 + i)
+            i += 1
+            sleep_for = t0 + i * interval - time.monotonic()
+            if sleep_for > 0:
+                stop.wait(sleep_for)
+
+    t = threading.Thread(target=loop, name=f"gen-{kind}", daemon=True)
+    t.start()
+    return t
+
+
+__all__ = ["PATHS", "Config", "Stats", "run_kind"]